@@ -4,5 +4,9 @@ Webtoon Scraper modülleri
 
 from .webtoon_scraper import WebtoonScraper
 from .mangazure_scraper import MangaZureScraper
+from .engine import ProfileScraper
+from .profiles import SiteProfile, get_scraper_for_url
+from .async_scraper import AsyncBaseScraper, AsyncWebtoonScraper
 
-__all__ = ['WebtoonScraper', 'MangaZureScraper'] 
\ No newline at end of file
+__all__ = ['WebtoonScraper', 'MangaZureScraper', 'ProfileScraper', 'SiteProfile', 'get_scraper_for_url',
+           'AsyncBaseScraper', 'AsyncWebtoonScraper'] 
\ No newline at end of file
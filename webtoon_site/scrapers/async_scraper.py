@@ -0,0 +1,432 @@
+"""
+asyncio tabanlı scraper motoru
+
+`BaseScraper` her isteği sırayla ve engelleyerek yapar; bir işçi süreci aynı
+anda yalnızca bir isteği bekleyebilir. Buradaki sınıflar aynı işi asyncio ile
+yapar: tek bir süreç birçok webtoon'un bölüm listelerini, resim listelerini ve
+resim dosyalarını aynı anda yüzlerce istekle çekebilir. Tekrar denemeler
+arasındaki beklemeler `asyncio.sleep` ile yapılır, diğer istekleri durdurmaz.
+
+aiohttp kuruluysa istekler aiohttp ile yapılır. Kurulu değilse aynı arayüz,
+`http_client` oturumunu bir iş parçacığı havuzunda çalıştırarak sağlanır;
+bu durumda eşzamanlılık havuz boyutuyla sınırlıdır.
+
+Kullanım:
+
+    async def main():
+        async with AsyncWebtoonScraper() as scraper:
+            return await scraper.scrape_webtoons(webtoon_urls)
+
+    results = asyncio.run(main())
+"""
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+from . import http_client, parsing
+from .rate_limit import get_rate_limiter, parse_retry_after
+from .webtoon_scraper import WebtoonScraper
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Aynı anda yapılabilecek en fazla istek (tüm sunucular için)
+ASYNC_SCRAPER_CONCURRENCY = http_client.get_setting('ASYNC_SCRAPER_CONCURRENCY', 100)
+# Aynı sunucuya aynı anda yapılabilecek en fazla istek
+ASYNC_SCRAPER_PER_HOST = http_client.get_setting('ASYNC_SCRAPER_PER_HOST', 8)
+
+
+class HTTPStatusError(Exception):
+    """Sunucu başarısız bir durum kodu döndürdü"""
+
+    def __init__(self, url, status):
+        super().__init__(f"HTTP {status}: {url}")
+        self.url = url
+        self.status = status
+
+
+class AsyncResponse:
+    """İçeriği tamamen okunmuş HTTP yanıtı"""
+
+    def __init__(self, url, status, headers, content, encoding=None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HTTPStatusError(self.url, self.status)
+
+
+def _query_params(params):
+    """Liste değerli parametreleri (ör. `includes[]`) anahtar-değer çiftlerine aç"""
+    if not params:
+        return None
+    pairs = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((key, str(v)) for v in values)
+    return pairs
+
+
+class AsyncHTTPClient:
+    """
+    Eşzamanlı istek sayısını sınırlayan asenkron HTTP istemcisi
+
+    Args:
+        concurrency (int): Aynı anda yapılabilecek en fazla istek
+        per_host (int): Aynı sunucuya aynı anda yapılabilecek en fazla istek
+        max_retries (int): Bağlantı hataları ve 429/5xx yanıtları için tekrar
+            deneme sayısı. aiohttp yoksa tekrar denemeleri zaten paylaşılan
+            oturum yaptığından burada ayrıca denenmez.
+        backoff_factor (float): Denemeler arası bekleme çarpanı
+        headers (dict, optional): Her isteğe eklenecek başlıklar
+    """
+
+    def __init__(self, concurrency=ASYNC_SCRAPER_CONCURRENCY, per_host=ASYNC_SCRAPER_PER_HOST,
+                 max_retries=http_client.HTTP_MAX_RETRIES, backoff_factor=http_client.HTTP_BACKOFF_FACTOR,
+                 headers=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.max_retries = max_retries if aiohttp is not None else 0
+        self.backoff_factor = backoff_factor
+        self.headers = {'User-Agent': http_client.DEFAULT_USER_AGENT}
+        self.headers.update(headers or {})
+        self._session = None
+        self._executor = None
+        self._host_semaphores = {}
+
+    @property
+    def is_open(self):
+        return self._session is not None or self._executor is not None
+
+    async def open(self):
+        if self.is_open:
+            return
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=http_client.HTTP_CONNECT_TIMEOUT,
+                sock_read=http_client.HTTP_READ_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='async-scraper')
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    def _merge_headers(self, headers):
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return merged
+
+    async def _run_sync(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _fetch(self, url, headers, params):
+        if self._session is not None:
+            async with self._session.get(url, headers=headers, params=params) as response:
+                content = await response.read()
+                return AsyncResponse(str(response.url), response.status, response.headers, content,
+                                     response.get_encoding() if content else None)
+
+        def fetch():
+            response = http_client.get(url, headers=headers, params=params)
+            return AsyncResponse(response.url, response.status_code, response.headers, response.content,
+                                 response.encoding)
+        return await self._run_sync(fetch)
+
+    async def _stream(self, url, path, headers, chunk_size):
+        """Yanıt gövdesini parça parça dosyaya yaz; (durum kodu, başlıklar) döndür"""
+        if self._session is not None:
+            async with self._session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    return response.status, response.headers
+                with open(path, 'wb') as out_file:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        out_file.write(chunk)
+                return response.status, response.headers
+
+        def stream():
+            with http_client.get(url, headers=headers, stream=True) as response:
+                if response.status_code != 200:
+                    return response.status_code, response.headers
+                with open(path, 'wb') as out_file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            out_file.write(chunk)
+                return response.status_code, response.headers
+        return await self._run_sync(stream)
+
+    async def _with_retries(self, url, call):
+        """
+        İsteği sunucu sınırına uyarak yap, geçici hatalarda bekleyip tekrar dene
+
+        Her deneme önce sunucunun hız sınırından jeton alır. 429 yanıtında
+        sunucu `Retry-After` süresince tüm çalışanlar için durdurulur.
+        Bekleme sırasında sunucu semaforu bırakılır; böylece aynı sunucuya
+        giden diğer istekler beklemez.
+        """
+        if not self.is_open:
+            await self.open()
+        # aiohttp yoksa istekler hız sınırına zaten uyan paylaşılan oturumdan geçer
+        limiter = get_rate_limiter() if self._session is not None else None
+        transport_errors = (asyncio.TimeoutError, requests.exceptions.RequestException)
+        if aiohttp is not None:
+            transport_errors += (aiohttp.ClientError,)
+
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff_factor * (2 ** attempt)
+            if limiter is not None:
+                await limiter.acquire_async(url)
+            try:
+                async with self._semaphore(url):
+                    result = await call()
+            except transport_errors as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(f"İstek hatası, tekrar denenecek ({attempt+1}/{self.max_retries}): {url}: {e}")
+            else:
+                status, headers = result[:2] if isinstance(result, tuple) else (result.status, result.headers)
+                if status not in http_client.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return result
+                retry_after = parse_retry_after(headers)
+                if retry_after is not None:
+                    delay = retry_after
+                logger.warning(f"HTTP {status}, {delay:.1f} sn sonra tekrar denenecek: {url}")
+                if status == 429:
+                    # Bekleme bir sonraki jeton alımında yapılır
+                    limiter.penalize(url, delay)
+                    continue
+            await asyncio.sleep(delay)
+
+    async def get(self, url, headers=None, params=None):
+        """
+        GET isteği yap
+
+        Returns:
+            AsyncResponse: Yanıt (durum kodu kontrol edilmez)
+        """
+        headers = self._merge_headers(headers)
+        params = _query_params(params)
+        return await self._with_retries(url, lambda: self._fetch(url, headers, params))
+
+    async def get_json(self, url, headers=None, params=None):
+        """GET isteği yap ve JSON gövdesini döndür, başarısız durum kodunda HTTPStatusError"""
+        response = await self.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def stream_to_file(self, url, path, headers=None, chunk_size=64 * 1024):
+        """
+        Yanıtı belleğe almadan dosyaya indir
+
+        Dosya önce `.part` uzantısıyla yazılır ve indirme tamamlanınca yerine
+        taşınır; yarım kalan indirmeler hedef dosyayı bozmaz.
+
+        Returns:
+            bool: İndirme başarılı mı
+        """
+        headers = self._merge_headers(headers)
+        part_path = f"{path}.part"
+        try:
+            status, _ = await self._with_retries(url, lambda: self._stream(url, part_path, headers, chunk_size))
+        except Exception as e:
+            logger.error(f"İndirme hatası: {url}: {e}")
+            status = None
+        if status != 200:
+            if status is not None:
+                logger.error(f"İndirme başarısız (HTTP {status}): {url}")
+            if os.path.exists(part_path):
+                os.unlink(part_path)
+            return False
+        os.replace(part_path, path)
+        return True
+
+
+class AsyncBaseScraper:
+    """
+    Asenkron scraper'lar için temel sınıf
+
+    Args:
+        base_url (str): Hedef sitenin ana URL'si
+        download_folder (str): İndirilen içeriklerin kaydedileceği klasör
+        client (AsyncHTTPClient, optional): Paylaşılacak istemci; verilmezse
+            scraper kendi istemcisini oluşturur ve kapatır
+    """
+
+    def __init__(self, base_url, download_folder='scraped_data', client=None):
+        self.base_url = base_url
+        self.download_folder = download_folder
+        os.makedirs(self.download_folder, exist_ok=True)
+        self.client = client or AsyncHTTPClient()
+        self._owns_client = client is None
+
+    async def __aenter__(self):
+        await self.client.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_html(self, url, headers=None):
+        """
+        Belirtilen URL'den HTML içeriğini çek
+
+        Returns:
+            BeautifulSoup: Çekilen HTML içeriği
+        """
+        response = await self.client.get(url, headers=headers)
+        response.raise_for_status()
+        return parsing.make_soup(response.content)
+
+    async def download_image(self, url, filename, headers=None):
+        """
+        Resmi parça parça indirip `download_folder` altına kaydet
+
+        Returns:
+            bool: İndirme başarılı mı
+        """
+        return await self.client.stream_to_file(url, os.path.join(self.download_folder, filename), headers=headers)
+
+    async def download_images(self, urls, filenames, headers=None):
+        """
+        Resimleri eşzamanlı indir
+
+        Returns:
+            list: Giriş sırasıyla her resim için başarı durumu
+        """
+        return await asyncio.gather(*(
+            self.download_image(url, filename, headers=headers) for url, filename in zip(urls, filenames)
+        ))
+
+    async def close(self):
+        """Kaynakları temizle"""
+        if self._owns_client:
+            await self.client.close()
+
+
+class AsyncWebtoonScraper(AsyncBaseScraper):
+    """
+    MangaDex API'si için asenkron scraper
+
+    Yanıtlar `WebtoonScraper` ile aynı biçimde ayrıştırılır; tek fark
+    isteklerin eşzamanlı yapılmasıdır.
+    """
+
+    api_headers = {
+        'Referer': 'https://mangadex.org/',
+        'Accept': 'application/json',
+    }
+
+    def __init__(self, base_url="https://api.mangadex.org", download_folder='scraped_webtoons', client=None):
+        super().__init__(base_url, download_folder, client=client)
+        self.parser = WebtoonScraper(base_url, download_folder)
+
+    async def get_webtoon_chapters(self, webtoon_url):
+        """
+        Belirli bir webtoon'un bölümlerini çek
+
+        Returns:
+            list: Bölüm bilgilerinin listesi
+        """
+        manga_id = webtoon_url.rstrip('/').split('/')[-1]
+        url = f"{self.base_url}/manga/{manga_id}/feed"
+        try:
+            data = await self.client.get_json(url, headers=self.api_headers, params=WebtoonScraper.chapter_feed_params)
+        except Exception as e:
+            logger.error(f"MangaDex API'den bölüm verisi çekerken hata: {webtoon_url}: {e}")
+            return []
+        if not data.get('data'):
+            logger.warning(f"MangaDex API'den bölüm verisi alınamadı: {webtoon_url}")
+            return []
+        return self.parser._parse_chapter_feed(data)
+
+    async def get_chapter_images(self, chapter_url):
+        """
+        Belirli bir bölümdeki resimlerin URL'lerini çek
+
+        Returns:
+            list: Resim URL'lerinin listesi
+        """
+        chapter_id = chapter_url.rstrip('/').split('/')[-1]
+        url = f"{self.base_url}/at-home/server/{chapter_id}"
+        try:
+            data = await self.client.get_json(url, headers=self.api_headers)
+        except Exception as e:
+            logger.error(f"MangaDex API'den resim verisi çekerken hata: {chapter_url}: {e}")
+            return []
+
+        images = self.parser._parse_at_home_response(data)
+        if images is None:
+            errors = data.get('errors', []) if data.get('result') == 'error' else []
+            if any("Chapter not found" in str(err.get("detail", "")) for err in errors):
+                return self.parser._fallback_get_images(chapter_id)
+            logger.warning(f"MangaDex API'den resim verisi alınamadı: {chapter_url}")
+            return []
+        return images
+
+    async def scrape_webtoons(self, webtoon_urls, with_images=True):
+        """
+        Birden fazla webtoon'un bölümlerini ve resim listelerini eşzamanlı çek
+
+        Args:
+            webtoon_urls (list): Webtoon URL'leri
+            with_images (bool): Her bölümün resim URL'lerini de çek ('images' anahtarı)
+
+        Returns:
+            dict: Webtoon URL'si -> bölüm listesi
+        """
+        async def scrape_one(webtoon_url):
+            chapters = await self.get_webtoon_chapters(webtoon_url)
+            if with_images and chapters:
+                image_lists = await asyncio.gather(*(self.get_chapter_images(c['url']) for c in chapters))
+                for chapter, images in zip(chapters, image_lists):
+                    chapter['images'] = images
+            return chapters
+
+        results = await asyncio.gather(*(scrape_one(url) for url in webtoon_urls))
+        return dict(zip(webtoon_urls, results))
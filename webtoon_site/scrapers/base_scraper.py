@@ -1,15 +1,34 @@
-import requests
-from bs4 import BeautifulSoup
+import hashlib
 import os
-import time
 import random
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from . import http_client, parsing, waits
+from .browser_pool import get_browser_pool
+from .rate_limit import get_rate_limiter
+
+
+def conditional_headers(validators):
+    """Önceki yanıtın doğrulayıcılarından koşullu istek başlıklarını oluştur"""
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def chapter_list_hash(chapters):
+    """Bölüm listesinin içerik özeti (sayfadaki diğer değişikliklerden etkilenmez)"""
+    digest = hashlib.sha256()
+    for chapter in chapters:
+        digest.update(f"{chapter.get('url', '')}\t{chapter.get('title', '')}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
 class BaseScraper:
     """
     Webtoon sitelerinden içerik çekmek için temel sınıf.
@@ -33,6 +52,8 @@ class BaseScraper:
         ]
         self._create_directories()
         self.webdriver = None
+        # Tarayıcı havuzundan ödünç alınan tarayıcı (bkz. browser_pool)
+        self._browser = None
     
     def _create_directories(self):
         """Gerekli dizinleri oluştur"""
@@ -43,6 +64,10 @@ class BaseScraper:
         """Rastgele bir user agent seç"""
         return random.choice(self.user_agents)
     
+    def _throttle(self, url):
+        """Sunucunun hız sınırı izin verene kadar bekle (Selenium istekleri için)"""
+        get_rate_limiter().acquire(url)
+    
     def get_html(self, url, use_selenium=False):
         """
         Belirtilen URL'den HTML içeriğini çek
@@ -60,24 +85,40 @@ class BaseScraper:
             return self._get_html_with_requests(url)
     
     def _get_html_with_requests(self, url):
-        """Requests kütüphanesi kullanarak HTML içeriğini çek"""
+        """Paylaşılan HTTP oturumu ile HTML içeriğini çek"""
         headers = {'User-Agent': self._get_random_user_agent()}
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
         response.raise_for_status()  # Hata durumunda exception fırlat
-        return BeautifulSoup(response.content, 'html.parser')
+        return parsing.make_soup(response.content)
+    
+    def _acquire_browser(self):
+        """Havuzdan bir tarayıcı ödünç al; zaten alınmışsa onu döndür"""
+        if self._browser is None:
+            self._browser = get_browser_pool().acquire()
+            self.webdriver = self._browser.driver
+        return self.webdriver
+    
+    def _release_browser(self):
+        """Ödünç alınan tarayıcıyı havuza geri ver"""
+        if self._browser is not None:
+            browser, self._browser = self._browser, None
+            self.webdriver = None
+            get_browser_pool().release(browser)
+    
+    def _open_page(self, url):
+        """Hız sınırına uyarak sayfayı ödünç alınan tarayıcıda aç"""
+        self._throttle(url)
+        self._browser.get(url)
     
     def _get_html_with_selenium(self, url):
         """Selenium kullanarak HTML içeriğini çek"""
-        if self.webdriver is None:
-            service = Service(ChromeDriverManager().install())
-            self.webdriver = webdriver.Chrome(service=service)
-        
-        self.webdriver.get(url)
+        self._acquire_browser()
+        self._open_page(url)
         # Sayfanın yüklenmesini bekle
-        time.sleep(2)
+        waits.wait_for_page(self.webdriver, url=url)
         
         html_content = self.webdriver.page_source
-        return BeautifulSoup(html_content, 'html.parser')
+        return parsing.make_soup(html_content)
     
     def download_image(self, url, filename):
         """
@@ -92,7 +133,7 @@ class BaseScraper:
         """
         try:
             headers = {'User-Agent': self._get_random_user_agent()}
-            response = requests.get(url, headers=headers, stream=True)
+            response = http_client.get(url, headers=headers, stream=True)
             response.raise_for_status()
             
             file_path = os.path.join(self.download_folder, filename)
@@ -105,8 +146,50 @@ class BaseScraper:
             print(f"Resim indirme hatası: {e}")
             return False
     
+    def get_webtoon_chapters_if_changed(self, webtoon_url, validators=None):
+        """
+        Bölüm listesini yalnızca önceki senkronizasyondan beri değiştiyse döndür
+        
+        Varsayılan uygulama listeyi her seferinde çeker ve yalnızca içerik
+        özetini karşılaştırır; koşullu istek destekleyen scraper'lar bu metodu
+        yeniden tanımlar.
+        
+        Args:
+            webtoon_url (str): Webtoon detay sayfasının URL'si
+            validators (dict, optional): Önceki çağrının döndürdüğü doğrulayıcılar
+            
+        Returns:
+            tuple: (bölüm listesi, değişmediyse None; yeni doğrulayıcılar)
+        """
+        return self._chapter_list_result(self.get_webtoon_chapters(webtoon_url), validators)
+    
+    def _chapter_list_result(self, chapters, validators, response=None):
+        """
+        Çekilen bölüm listesini önceki doğrulayıcılarla karşılaştır
+        
+        Args:
+            chapters (list): Çekilen bölüm listesi
+            validators (dict): Önceki doğrulayıcılar (etag, last_modified, content_hash)
+            response (requests.Response, optional): Listenin geldiği HTTP yanıtı
+            
+        Returns:
+            tuple: (bölüm listesi, değişmediyse None; yeni doğrulayıcılar)
+        """
+        validators = dict(validators or {})
+        if not chapters:
+            # Hata veya boş liste; önceki doğrulayıcılar korunur
+            return chapters, validators
+        
+        content_hash = chapter_list_hash(chapters)
+        new_validators = {
+            'etag': response.headers.get('ETag', '') if response is not None else '',
+            'last_modified': response.headers.get('Last-Modified', '') if response is not None else '',
+            'content_hash': content_hash,
+        }
+        if validators.get('content_hash') == content_hash:
+            return None, new_validators
+        return chapters, new_validators
+    
     def close(self):
         """Kaynakları temizle"""
-        if self.webdriver:
-            self.webdriver.quit()
-            self.webdriver = None 
\ No newline at end of file
+        self._release_browser() 
\ No newline at end of file
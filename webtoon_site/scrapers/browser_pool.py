@@ -0,0 +1,284 @@
+"""
+Selenium scraper'ları için paylaşılan başsız (headless) tarayıcı havuzu
+
+Her scraper çağrısında yeni bir Chrome açıp kapatmak yerine süreç içinde uzun
+ömürlü tarayıcılar tutulur. Scraper bir tarayıcıyı `acquire` ile ödünç alır,
+işi bitince `release` ile havuza geri verir; sonraki çağrı aynı tarayıcıyı
+(açık oturum, sıcak önbellek) yeniden kullanır. ChromeDriver yolu süreç
+başına yalnızca bir kez çözülür.
+
+- Aynı anda açık olabilecek tarayıcı sayısı `SCRAPER_BROWSER_POOL_SIZE` ile
+  sınırlıdır; hepsi kullanımdaysa yeni istek boşalana kadar bekler.
+- Ödünç verilmeden ve geri alınırken tarayıcının yanıt verip vermediği
+  denetlenir; çökmüş tarayıcılar kapatılıp yerine yenisi açılır.
+- `SCRAPER_BROWSER_MAX_PAGES` sayfa yükleyen tarayıcı bellek sızıntılarını
+  önlemek için kapatılıp yenilenir; `SCRAPER_BROWSER_IDLE_TIMEOUT` süre
+  kullanılmayan tarayıcılar, havuz bir daha kullanılmasa da arka plandaki
+  bir zamanlayıcıyla kapatılır.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+
+from .http_client import DEFAULT_USER_AGENT, get_setting
+
+logger = logging.getLogger(__name__)
+
+# Süreç başına aynı anda açık olabilecek en fazla tarayıcı
+SCRAPER_BROWSER_POOL_SIZE = get_setting('SCRAPER_BROWSER_POOL_SIZE', 2)
+# Bu kadar sayfa yükleyen tarayıcı kapatılıp yenisi açılır
+SCRAPER_BROWSER_MAX_PAGES = get_setting('SCRAPER_BROWSER_MAX_PAGES', 50)
+# Bu süre (saniye) kullanılmayan boştaki tarayıcılar kapatılır
+SCRAPER_BROWSER_IDLE_TIMEOUT = get_setting('SCRAPER_BROWSER_IDLE_TIMEOUT', 5 * 60)
+# Boş tarayıcı için en fazla bekleme süresi (saniye)
+SCRAPER_BROWSER_ACQUIRE_TIMEOUT = get_setting('SCRAPER_BROWSER_ACQUIRE_TIMEOUT', 120)
+SCRAPER_BROWSER_PAGE_LOAD_TIMEOUT = get_setting('SCRAPER_BROWSER_PAGE_LOAD_TIMEOUT', 60)
+
+
+class BrowserPoolTimeout(Exception):
+    """Beklenen süre içinde boş tarayıcı bulunamadı"""
+
+
+def chrome_options():
+    """Havuzdaki tarayıcıların başlatma seçenekleri"""
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless")  # Headless mod
+    options.add_argument("--disable-gpu")  # GPU hızlandırmayı devre dışı bırak
+    options.add_argument("--window-size=1920,1080")  # Pencere boyutu
+    options.add_argument("--disable-extensions")  # Eklentileri devre dışı bırak
+    options.add_argument("--no-sandbox")  # Güvenli olmayan mod (bazı sistemlerde gerekli)
+    options.add_argument("--disable-dev-shm-usage")  # /dev/shm kullanımını devre dışı bırak
+    options.add_argument(f"user-agent={DEFAULT_USER_AGENT}")
+    return options
+
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromedriver_path():
+    """
+    ChromeDriver yolunu döndür; indirme ve sürüm kontrolü süreç başına bir kez yapılır
+
+    Returns:
+        str: Sürücü yolu, webdriver_manager kullanılamıyorsa None (Selenium
+        Manager sürücüyü kendisi bulur)
+    """
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    _driver_path = ChromeDriverManager().install()
+                except Exception as e:
+                    logger.warning(f"ChromeDriverManager kullanılamadı, Selenium Manager denenecek: {e}")
+                    _driver_path = ''
+    return _driver_path or None
+
+
+def create_chrome():
+    """Yeni bir başsız Chrome başlat"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    path = chromedriver_path()
+    service = Service(path) if path else Service()
+    driver = webdriver.Chrome(service=service, options=chrome_options())
+    driver.set_page_load_timeout(SCRAPER_BROWSER_PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+class PooledBrowser:
+    """Havuzdaki bir tarayıcı ve kullanım bilgileri"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+    def get(self, url):
+        """Sayfayı yükle ve sayfa sayacını artır"""
+        self.pages += 1
+        self.driver.get(url)
+
+    def is_alive(self):
+        """Tarayıcı komutlara yanıt veriyor mu"""
+        try:
+            self.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"Tarayıcı kapatılırken hata: {e}")
+
+
+class BrowserPool:
+    """
+    Sınırlı sayıda uzun ömürlü tarayıcıyı iş parçacıkları arasında paylaştır
+
+    Args:
+        size (int): Aynı anda açık olabilecek en fazla tarayıcı
+        max_pages (int): Tarayıcının yenilenmeden önce yükleyebileceği sayfa sayısı
+        idle_timeout (float): Boştaki tarayıcının kapatılacağı süre (saniye)
+        factory (callable): Yeni sürücü oluşturan fonksiyon (varsayılan: create_chrome)
+    """
+
+    def __init__(self, size=SCRAPER_BROWSER_POOL_SIZE, max_pages=SCRAPER_BROWSER_MAX_PAGES,
+                 idle_timeout=SCRAPER_BROWSER_IDLE_TIMEOUT, factory=None):
+        self.size = max(1, int(size))
+        self.max_pages = max_pages
+        self.idle_timeout = idle_timeout
+        self.factory = factory or create_chrome
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        # Son kullanılan sonda; en sıcak tarayıcı önce verilir
+        self._idle = []
+        self._closed = False
+        # Boştaki tarayıcıları süre dolunca kapatan zamanlayıcı
+        self._reaper = None
+
+    def acquire(self, timeout=SCRAPER_BROWSER_ACQUIRE_TIMEOUT):
+        """
+        Havuzdan bir tarayıcı ödünç al
+
+        Returns:
+            PooledBrowser: Kullanım bitince `release` ile geri verilmeli
+
+        Raises:
+            BrowserPoolTimeout: Süre içinde boş yer açılmadıysa
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise BrowserPoolTimeout(f"{timeout} saniye içinde boş tarayıcı bulunamadı")
+        try:
+            self._close_expired()
+            while True:
+                with self._lock:
+                    browser = self._idle.pop() if self._idle else None
+                if browser is None:
+                    break
+                if browser.is_alive():
+                    return browser
+                logger.info("Yanıt vermeyen tarayıcı havuzdan çıkarıldı")
+                browser.quit()
+
+            browser = PooledBrowser(self.factory())
+            logger.info("Havuz için yeni tarayıcı başlatıldı")
+            return browser
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, browser, discard=False):
+        """
+        Tarayıcıyı havuza geri ver
+
+        Args:
+            browser (PooledBrowser): `acquire` ile alınan tarayıcı
+            discard (bool): True ise tarayıcı yeniden kullanılmadan kapatılır
+        """
+        try:
+            browser.last_used = time.monotonic()
+            if discard or self._closed:
+                browser.quit()
+            elif self.max_pages and browser.pages >= self.max_pages:
+                logger.info(f"Tarayıcı {browser.pages} sayfa sonra yenileniyor")
+                browser.quit()
+            elif not self._reset(browser):
+                browser.quit()
+            else:
+                with self._lock:
+                    self._idle.append(browser)
+                self._schedule_reaper()
+        finally:
+            self._slots.release()
+
+    def _reset(self, browser):
+        """Sayfayı boşaltarak çalışan betikleri durdur; tarayıcı çökmüşse False"""
+        try:
+            browser.driver.get('about:blank')
+            return True
+        except Exception:
+            logger.info("Geri verilen tarayıcı yanıt vermiyor, kapatılıyor")
+            return False
+
+    def _close_expired(self):
+        if not self.idle_timeout:
+            return
+        now = time.monotonic()
+        with self._lock:
+            expired = [b for b in self._idle if now - b.last_used > self.idle_timeout]
+            self._idle = [b for b in self._idle if b not in expired]
+        for browser in expired:
+            browser.quit()
+
+    def _schedule_reaper(self):
+        """Boştaki tarayıcılar varsa süreleri dolduğunda kapatılmak üzere zamanlayıcı kur"""
+        if not self.idle_timeout or self._closed:
+            return
+        with self._lock:
+            if self._reaper is not None or not self._idle:
+                return
+            oldest = min(b.last_used for b in self._idle)
+            delay = max(0.0, oldest + self.idle_timeout - time.monotonic())
+            # Süre sınırında kalan tarayıcı da kapatılsın diye küçük bir pay eklenir
+            self._reaper = threading.Timer(delay + 0.5, self._reap)
+            self._reaper.name = 'browser-pool-reaper'
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self):
+        with self._lock:
+            self._reaper = None
+        try:
+            self._close_expired()
+        except Exception as e:
+            logger.debug(f"Boştaki tarayıcılar kapatılırken hata: {e}")
+        self._schedule_reaper()
+
+    def close(self):
+        """Boştaki tüm tarayıcıları kapat; ödünçtekiler geri verilince kapatılır"""
+        self._closed = True
+        with self._lock:
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            browser.quit()
+
+
+_browser_pool = None
+_browser_pool_pid = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """Süreç genelinde paylaşılan tarayıcı havuzunu döndür"""
+    global _browser_pool, _browser_pool_pid
+    pid = os.getpid()
+    if _browser_pool is None or _browser_pool_pid != pid:
+        with _browser_pool_lock:
+            if _browser_pool is None or _browser_pool_pid != pid:
+                # Fork edilmiş süreç ebeveynin tarayıcılarını kullanamaz
+                _browser_pool = BrowserPool()
+                _browser_pool_pid = pid
+    return _browser_pool
+
+
+def close_browser_pool():
+    """Bu sürecin açtığı tarayıcıları kapat"""
+    if _browser_pool is not None and _browser_pool_pid == os.getpid():
+        _browser_pool.close()
+
+
+atexit.register(close_browser_pool)
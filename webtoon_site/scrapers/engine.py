@@ -0,0 +1,398 @@
+"""
+Site profillerine göre çalışan genel scraper motoru
+
+`ProfileScraper` bir `SiteProfile`'ın seçicileriyle liste, detay, bölüm
+listesi ve bölüm resimlerini okur. Sayfalar önce HTTP ile çekilir ve tek
+geçişte ayrıştırılır (bkz. `parsing`); Selenium yalnızca profil o sayfa türü
+için JavaScript gerektiğini söylüyorsa ya da HTTP ile sonuç alınamazsa
+kullanılır. Bu durumda tarayıcı havuzdan alınır, profilin seçicileri
+beklenir ve işlenmiş sayfa aynı seçicilerle ayrıştırılır.
+"""
+import json
+import logging
+import re
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+from . import http_client, page_cache, parsing, waits
+from .base_scraper import BaseScraper, conditional_headers
+from .profiles import get_profile_by_name
+
+logger = logging.getLogger(__name__)
+
+# Detay sayfasında açıklama bulunamazsa metin içinde aranır
+BODY_TEXT = parsing.SelectorSet({'text': parsing.Field('body', separator='\n')})
+
+
+class ProfileScraper(BaseScraper):
+    """
+    Bildirimsel site profiliyle çalışan scraper
+
+    Args:
+        profile (SiteProfile | str): Profil veya kayıtlı profil adı
+        base_url (str, optional): Sitenin ana adresi (varsayılan: profildeki)
+        download_folder (str): İndirilen içeriklerin kaydedileceği klasör
+    """
+
+    # Alt sınıflar sabit bir profil adı tanımlayabilir
+    profile_name = None
+
+    def __init__(self, profile=None, base_url=None, download_folder='scraped_webtoons'):
+        profile = profile or self.profile_name
+        if isinstance(profile, str):
+            profile = get_profile_by_name(profile)
+        if profile is None:
+            raise ValueError("Scraper için site profili bulunamadı")
+        self.profile = profile
+        super().__init__(base_url or profile.base_url, download_folder)
+        self.headers = dict({
+            'User-Agent': http_client.DEFAULT_USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8'
+        }, **profile.headers)
+        self.webtoons = []
+        self.logger = logging.getLogger(__name__)
+
+    # HTTP
+
+    def _fetch(self, url, cached=True, headers=None):
+        headers = dict(self.headers, **(headers or {}))
+        if cached:
+            return page_cache.fetch(url, headers=headers)
+        return http_client.get(url, headers=headers)
+
+    # Selenium
+
+    def _wait_profile(self, url):
+        """Bekleme profili; hazır seçicileri site profilinden tamamlanır"""
+        profile = waits.wait_profile(url)
+        selectors = {
+            'details': self.profile.selector('details', 'title'),
+            'chapters': self.profile.selector('chapters', 'item'),
+            'images': self.profile.selector('images', 'image'),
+        }
+        profile['selectors'] = dict({k: v for k, v in selectors.items() if v}, **profile['selectors'])
+        return profile
+
+    def _render(self, url, kind):
+        """
+        Sayfayı havuzdan alınan tarayıcıda aç ve JavaScript sonrası HTML'ini döndür
+
+        Returns:
+            tuple: (HTML, tarayıcının son adresi)
+        """
+        self._acquire_browser()
+        try:
+            self._open_page(url)
+            wait_profile = self._wait_profile(url)
+            waits.wait_for_page(self.webdriver, kind, profile=wait_profile)
+            if kind == 'chapters' and self.profile.expand_selector:
+                self._expand_chapters(wait_profile)
+            return self.webdriver.page_source, self.webdriver.current_url
+        finally:
+            self._release_browser()
+
+    def _expand_chapters(self, wait_profile):
+        """"Tüm bölümleri göster" düğmesine tıkla ve yeni bölümleri bekle"""
+        buttons = self.webdriver.find_elements(By.CSS_SELECTOR, self.profile.expand_selector)
+        if not buttons:
+            return
+        selector = wait_profile['selectors'].get('chapters')
+        shown = len(self.webdriver.find_elements(By.CSS_SELECTOR, selector)) if selector else 0
+        try:
+            buttons[0].click()
+        except Exception as e:
+            self.logger.info(f"Tüm bölümleri göster düğmesine tıklanamadı: {e}")
+            return
+        if selector:
+            waits.wait_for_more(self.webdriver, selector, shown, wait_profile['timeout'])
+        waits.wait_for_network_idle(self.webdriver, wait_profile['idle_ms'],
+                                    waits.network_idle_timeout(wait_profile, wait_profile['timeout']))
+
+    def _use_selenium(self, kind):
+        return self.profile.needs_js(kind)
+
+    # Liste
+
+    def get_webtoon_list(self, category_url=None, max_pages=None):
+        """
+        Sitedeki webtoon listesini çek; profilin sayfalama kuralına göre sonraki sayfalar izlenir
+
+        Args:
+            category_url (str, optional): Belirli bir kategorideki webtoonları çekmek için URL
+            max_pages (int, optional): En fazla okunacak liste sayfası (varsayılan: profildeki)
+
+        Returns:
+            list: Webtoon bilgilerinin listesi
+        """
+        url = category_url or urljoin(self.base_url + '/', self.profile.list_path.lstrip('/'))
+        max_pages = max_pages or self.profile.pagination.get('max_pages') or 1
+        selector_set = self.profile.selector_set('list')
+        webtoons = []
+        seen = set()
+
+        for _ in range(max_pages):
+            self.logger.info(f"Webtoon listesi çekiliyor: {url}")
+            try:
+                if self._use_selenium('list'):
+                    html, page_url = self._render(url, 'list')
+                else:
+                    response = self._fetch(url, cached=False)
+                    response.raise_for_status()
+                    html, page_url = response.text, response.url or url
+            except Exception as e:
+                self.logger.error(f"Webtoon listesi çekilirken hata: {e}")
+                break
+
+            page = selector_set.extract(html, page_url)
+            for item in page['items']:
+                manga_url = item['url']
+                if not item['title'] or not manga_url or manga_url in seen:
+                    continue
+                seen.add(manga_url)
+                webtoons.append({
+                    'id': manga_url.rstrip('/').rsplit('/', 1)[-1],
+                    'title': item['title'],
+                    'url': manga_url,
+                    'cover_url': item['cover_url'],
+                    'description': "Açıklama webtoon detay sayfasından yüklenecek.",
+                    'source_site': self.base_url
+                })
+
+            url = page.get('next')
+            if not url:
+                break
+
+        self.logger.info(f"Toplam {len(webtoons)} webtoon bulundu")
+        self.webtoons = webtoons
+        return webtoons
+
+    # Detaylar
+
+    def get_webtoon_details(self, url):
+        """
+        Detay sayfasından bilgileri çek
+
+        Sayfa HTTP ile sayfa önbelleği üzerinden çekilir; aynı içe aktarmadaki
+        bölüm listesi isteği de aynı kaydı kullanır.
+        """
+        if not self._use_selenium('details'):
+            try:
+                response = self._fetch(url)
+                response.raise_for_status()
+                details = self._parse_webtoon_details(response.text, response.url or url)
+                if details or not self.profile.js_fallback:
+                    return details
+                self.logger.info("HTTP isteği ile başlık bulunamadı, Selenium deneniyor...")
+            except Exception as e:
+                if not self.profile.js_fallback:
+                    self.logger.error(f"Detay sayfası çekilemedi: {e}")
+                    return None
+                self.logger.warning(f"Detay sayfası HTTP ile çekilemedi, Selenium deneniyor: {e}")
+        return self._get_details_with_selenium(url)
+
+    def _get_details_with_selenium(self, url):
+        """Selenium kullanarak detay sayfasını aç ve bilgileri çek"""
+        try:
+            html, page_url = self._render(url, 'details')
+            return self._parse_webtoon_details(html, page_url)
+        except Exception as e:
+            self.logger.error(f"Manga detayları çekilirken hata oluştu: {e}")
+            return None
+
+    def _parse_webtoon_details(self, html, page_url):
+        """
+        Detay sayfasının HTML'inden manga bilgilerini çıkar
+
+        Returns:
+            dict: Manga bilgileri, başlık bulunamazsa None
+        """
+        document = parsing.parse(html)
+        page = self.profile.selector_set('details').extract_from(document, page_url)
+        title = page['title']
+        if not title:
+            return None
+
+        description = page['description'] or ""
+        if not description:
+            # İçinde "Açıklama" veya "Description" geçen paragrafları ara
+            page_text = BODY_TEXT.extract_from(document)['text'] or ""
+            desc_section = re.search(r'(Açıklama|Description|Synopsis)[\s:]*([^\n]+(\n[^\n]+){0,5})', page_text)
+            if desc_section:
+                description = desc_section.group(2).strip()
+        if not description:
+            description = f"{title} hakkında detaylı açıklama bulunamadı."
+            self.logger.warning("Açıklama bulunamadı, varsayılan açıklama kullanılıyor")
+
+        return {
+            'title': title,
+            'cover_url': page['cover_url'] or "",
+            'description': description,
+            'url': page_url,
+            'id': page_url.rstrip('/').rsplit('/', 1)[-1],
+            'categories': page['categories']
+        }
+
+    def get_webtoon_info(self, url):
+        """Detayları ve bölüm URL'lerini birlikte çek"""
+        details = self.get_webtoon_details(url)
+        if not details:
+            return None
+        return dict(details, chapter_urls=self.get_chapter_urls(url))
+
+    # Bölümler
+
+    def get_chapter_urls(self, webtoon_url):
+        """Bölüm URL'lerini çek"""
+        chapters = self.get_webtoon_chapters(webtoon_url)
+        return [chapter['url'] for chapter in chapters] if chapters else []
+
+    def get_webtoon_chapters(self, webtoon_url):
+        """
+        Belirli bir webtoon'un bölümlerini çek
+
+        Returns:
+            list: Bölüm bilgilerinin listesi (eskiden yeniye)
+        """
+        return self.get_webtoon_chapters_if_changed(webtoon_url)[0]
+
+    def get_webtoon_chapters_if_changed(self, webtoon_url, validators=None):
+        """
+        Bölüm listesini koşullu istekle çek, değişmediyse None döndür
+
+        Args:
+            webtoon_url (str): Webtoon detay sayfasının URL'si
+            validators (dict, optional): Önceki çağrının döndürdüğü doğrulayıcılar
+
+        Returns:
+            tuple: (bölüm listesi, değişmediyse None; yeni doğrulayıcılar)
+        """
+        self.logger.info(f"Bölümler çekiliyor: {webtoon_url}")
+        if self._use_selenium('chapters'):
+            return self._chapter_list_result(self._get_chapters_with_selenium(webtoon_url), validators)
+
+        try:
+            # Detay sayfası bu içe aktarmada zaten çekildiyse önbellekten gelir
+            response = self._fetch(webtoon_url, headers=conditional_headers(validators))
+            if response.status_code == 304:
+                self.logger.info(f"Bölüm listesi değişmemiş (304): {webtoon_url}")
+                return None, dict(validators or {})
+            response.raise_for_status()
+            chapters = self._parse_chapters(response.text, response.url or webtoon_url)
+            if not chapters and self.profile.chapter_list_ajax:
+                chapters = self._get_chapters_with_ajax(response.url or webtoon_url)
+            if chapters:
+                self.logger.info(f"HTTP ile toplam {len(chapters)} bölüm bulundu")
+                return self._chapter_list_result(chapters, validators, response)
+            self.logger.info("HTTP isteği ile bölüm bulunamadı")
+        except Exception as e:
+            self.logger.error(f"Bölümler çekilirken hata: {e}")
+
+        if not self.profile.js_fallback:
+            return self._chapter_list_result([], validators)
+        self.logger.info("Selenium ile bölüm çekme deneniyor...")
+        return self._chapter_list_result(self._get_chapters_with_selenium(webtoon_url), validators)
+
+    def _get_chapters_with_ajax(self, webtoon_url):
+        """Bölüm listesini sayfaya yükleyen uç noktadan çek (tarayıcı açmadan)"""
+        url = urljoin(webtoon_url.rstrip('/') + '/', self.profile.chapter_list_ajax)
+        try:
+            response = http_client.post(url, headers=dict(self.headers, **{'X-Requested-With': 'XMLHttpRequest'}))
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.info(f"Bölüm listesi uç noktası kullanılamadı: {e}")
+            return []
+        return self._parse_chapters(response.text, webtoon_url)
+
+    def _get_chapters_with_selenium(self, webtoon_url):
+        """Selenium kullanarak bölümleri çek"""
+        try:
+            html, page_url = self._render(webtoon_url, 'chapters')
+            return self._parse_rendered_chapters(html, page_url)
+        except Exception as e:
+            self.logger.error(f"Selenium ile bölüm çekme hatası: {e}")
+            return []
+
+    def _parse_rendered_chapters(self, html, page_url):
+        """Selenium ile açılan sayfadan bölümleri çıkar; alt sınıflar son çare yöntemleri ekleyebilir"""
+        return self._parse_chapters(html, page_url)
+
+    def _parse_chapters(self, html, page_url):
+        """Bölüm listesini HTML'den çıkar; eskiden yeniye sıralı döndür"""
+        items = self.profile.selector_set('chapters').extract(html, page_url)['chapters']
+        if self.profile.newest_first:
+            # En yeni bölümler en üstte listeleniyor, sıralama için ters çevirelim
+            items.reverse()
+
+        chapters = []
+        seen = set()
+        for i, item in enumerate(items):
+            chapter_url = item['url']
+            if not chapter_url or chapter_url in seen:
+                continue
+            seen.add(chapter_url)
+            match = re.search(self.profile.chapter_number_pattern, item['title'] or '')
+            chapter_num = match.group(1) if match else str(i + 1)
+            chapters.append({
+                'title': f"Bölüm {chapter_num}",
+                'url': chapter_url,
+                'date': item['date'] or "Bilinmeyen tarih",
+                'number': int(chapter_num)
+            })
+        return chapters
+
+    # Resimler
+
+    def get_chapter_images(self, chapter_url):
+        """
+        Belirli bir bölümdeki resimleri çek
+
+        Returns:
+            list: Resim URL'lerinin listesi
+        """
+        self.logger.info(f"Bölüm resimleri çekiliyor: {chapter_url}")
+        if self._use_selenium('images'):
+            return self._get_images_with_selenium(chapter_url)
+
+        try:
+            # Bölüm sayfaları bir kez okunur, önbelleğe alınmaz
+            response = self._fetch(chapter_url, cached=False)
+            response.raise_for_status()
+            images = self._parse_images(response.text, response.url or chapter_url)
+            if images or not self.profile.js_fallback:
+                self.logger.info(f"HTTP isteği ile toplam {len(images)} resim bulundu")
+                return images
+            self.logger.info("HTTP isteği ile resim bulunamadı, Selenium deneniyor...")
+        except Exception as e:
+            if not self.profile.js_fallback:
+                self.logger.error(f"Bölüm resimleri çekilirken hata: {e}")
+                return []
+            self.logger.warning(f"Bölüm resimleri HTTP ile çekilemedi, Selenium deneniyor: {e}")
+        return self._get_images_with_selenium(chapter_url)
+
+    def _get_images_with_selenium(self, chapter_url):
+        """Selenium kullanarak bölüm resimlerini çek"""
+        try:
+            html, page_url = self._render(chapter_url, 'images')
+            return self._parse_rendered_images(html, page_url)
+        except Exception as e:
+            self.logger.error(f"Selenium ile resim çekme hatası: {e}")
+            return []
+
+    def _parse_rendered_images(self, html, page_url):
+        """Selenium ile açılan sayfadan resimleri çıkar; alt sınıflar son çare yöntemleri ekleyebilir"""
+        return self._parse_images(html, page_url)
+
+    def _parse_images(self, html, page_url):
+        """Resim adreslerini HTML'den çıkar; gerekirse sayfa betiğindeki listeye bak"""
+        images = self.profile.selector_set('images').extract(html, page_url)['images']
+        if not images and self.profile.images_script_pattern:
+            # Bazı siteler resim listesini betik içinde verir; betikler ayrıştırılmadan aranır
+            match = re.search(self.profile.images_script_pattern, html, re.DOTALL)
+            if match:
+                try:
+                    images = [urljoin(page_url, url) for url in json.loads(match.group(1)) if url]
+                except ValueError:
+                    pass
+        # Tekrarlanan URL'leri kaldır
+        return list(dict.fromkeys(images))
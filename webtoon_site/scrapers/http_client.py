@@ -0,0 +1,146 @@
+"""
+Scraper'lar ve içe aktarma servisleri için paylaşılan HTTP istemcisi
+
+Tüm istekler süreç genelinde tek bir `requests.Session` üzerinden yapılır.
+Oturum, sunucu başına bağlantı havuzu tutan bir `HTTPAdapter` kullanır; böylece
+aynı siteye yapılan ardışık sayfa ve resim istekleri her seferinde yeni bir
+TCP/TLS bağlantısı açmak yerine açık (keep-alive) bağlantıları yeniden kullanır.
+
+Her istek önce sunucunun hız sınırından jeton alır (bkz. `rate_limit`).
+Bağlantı hataları ve 5xx yanıtları artan beklemeyle otomatik olarak tekrar
+denenir. 429 yanıtında sunucu `Retry-After` süresince tüm çalışanlar için
+durdurulur ve istek sonra tekrarlanır. Zaman aşımı belirtilmeyen isteklere
+varsayılan zaman aşımı uygulanır.
+
+Ayarlar Django ayarlarından okunur; Django yapılandırılmamışsa varsayılanlar
+kullanılır, böylece scraper'lar bağımsız olarak da çalıştırılabilir.
+"""
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Bağlantı havuzu katmanında tekrar denenen durum kodları; 429 hız sınırlayıcıda ele alınır
+SERVER_ERROR_CODES = (500, 502, 503, 504)
+
+
+def get_setting(name, default):
+    """Django ayarını oku, Django yapılandırılmamışsa varsayılanı döndür"""
+    try:
+        from django.conf import settings
+        if settings.configured:
+            return getattr(settings, name, default)
+    except ImportError:
+        pass
+    return default
+
+
+HTTP_CONNECT_TIMEOUT = get_setting('HTTP_CONNECT_TIMEOUT', 10)
+HTTP_READ_TIMEOUT = get_setting('HTTP_READ_TIMEOUT', 30)
+# Önbellekte tutulacak farklı sunucu havuzu sayısı
+HTTP_POOL_CONNECTIONS = get_setting('HTTP_POOL_CONNECTIONS', 10)
+# Sunucu başına açık tutulacak en fazla bağlantı
+HTTP_POOL_MAXSIZE = get_setting('HTTP_POOL_MAXSIZE', 16)
+HTTP_MAX_RETRIES = get_setting('HTTP_MAX_RETRIES', 3)
+HTTP_BACKOFF_FACTOR = get_setting('HTTP_BACKOFF_FACTOR', 1.0)
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+class PooledSession(requests.Session):
+    """
+    Hız sınırına uyan ve zaman aşımı verilmeyen isteklere varsayılan zaman
+    aşımı uygulayan oturum
+    """
+
+    def request(self, method, url, **kwargs):
+        # Döngüsel içe aktarmayı önlemek için burada içe aktarılır
+        from .rate_limit import get_rate_limiter, parse_retry_after
+
+        kwargs.setdefault('timeout', (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        limiter = get_rate_limiter()
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            limiter.acquire(url)
+            response = super().request(method, url, **kwargs)
+            if response.status_code != 429 or attempt >= HTTP_MAX_RETRIES:
+                return response
+            delay = parse_retry_after(response.headers)
+            if delay is None:
+                delay = HTTP_BACKOFF_FACTOR * (2 ** attempt)
+            logger.warning(f"HTTP 429, {delay:.1f} sn sonra tekrar denenecek: {url}")
+            limiter.penalize(url, delay)
+            response.close()
+
+
+def build_session():
+    """Bağlantı havuzu ve tekrar deneme politikası yapılandırılmış yeni bir oturum oluştur"""
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=HTTP_MAX_RETRIES,
+        status=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=SERVER_ERROR_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=True,
+        # Denemeler bitince son yanıt döndürülür, durum kodunu çağıran taraf kontrol eder
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+        # Havuz doluysa yeni bağlantı açmak yerine boşalmasını bekle
+        pool_block=True,
+    )
+    session = PooledSession()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = DEFAULT_USER_AGENT
+    return session
+
+
+def get_session():
+    """
+    Süreç genelinde paylaşılan oturumu döndür
+
+    Celery gibi fork eden çalışanlarda üst süreçten devralınan soketler
+    paylaşılmasın diye oturum her süreçte yeniden oluşturulur.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = build_session()
+                _session_pid = pid
+    return _session
+
+
+def get(url, **kwargs):
+    """Paylaşılan oturumla GET isteği yap (`requests.get` ile aynı parametreler)"""
+    return get_session().get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    """Paylaşılan oturumla POST isteği yap (`requests.post` ile aynı parametreler)"""
+    return get_session().post(url, **kwargs)
+
+
+def close_session():
+    """Paylaşılan oturumu ve açık bağlantıları kapat"""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
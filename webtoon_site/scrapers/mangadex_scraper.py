@@ -8,7 +8,7 @@ def get_webtoon_info(self, url):
         try:
             # MangaDex API'si üzerinden manga bilgilerini çek
             api_url = f"https://api.mangadex.org/manga/{manga_id}?includes[]=cover_art&includes[]=author&includes[]=artist&includes[]=tag"
-            response = requests.get(api_url, headers=self.headers)
+            response = http_client.get(api_url, headers=self.headers)
             response.raise_for_status()
             data = response.json()
             
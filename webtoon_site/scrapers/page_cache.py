@@ -0,0 +1,231 @@
+"""
+Scraper'lar için diskte tutulan HTML sayfa önbelleği
+
+Bir içe aktarma veya senkronizasyon sırasında aynı webtoon sayfası birkaç kez
+istenir (detaylar, bölüm listesi, kapak yenileme). `fetch` sayfayı URL'ye
+göre diskte saklar:
+
+- `SCRAPER_PAGE_CACHE_TTL` süresi dolmamış kayıt sunucuya gitmeden döndürülür.
+- Süresi dolmuş kayıt, sunucu ETag/Last-Modified verdiyse koşullu istekle
+  doğrulanır; 304 yanıtında saklanan içerik yeniden kullanılır.
+- Önbellek `SCRAPER_PAGE_CACHE_MAX_BYTES` boyutunu aşarsa en uzun süredir
+  kullanılmayan kayıtlar silinir.
+
+Yalnızca 200 yanıtları saklanır. Dönen nesne her durumda `requests.Response`
+olduğundan çağıran kod önbellekten gelip gelmediğini bilmek zorunda değildir
+(`from_cache` özelliği bunu belirtir).
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import http_client
+from .http_client import get_setting
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_PAGE_CACHE_DIR = get_setting(
+    'SCRAPER_PAGE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'webtoon_site', 'pages')
+)
+# Kaydın sunucuya sorulmadan kullanılacağı süre (saniye); 0 ise önbellek kapalı
+SCRAPER_PAGE_CACHE_TTL = get_setting('SCRAPER_PAGE_CACHE_TTL', 10 * 60)
+SCRAPER_PAGE_CACHE_MAX_BYTES = get_setting('SCRAPER_PAGE_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+
+# Yanıtla birlikte saklanan başlıklar
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def _cached_response(url, entry, body):
+    """Saklanan kayıttan bir `requests.Response` oluştur"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = entry.get('url', url)
+    response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+    response.encoding = entry.get('encoding')
+    response._content = body
+    response.from_cache = True
+    return response
+
+
+class PageCache:
+    """
+    URL başına tek dosyada tutulan sayfa önbelleği
+
+    Dosya, bir satırlık JSON üst verisi ve ardından ham yanıt gövdesinden
+    oluşur. Kullanım zamanı dosyanın değiştirilme zamanında tutulur.
+    """
+
+    def __init__(self, directory=SCRAPER_PAGE_CACHE_DIR, max_bytes=SCRAPER_PAGE_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Toplam boyut tahmini; ilk yazmada dizin taranarak hesaplanır
+        self._bytes = None
+
+    def path(self, url):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.page")
+
+    def load(self, url):
+        """
+        Saklanan kaydı oku
+
+        Returns:
+            tuple: (üst veri, gövde), kayıt yoksa veya bozuksa (None, None)
+        """
+        try:
+            with open(self.path(url), 'rb') as f:
+                entry = json.loads(f.readline())
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            return None, None
+        if entry.get('url') != url:
+            return None, None
+        return entry, body
+
+    def store(self, url, response):
+        """200 yanıtını sakla ve diğer çağrılar için üst veriyi döndür"""
+        entry = {
+            'url': url,
+            'fetched': time.time(),
+            'encoding': response.encoding,
+            'headers': {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+        }
+        self._write(url, entry, response.content)
+        return entry
+
+    def touch(self, url, entry, body):
+        """Sunucu 304 ile doğruladığında kaydın alınma zamanını yenile"""
+        entry = dict(entry, fetched=time.time())
+        self._write(url, entry, body)
+        return entry
+
+    def _write(self, url, entry, body):
+        path = self.path(url)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        data = json.dumps(entry).encode('utf-8') + b'\n' + body
+        # Eş zamanlı okuyucular yarım dosya görmesin diye geçici dosyaya yazıp taşı
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._account(len(data))
+
+    def _scan(self):
+        entries = []
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _account(self, size):
+        """Yeni kaydı toplam boyuta ekle, sınır aşıldıysa eski kayıtları sil"""
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(entry[1] for entry in self._scan())
+            else:
+                self._bytes += size
+            if self._bytes > self.max_bytes:
+                self._bytes = self.evict(int(self.max_bytes * 0.9))
+
+    def evict(self, target_bytes):
+        """
+        Toplam boyut `target_bytes` altına inene kadar en eski kayıtları sil
+
+        Returns:
+            int: Kalan toplam boyut
+        """
+        entries = sorted(self._scan())
+        total = sum(entry[1] for entry in entries)
+        for _mtime, size, path in entries:
+            if total <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
+
+    def fetch(self, url, headers=None, ttl=SCRAPER_PAGE_CACHE_TTL):
+        """
+        Sayfayı önbellekten veya sunucudan getir
+
+        Args:
+            url (str): Sayfa URL'si
+            headers (dict, optional): İstek başlıkları; kayıt varsa çağıranın
+                koşullu başlıkları yerine kaydın doğrulayıcıları gönderilir
+            ttl (int): Kaydın doğrulanmadan kullanılacağı süre (saniye)
+
+        Returns:
+            requests.Response: Sunucunun veya önbelleğin yanıtı
+        """
+        headers = dict(headers or {})
+        entry, body = self.load(url) if ttl else (None, None)
+        if entry is not None:
+            if time.time() - entry['fetched'] < ttl:
+                os.utime(self.path(url))
+                return _cached_response(url, entry, body)
+            headers.pop('If-None-Match', None)
+            headers.pop('If-Modified-Since', None)
+            stored = entry.get('headers', {})
+            if stored.get('ETag'):
+                headers['If-None-Match'] = stored['ETag']
+            if stored.get('Last-Modified'):
+                headers['If-Modified-Since'] = stored['Last-Modified']
+
+        response = http_client.get(url, headers=headers)
+        response.from_cache = False
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Önbellekteki sayfa hâlâ geçerli (304): {url}")
+            return _cached_response(url, self.touch(url, entry, body), body)
+        if response.status_code == 200 and ttl:
+            try:
+                self.store(url, response)
+            except OSError as e:
+                logger.warning(f"Sayfa önbelleğe yazılamadı: {url}: {e}")
+        return response
+
+    def invalidate(self, url):
+        """URL'nin kaydını sil"""
+        try:
+            os.remove(self.path(url))
+        except FileNotFoundError:
+            pass
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache():
+    """Süreç genelinde paylaşılan sayfa önbelleğini döndür"""
+    global _page_cache
+    if _page_cache is None:
+        with _page_cache_lock:
+            if _page_cache is None:
+                _page_cache = PageCache()
+    return _page_cache
+
+
+def fetch(url, headers=None, ttl=SCRAPER_PAGE_CACHE_TTL):
+    """Sayfayı paylaşılan önbellek üzerinden getir (bkz. `PageCache.fetch`)"""
+    return get_page_cache().fetch(url, headers=headers, ttl=ttl)
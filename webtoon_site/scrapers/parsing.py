@@ -0,0 +1,189 @@
+"""
+Scraper'lar için HTML ayrıştırma katmanı
+
+Sayfalar bir kez ayrıştırılır ve sitenin alanları önceden derlenmiş CSS
+seçicileriyle tek geçişte çıkarılır:
+
+    CHAPTER_LIST = SelectorSet({
+        'chapters': Field('.wp-manga-chapter', many=True, fields={
+            'url': Field('a', attrs=['href'], url=True),
+            'title': Field('a'),
+        }),
+    })
+    data = CHAPTER_LIST.extract(html, base_url=page_url)
+
+lxml ve cssselect kuruluysa ağaç lxml ile kurulur ve seçiciler XPath'e
+derlenir; bu, `html.parser` ile BeautifulSoup kullanmaktan birkaç kat
+hızlıdır. Kurulu değilse aynı arayüz BeautifulSoup (`html.parser`) ve
+soupsieve ile derlenmiş seçicilerle sağlanır. `make_soup` BeautifulSoup
+bekleyen kod için mevcut en hızlı ağaç kurucuyu seçer.
+"""
+import logging
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    # cssselect, lxml'in isteğe bağlı bağımlılığıdır
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    CSSSelector = None
+
+logger = logging.getLogger(__name__)
+
+
+def _soup_builder():
+    return 'lxml' if lxml is not None else 'html.parser'
+
+
+def make_soup(markup):
+    """Mevcut en hızlı ağaç kurucuyla BeautifulSoup nesnesi oluştur"""
+    return BeautifulSoup(markup, _soup_builder())
+
+
+class LxmlBackend:
+    """lxml ağaçları ve XPath'e derlenmiş seçiciler"""
+
+    name = 'lxml'
+
+    def parse(self, markup):
+        if not markup or not markup.strip():
+            markup = '<html></html>'
+        try:
+            return lxml.html.document_fromstring(markup)
+        except ValueError:
+            # Kodlama bildirimi içeren metinler bayt olarak verilmelidir
+            return lxml.html.document_fromstring(markup.encode('utf-8'))
+
+    def compile(self, selector):
+        return CSSSelector(selector, translator='html')
+
+    def select(self, compiled, node):
+        return compiled(node)
+
+    def text(self, node, separator):
+        return separator.join(part.strip() for part in node.itertext() if part.strip())
+
+    def attr(self, node, name):
+        return node.get(name)
+
+
+class SoupBackend:
+    """BeautifulSoup (`html.parser`) ağaçları ve soupsieve ile derlenmiş seçiciler"""
+
+    name = 'html.parser'
+
+    def parse(self, markup):
+        return BeautifulSoup(markup, 'html.parser')
+
+    def compile(self, selector):
+        import soupsieve
+        return soupsieve.compile(selector)
+
+    def select(self, compiled, node):
+        return compiled.select(node)
+
+    def text(self, node, separator):
+        return node.get_text(separator, strip=True)
+
+    def attr(self, node, name):
+        value = node.get(name)
+        # BeautifulSoup çok değerli özellikleri (class) liste olarak döndürür
+        return ' '.join(value) if isinstance(value, list) else value
+
+
+backend = LxmlBackend() if CSSSelector is not None else SoupBackend()
+
+
+def parse(markup):
+    """HTML'i seçili arka uçla ayrıştır; dönen belge `SelectorSet.extract`'e verilebilir"""
+    return backend.parse(markup)
+
+
+class Field:
+    """
+    Sayfadan çıkarılacak bir alan
+
+    Args:
+        *selectors (str): Sırayla denenen CSS seçicileri; değer bulan ilk seçici kullanılır
+        attrs (list, optional): Metin yerine okunacak özellikler, öncelik sırasıyla;
+            boş ve 'data:' ile başlayan değerler atlanır
+        many (bool): True ise eşleşen tüm öğeler liste olarak döndürülür
+        url (bool): True ise değer sayfa adresine göre mutlak URL'ye çevrilir
+        separator (str): Metin parçalarını birleştiren ayraç
+        fields (dict, optional): Her eşleşen öğe içinde çıkarılacak alt alanlar
+    """
+
+    def __init__(self, *selectors, attrs=None, many=False, url=False, separator=' ', fields=None):
+        self.selectors = selectors
+        self.attrs = tuple(attrs or ())
+        self.many = many
+        self.url = url
+        self.separator = separator
+        self.fields = SelectorSet(fields) if fields else None
+        self._compiled = None
+
+    def compiled(self):
+        if self._compiled is None:
+            self._compiled = [backend.compile(selector) for selector in self.selectors]
+        return self._compiled
+
+    def value(self, node, base_url):
+        """Tek bir öğenin değeri; değer yoksa None"""
+        if self.fields is not None:
+            return self.fields.extract_from(node, base_url)
+        if self.attrs:
+            for name in self.attrs:
+                value = backend.attr(node, name)
+                if value and value.strip() and not value.startswith('data:'):
+                    value = value.strip()
+                    return urljoin(base_url, value) if self.url and base_url else value
+            return None
+        return backend.text(node, self.separator) or None
+
+    def extract(self, node, base_url):
+        for compiled in self.compiled():
+            matches = backend.select(compiled, node)
+            if not matches:
+                continue
+            if self.many:
+                return [value for value in (self.value(match, base_url) for match in matches) if value]
+            for match in matches:
+                value = self.value(match, base_url)
+                if value:
+                    return value
+        return [] if self.many else None
+
+
+class SelectorSet:
+    """
+    Bir sayfa türünün alanları; seçiciler ilk kullanımda bir kez derlenir
+
+    Args:
+        fields (dict): Alan adı -> Field
+    """
+
+    def __init__(self, fields):
+        self.fields = dict(fields)
+
+    def extract_from(self, node, base_url=None):
+        """Ayrıştırılmış belgeden (veya öğeden) tüm alanları çıkar"""
+        return {name: field.extract(node, base_url) for name, field in self.fields.items()}
+
+    def extract(self, markup, base_url=None):
+        """
+        HTML'i bir kez ayrıştırıp tüm alanları çıkar
+
+        Args:
+            markup (str | bytes): Sayfa HTML'i
+            base_url (str, optional): Göreli URL'lerin çözüleceği sayfa adresi
+
+        Returns:
+            dict: Alan adı -> değer (bulunamayan tekil alanlar None, çoğullar boş liste)
+        """
+        return self.extract_from(parse(markup), base_url)
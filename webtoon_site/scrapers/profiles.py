@@ -0,0 +1,292 @@
+"""
+Kaynak siteler için bildirimsel site profilleri
+
+Bir profil bir sitenin nasıl okunacağını tanımlar: sayfa türlerine göre CSS
+seçicileri, liste sayfalarında sayfalama kuralı, resim adresi özelliklerinin
+öncelik sırası ve hangi sayfaların JavaScript gerektirdiği. Profiller
+sunucu adına göre kayıt defterinde tutulur; `get_scraper_for_url` URL için
+uygun scraper'ı döndürür. Profil tabanlı siteler genel `ProfileScraper`
+motoruyla okunur, yani yeni bir kaynak eklemek yeni bir sınıf değil yeni bir
+profil demektir.
+
+Madara temalı WordPress siteleri için seçiciler hazırdır; böyle bir site
+ayarlardan tek bir sözlükle eklenebilir:
+
+    SCRAPER_SITE_PROFILES = [
+        {'name': 'ÖrnekManga', 'hosts': ['ornekmanga.com'],
+         'base_url': 'https://ornekmanga.com', 'theme': 'madara'},
+    ]
+
+Seçici sözlüğündeki alanlar:
+
+- 'list': 'item' (kart), 'title', 'url', 'cover'
+- 'details': 'title', 'cover', 'description', 'categories'
+- 'chapters': 'item' (bölüm satırı), 'link', 'date'
+- 'images': 'image'
+
+Her alan tek bir seçici veya sırayla denenecek seçici listesi olabilir.
+"""
+import copy
+import fnmatch
+import importlib
+import logging
+from urllib.parse import urlparse
+
+from .http_client import get_setting
+from .parsing import Field, SelectorSet
+
+logger = logging.getLogger(__name__)
+
+# Resim adresinin okunacağı özellikler, öncelik sırasıyla (tembel yükleme
+# eklentileri gerçek adresi data-* özelliklerine koyar)
+DEFAULT_IMAGE_ATTRS = ('data-src', 'data-lazy-src', 'data-original', 'data-original-src', 'src')
+
+# Bölüm başlığından bölüm numarasını çıkaran desen
+DEFAULT_CHAPTER_NUMBER_PATTERN = r'(?:Bölüm|Chapter)\s+(\d+)'
+
+MADARA_SELECTORS = {
+    'list': {
+        'item': '.page-item-detail',
+        'title': '.post-title h3 a',
+        'url': '.post-title h3 a',
+        'cover': '.item-thumb img',
+    },
+    'details': {
+        'title': '.post-title',
+        'cover': ['.summary_image img', '.tab-summary img', '.site-content img'],
+        'description': ['.summary__content', '.description-summary', '.manga-excerpt',
+                        '.c-page__content', '.entry-content', '.manga-summary'],
+        'categories': '.genres-content a, .tags-content a',
+    },
+    'chapters': {
+        'item': ['.wp-manga-chapter', '.main.version-chap li', '.chapter-link', '.chapter_list li', '.chapter-item'],
+        'link': 'a',
+        'date': ['.chapter-release-date', '.date'],
+    },
+    'images': {
+        'image': ['.reading-content .page-break img', '.entry-content img', '.container-chapter-reader img',
+                  '.chapter-container img', '.chapter-content img', '.main-reading-area img', '.reader-area img'],
+    },
+}
+
+MADARA_THEME = {
+    'selectors': MADARA_SELECTORS,
+    'list_path': '/manga/',
+    'pagination': {'next': '.nav-previous a, a.nextpostslink, .wp-pagenavi .nextpostslink', 'max_pages': 1},
+    # Yeni Madara sürümleri bölüm listesini sayfaya bu uç noktadan (POST) yükler
+    'chapter_list_ajax': 'ajax/chapters/',
+    'expand_selector': '.btn-view-more, .show-all',
+    'images_script_pattern': r'chapter_preloaded_images\s*=\s*(\[.*?\])',
+}
+
+THEMES = {
+    'madara': MADARA_THEME,
+}
+
+
+class SiteProfile:
+    """
+    Bir kaynak sitenin okunma kuralları
+
+    Args:
+        name (str): Kaynak adı (ExternalSource.name ile eşleşir)
+        hosts (list): Sunucu desenleri (fnmatch, 'www.' olmadan)
+        base_url (str): Sitenin ana adresi
+        selectors (dict): Sayfa türü -> alan -> seçici(ler)
+        list_path (str): Webtoon listesinin yolu
+        pagination (dict): Liste sayfaları için {'next': sonraki sayfa bağlantısı, 'max_pages': n}
+        image_attrs (list): Resim adresi özellikleri, öncelik sırasıyla
+        requires_js (bool | dict): Sayfa türü -> JavaScript gerekli mi; gerekli değilse
+            sayfa yalnızca HTTP ile okunur, Selenium yalnızca sonuç boşsa denenir
+        js_fallback (bool): HTTP ile sonuç alınamazsa Selenium denensin mi
+        chapter_list_ajax (str): Bölüm listesi sayfada yoksa POST ile istenecek göreli yol
+        expand_selector (str): Selenium'da tüm bölümleri göstermek için tıklanacak öğe
+        images_script_pattern (str): Resim listesini sayfa betiğinden çıkaran desen
+        chapter_number_pattern (str): Bölüm başlığından numarayı çıkaran desen
+        newest_first (bool): Sitede en yeni bölüm en üstte mi
+        headers (dict): İsteklere eklenecek başlıklar
+        scraper_class (str | type): Profil motoru yerine kullanılacak scraper sınıfı
+        theme (str): Eksik alanların alınacağı hazır tema ('madara')
+    """
+
+    def __init__(self, name, hosts, base_url, selectors=None, list_path='/', pagination=None,
+                 image_attrs=DEFAULT_IMAGE_ATTRS, requires_js=False, js_fallback=True,
+                 chapter_list_ajax=None, expand_selector=None, images_script_pattern=None,
+                 chapter_number_pattern=DEFAULT_CHAPTER_NUMBER_PATTERN, newest_first=True,
+                 headers=None, scraper_class=None, theme=None):
+        defaults = copy.deepcopy(THEMES[theme]) if theme else {}
+        self.name = name
+        self.hosts = list(hosts)
+        self.base_url = base_url.rstrip('/')
+        self.selectors = defaults.get('selectors', {})
+        for kind, fields in (selectors or {}).items():
+            self.selectors[kind] = dict(self.selectors.get(kind, {}), **fields)
+        self.list_path = defaults.get('list_path', list_path) if list_path == '/' else list_path
+        self.pagination = pagination or defaults.get('pagination') or {}
+        self.image_attrs = tuple(image_attrs)
+        self.requires_js = requires_js
+        self.js_fallback = js_fallback
+        self.chapter_list_ajax = chapter_list_ajax or defaults.get('chapter_list_ajax')
+        self.expand_selector = expand_selector or defaults.get('expand_selector')
+        self.images_script_pattern = images_script_pattern or defaults.get('images_script_pattern')
+        self.chapter_number_pattern = chapter_number_pattern
+        self.newest_first = newest_first
+        self.headers = dict(headers or {})
+        self.scraper_class = scraper_class
+        self._selector_sets = {}
+
+    def __repr__(self):
+        return f"<SiteProfile {self.name}>"
+
+    def matches(self, host):
+        host = host.lower()
+        if host.startswith('www.'):
+            host = host[4:]
+        return any(fnmatch.fnmatch(host, pattern) for pattern in self.hosts)
+
+    def needs_js(self, kind):
+        """Sayfa türü JavaScript çalıştırılmadan okunamıyor mu"""
+        if isinstance(self.requires_js, dict):
+            return bool(self.requires_js.get(kind, False))
+        return bool(self.requires_js)
+
+    def selector(self, kind, field):
+        """Alanın seçicileri, tek bir CSS seçici listesi olarak (Selenium beklemeleri için)"""
+        value = self.selectors.get(kind, {}).get(field)
+        if not value:
+            return None
+        return value if isinstance(value, str) else ', '.join(value)
+
+    def _selectors(self, kind, field):
+        value = self.selectors.get(kind, {}).get(field)
+        if not value:
+            return ()
+        return (value,) if isinstance(value, str) else tuple(value)
+
+    def selector_set(self, kind):
+        """Sayfa türünün derlenmiş alanları (ilk çağrıda oluşturulur)"""
+        if kind not in self._selector_sets:
+            self._selector_sets[kind] = self._build_selector_set(kind)
+        return self._selector_sets[kind]
+
+    def _build_selector_set(self, kind):
+        s = self._selectors
+        attrs = self.image_attrs
+        if kind == 'list':
+            fields = {
+                'items': Field(*s('list', 'item'), many=True, fields={
+                    'title': Field(*s('list', 'title')),
+                    'url': Field(*s('list', 'url'), attrs=['href'], url=True),
+                    'cover_url': Field(*s('list', 'cover'), attrs=attrs, url=True),
+                }),
+            }
+            if self.pagination.get('next'):
+                fields['next'] = Field(self.pagination['next'], attrs=['href'], url=True)
+            return SelectorSet(fields)
+        if kind == 'details':
+            return SelectorSet({
+                'title': Field(*s('details', 'title')),
+                'cover_url': Field(*s('details', 'cover'), attrs=attrs, url=True),
+                'description': Field(*s('details', 'description'), separator='\n'),
+                'categories': Field(*s('details', 'categories'), many=True),
+            })
+        if kind == 'chapters':
+            link = s('chapters', 'link') or ('a',)
+            return SelectorSet({
+                'chapters': Field(*s('chapters', 'item'), many=True, fields={
+                    'url': Field(*link, attrs=['href'], url=True),
+                    'title': Field(*link),
+                    'date': Field(*s('chapters', 'date')),
+                }),
+            })
+        if kind == 'images':
+            return SelectorSet({
+                'images': Field(*s('images', 'image'), many=True, attrs=attrs, url=True),
+            })
+        raise ValueError(f"Bilinmeyen sayfa türü: {kind}")
+
+    def create_scraper(self, **kwargs):
+        """Profil için scraper örneği oluştur"""
+        scraper_class = self.scraper_class
+        if isinstance(scraper_class, str):
+            module_name, _, class_name = scraper_class.rpartition('.')
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+        if scraper_class is None:
+            from .engine import ProfileScraper
+            return ProfileScraper(self, **kwargs)
+        return scraper_class(**kwargs)
+
+
+BUILTIN_PROFILES = [
+    SiteProfile(
+        name='MangaZure',
+        hosts=['mangazure.net', '*.mangazure.net'],
+        base_url='https://mangazure.net',
+        theme='madara',
+        headers={'Referer': 'https://mangazure.net/'},
+        scraper_class='scrapers.mangazure_scraper.MangaZureScraper',
+    ),
+    SiteProfile(
+        name='MangaDex',
+        hosts=['mangadex.org', '*.mangadex.org'],
+        base_url='https://mangadex.org',
+        # Resmi API üzerinden okunur, HTML seçicisi yoktur
+        scraper_class='scrapers.webtoon_scraper.WebtoonScraper',
+    ),
+]
+
+_registry = []
+
+
+def register(profile):
+    """Profili kayıt defterine ekle; aynı adlı profil varsa yerine geçer"""
+    if isinstance(profile, dict):
+        profile = SiteProfile(**profile)
+    _registry[:] = [p for p in _registry if p.name.lower() != profile.name.lower()]
+    # Ayarlardan gelen profiller yerleşik olanlardan önce denenir
+    _registry.insert(0, profile)
+    return profile
+
+
+def registered_profiles():
+    return list(_registry)
+
+
+def get_profile(url):
+    """URL'nin sunucusuna uyan profil, yoksa None"""
+    host = urlparse(url or '').netloc
+    if not host:
+        return None
+    for profile in _registry:
+        if profile.matches(host):
+            return profile
+    return None
+
+
+def get_profile_by_name(name):
+    for profile in _registry:
+        if profile.name.lower() == (name or '').lower():
+            return profile
+    return None
+
+
+def get_scraper_for_url(url, **kwargs):
+    """
+    URL için uygun scraper'ı oluştur
+
+    Returns:
+        BaseScraper: Profilin scraper'ı, desteklenmeyen sitelerde None
+    """
+    profile = get_profile(url)
+    if profile is None:
+        return None
+    return profile.create_scraper(**kwargs)
+
+
+for _profile in reversed(BUILTIN_PROFILES):
+    register(_profile)
+for _profile in get_setting('SCRAPER_SITE_PROFILES', []):
+    try:
+        register(_profile)
+    except (TypeError, KeyError) as e:
+        logger.error(f"Geçersiz site profili atlandı: {_profile}: {e}")
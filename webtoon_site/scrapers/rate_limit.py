@@ -0,0 +1,215 @@
+"""
+Scraper istekleri için sunucu başına hız sınırlayıcı
+
+Her sunucu için bir jeton kovası (token bucket) tutulur: kova `burst` jetonla
+dolu başlar ve saniyede `rate` jeton dolar; her istek bir jeton harcar. Kova
+boşsa istek, sıradaki jeton dolana kadar bekletilir. Böylece sağlıklı
+sunuculara izin verilen en yüksek hızda, hassas sunuculara ise ani yük
+bindirmeden istek yapılır.
+
+Kova, "teorik varış zamanı" (GCRA) olarak tek bir sayıyla saklanır; bu
+sayede Redis'te tek bir Lua betiğiyle atomik olarak güncellenebilir.
+`SCRAPER_RATE_LIMIT_REDIS_URL` tanımlıysa kovalar Redis'te tutulur ve tüm
+iş parçacıkları, süreçler ve Celery çalışanları arasında paylaşılır; değilse
+süreç içinde tutulur.
+
+Sunucu 429 (veya `Retry-After` başlıklı bir yanıt) döndürdüğünde `penalize`
+ile o sunucunun kovası belirtilen süre boyunca kapatılır; bekleme tüm
+çalışanlar için geçerli olur.
+"""
+import asyncio
+import email.utils
+import fnmatch
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from .http_client import get_setting
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Sunucu deseni -> (saniyedeki istek, ani yük kapasitesi); ilk eşleşen kullanılır
+DEFAULT_RATE_LIMITS = {
+    'api.mangadex.org': (5, 5),
+    'uploads.mangadex.org': (10, 10),
+    '*.mangadex.network': (20, 20),
+    'mangazure.net': (2, 4),
+    '*.mangazure.net': (2, 4),
+    '*': (10, 10),
+}
+SCRAPER_RATE_LIMITS = get_setting('SCRAPER_RATE_LIMITS', DEFAULT_RATE_LIMITS)
+SCRAPER_RATE_LIMIT_REDIS_URL = get_setting(
+    'SCRAPER_RATE_LIMIT_REDIS_URL', os.environ.get('SCRAPER_RATE_LIMIT_REDIS_URL', '')
+)
+RATE_LIMIT_KEY_PREFIX = 'webtoon_site:ratelimit:'
+
+# KEYS[1]: kova anahtarı
+# ARGV: jeton aralığı (sn), kapasite, ceza süresi (sn, 0 ise jeton al)
+# Dönüş: isteğin beklemesi gereken süre (sn, metin olarak)
+_REDIS_BUCKET_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local penalty = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local wait = 0
+if penalty > 0 then
+    local blocked = now + penalty + (burst - 1) * interval
+    if blocked > tat then tat = blocked end
+else
+    tat = tat + interval
+    wait = tat - burst * interval - now
+    if wait < 0 then wait = 0 end
+end
+redis.call('SET', KEYS[1], tostring(tat), 'PX', math.ceil((tat - now) * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+def parse_retry_after(headers):
+    """`Retry-After` başlığını saniyeye çevir, yoksa veya geçersizse None"""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LocalBuckets:
+    """Süreç içinde tutulan jeton kovaları"""
+
+    def __init__(self):
+        self._tats = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host, interval, burst):
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tats.get(host, now), now) + interval
+            self._tats[host] = tat
+            return max(0.0, tat - burst * interval - now)
+
+    def penalize(self, host, seconds, interval, burst):
+        with self._lock:
+            now = time.monotonic()
+            blocked = now + seconds + (burst - 1) * interval
+            self._tats[host] = max(self._tats.get(host, now), blocked)
+
+
+class RedisBuckets:
+    """Redis'te tutulan, tüm çalışanlar arasında paylaşılan jeton kovaları"""
+
+    def __init__(self, url):
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_BUCKET_SCRIPT)
+
+    def _call(self, host, interval, burst, penalty):
+        return float(self._script(keys=[RATE_LIMIT_KEY_PREFIX + host], args=[interval, burst, penalty]))
+
+    def reserve(self, host, interval, burst):
+        return self._call(host, interval, burst, 0)
+
+    def penalize(self, host, seconds, interval, burst):
+        self._call(host, interval, burst, seconds)
+
+
+class RateLimiter:
+    """
+    URL'nin sunucusuna göre istekleri sınırlayan hız sınırlayıcı
+
+    Args:
+        limits (dict, optional): Sunucu deseni -> (saniyedeki istek, kapasite)
+        redis_url (str, optional): Kovaların paylaşılacağı Redis adresi
+    """
+
+    def __init__(self, limits=None, redis_url=None):
+        self.limits = limits if limits is not None else SCRAPER_RATE_LIMITS
+        self._local = LocalBuckets()
+        self._buckets = self._local
+        if redis_url:
+            if redis is None:
+                logger.warning("redis kütüphanesi bulunamadı, hız sınırları süreç içinde tutulacak")
+            else:
+                self._buckets = RedisBuckets(redis_url)
+
+    def limit_for(self, host):
+        """Sunucu için (jeton aralığı, kapasite) döndür, sınır yoksa None"""
+        for pattern, limit in self.limits.items():
+            if fnmatch.fnmatch(host, pattern):
+                if not limit:
+                    return None
+                rate, burst = limit
+                return 1.0 / rate, max(1, int(burst))
+        return None
+
+    def _run(self, method, host, *args):
+        try:
+            return getattr(self._buckets, method)(host, *args)
+        except Exception as e:
+            # Redis erişilemezse istekleri durdurmak yerine yerel kovaya düş
+            logger.warning(f"Hız sınırlayıcıya erişilemedi, yerel sınır kullanılıyor: {e}")
+            return getattr(self._local, method)(host, *args)
+
+    def reserve(self, url):
+        """
+        URL'nin sunucusundan bir jeton ayır
+
+        Returns:
+            float: İsteğin yapılabilmesi için beklenmesi gereken süre (saniye)
+        """
+        host = urlparse(url).netloc.lower()
+        limit = self.limit_for(host)
+        if limit is None:
+            return 0.0
+        return self._run('reserve', host, *limit)
+
+    def acquire(self, url):
+        """Sunucu için jeton alınana kadar bekle"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url):
+        """`acquire` ile aynı, ancak olay döngüsünü engellemeden bekler"""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, url, seconds):
+        """Sunucuya verilen süre boyunca hiçbir çalışanın istek yapmamasını sağla"""
+        host = urlparse(url).netloc.lower()
+        limit = self.limit_for(host) or (0.0, 1)
+        logger.info(f"{host} için istekler {seconds:.1f} saniye durduruldu")
+        self._run('penalize', host, seconds, *limit)
+
+
+_rate_limiter = None
+_rate_limiter_pid = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Süreç genelinde paylaşılan hız sınırlayıcıyı döndür"""
+    global _rate_limiter, _rate_limiter_pid
+    pid = os.getpid()
+    if _rate_limiter is None or _rate_limiter_pid != pid:
+        with _rate_limiter_lock:
+            if _rate_limiter is None or _rate_limiter_pid != pid:
+                _rate_limiter = RateLimiter(redis_url=SCRAPER_RATE_LIMIT_REDIS_URL)
+                _rate_limiter_pid = pid
+    return _rate_limiter
@@ -0,0 +1,260 @@
+"""
+Selenium sayfaları için olaya dayalı bekleme stratejileri
+
+Sabit süreli `time.sleep` yerine sayfanın gerçekten hazır olduğu an beklenir:
+
+- `wait_for_selector`: istenen içerik (ör. bölüm listesi) DOM'a eklenene kadar
+- `wait_for_network_idle`: sayfa içindeki fetch/XHR istekleri bitip belirli
+  bir süre yeni kaynak yüklenmeyene kadar
+- `resolve_lazy_images`: tembel yüklenen resimler gerçek adreslerini alana
+  kadar sayfayı kaydırır; DOM değişiklikleri MutationObserver ile izlenir,
+  değişiklik durunca bir sonraki adıma geçilir
+
+Hangi adımların hangi seçicilerle uygulanacağı site başına bekleme
+profillerinden (`SCRAPER_WAIT_PROFILES`) gelir. Her sayfa türünün ('details',
+'chapters', 'images') bir hazır seçicisi olabilir; profilde seçici yoksa
+`ProfileScraper` bunları site profilinden (bkz. `profiles`) tamamlar. Tüm
+adımlar profilin `timeout` süresini ortak bir üst sınır olarak paylaşır.
+"""
+import fnmatch
+import logging
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .http_client import get_setting
+
+logger = logging.getLogger(__name__)
+
+# Profil belirtmeyen alanlar için varsayılanlar
+DEFAULT_WAIT_PROFILE = {
+    # Sayfa başına tüm beklemelerin toplam üst sınırı (saniye)
+    'timeout': 15,
+    # Bu kadar süre (ms) yeni istek olmazsa ağ boşta sayılır
+    'idle_ms': 500,
+    # Ağın boşa çıkması için en fazla beklenecek süre (saniye); reklam, analiz
+    # veya yoklama istekleri olan sayfalarda ağ hiç boşa çıkmayabilir
+    'idle_timeout': 3,
+    # Tembel resimler için kaydırma yapılsın mı
+    'lazy_images': True,
+    # Sayfa türü -> içeriğin yüklendiğini gösteren CSS seçicisi
+    'selectors': {},
+}
+# Sunucu deseni -> profil; ilk eşleşen kullanılır
+DEFAULT_WAIT_PROFILES = {
+    '*mangazure.net': {'timeout': 20},
+    '*': {},
+}
+SCRAPER_WAIT_PROFILES = get_setting('SCRAPER_WAIT_PROFILES', DEFAULT_WAIT_PROFILES)
+
+POLL_INTERVAL = 0.1
+
+# Sayfaya bir kez kurulur; bekleyen fetch/XHR sayısını ve son ağ etkinliğinin
+# zamanını tutar. Kurulumdan önce tamamlanan kaynaklar Resource Timing
+# kayıtlarından okunur.
+_NETWORK_MONITOR_SCRIPT = """
+if (!window.__scraperNet) {
+    var state = window.__scraperNet = {pending: 0, last: 0};
+    var bump = function() { state.last = performance.now(); };
+    performance.getEntriesByType('resource').forEach(function(entry) {
+        state.last = Math.max(state.last, entry.responseEnd);
+    });
+    try {
+        new PerformanceObserver(bump).observe({entryTypes: ['resource']});
+    } catch (e) {}
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        state.pending++; bump();
+        this.addEventListener('loadend', function() { state.pending--; bump(); });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            state.pending++; bump();
+            return originalFetch.apply(this, arguments).finally(function() { state.pending--; bump(); });
+        };
+    }
+}
+"""
+
+_NETWORK_IDLE_SCRIPT = """
+var state = window.__scraperNet;
+return !state || (state.pending <= 0 && performance.now() - state.last >= arguments[0]);
+"""
+
+# Tembel resimleri çözmek için sayfayı aşağı kaydırır. Her adımdan sonra DOM
+# değişikliği olduysa değişiklikler `quiet` ms durana kadar beklenir; hiç
+# değişiklik olmayan adımlar hemen geçilir. Seçiciye uyan tüm resimlerin
+# gerçek bir adresi varsa hiç kaydırılmaz.
+_LAZY_IMAGES_SCRIPT = """
+var selector = arguments[0], quiet = arguments[1], deadline = performance.now() + arguments[2];
+var done = arguments[arguments.length - 1];
+var attrs = ['data-src', 'data-original', 'data-lazy-src', 'data-original-src', 'src'];
+function realSource(img) {
+    for (var i = 0; i < attrs.length; i++) {
+        var value = img.getAttribute(attrs[i]);
+        if (value && value.indexOf('data:') !== 0) return true;
+    }
+    return false;
+}
+function unresolved() {
+    var count = 0;
+    document.querySelectorAll(selector).forEach(function(img) { if (!realSource(img)) count++; });
+    return count;
+}
+if (!document.body || !document.querySelector(selector) || unresolved() === 0) {
+    return done(0);
+}
+var lastMutation = 0;
+var observer = new MutationObserver(function() { lastMutation = performance.now(); });
+observer.observe(document.body, {subtree: true, childList: true, attributes: true,
+                                 attributeFilter: ['src', 'srcset', 'data-src', 'class']});
+var step = Math.max(400, window.innerHeight * 1.5);
+var scrolledAt = 0;
+function finish() {
+    observer.disconnect();
+    window.scrollTo(0, 0);
+    done(unresolved());
+}
+function tick() {
+    var now = performance.now();
+    if (now > deadline) return finish();
+    // Son kaydırmadan sonra değişiklik olduysa sessizleşmesini bekle
+    if (lastMutation > scrolledAt && now - lastMutation < quiet) return setTimeout(tick, 50);
+    var bottom = window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 2;
+    if (bottom || unresolved() === 0) return finish();
+    window.scrollBy(0, step);
+    scrolledAt = performance.now();
+    setTimeout(tick, 50);
+}
+tick();
+"""
+
+
+def wait_profile(url):
+    """URL'nin sunucusu için bekleme profili (varsayılanlarla birleştirilmiş)"""
+    host = urlparse(url or '').netloc.lower()
+    profile = dict(DEFAULT_WAIT_PROFILE)
+    for pattern, overrides in SCRAPER_WAIT_PROFILES.items():
+        if fnmatch.fnmatch(host, pattern):
+            profile.update(overrides)
+            break
+    return profile
+
+
+def _remaining(deadline):
+    return max(0.0, deadline - time.monotonic())
+
+
+def network_idle_timeout(profile, remaining):
+    """
+    Ağ boşta beklemesine ayrılacak süre
+
+    Kalan sürenin en fazla üçte biri kullanılır; böylece sürekli istek yapan
+    sayfalarda da sonraki adımlara (tembel resimler) süre kalır.
+    """
+    return min(profile['idle_timeout'], remaining / 3)
+
+
+def wait_for_ready_state(driver, timeout):
+    """Belge yüklenmesi tamamlanana kadar bekle"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_selector(driver, selector, timeout):
+    """Seçiciye uyan bir öğe DOM'a eklenene kadar bekle; süre dolarsa False"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_more(driver, selector, count, timeout):
+    """Seçiciye uyan öğe sayısı `count`'u geçene kadar bekle (ör. "tümünü göster" sonrası)"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, selector)) > count
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_network_idle(driver, idle_ms, timeout):
+    """
+    Bekleyen fetch/XHR isteği kalmayıp `idle_ms` boyunca yeni kaynak
+    yüklenmeyene kadar bekle
+
+    Returns:
+        bool: Süre dolmadan ağ boşa çıktıysa True
+    """
+    try:
+        driver.execute_script(_NETWORK_MONITOR_SCRIPT)
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script(_NETWORK_IDLE_SCRIPT, idle_ms)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def resolve_lazy_images(driver, selector, idle_ms, timeout):
+    """
+    Tembel yüklenen resimlerin adreslerini alması için sayfayı kaydır
+
+    Returns:
+        int: Süre sonunda hâlâ adresi olmayan resim sayısı
+    """
+    driver.set_script_timeout(timeout + 5)
+    try:
+        return driver.execute_async_script(_LAZY_IMAGES_SCRIPT, selector, idle_ms, timeout * 1000) or 0
+    except TimeoutException:
+        logger.warning("Tembel resimler için kaydırma zaman aşımına uğradı")
+        return 0
+
+
+def wait_for_page(driver, kind=None, url=None, profile=None):
+    """
+    Sayfanın istenen türdeki içeriği hazır olana kadar bekle
+
+    Args:
+        driver: Selenium sürücüsü
+        kind (str, optional): Sayfa türü ('details', 'chapters', 'images')
+        url (str, optional): Profil seçimi için URL (varsayılan: geçerli adres)
+        profile (dict, optional): Kullanılacak profil (varsayılan: `wait_profile(url)`)
+
+    Returns:
+        bool: Türün hazır seçicisi bulunduysa (veya seçici yoksa) True
+    """
+    profile = profile or wait_profile(url or driver.current_url)
+    deadline = time.monotonic() + profile['timeout']
+    selector = profile['selectors'].get(kind) if kind else None
+
+    if not wait_for_ready_state(driver, _remaining(deadline)):
+        logger.warning("Sayfa yüklenmesi zaman aşımına uğradı")
+    found = True
+    if selector:
+        found = wait_for_selector(driver, selector, _remaining(deadline))
+        if not found:
+            logger.warning(f"Sayfada beklenen içerik bulunamadı: {selector}")
+    if not wait_for_network_idle(driver, profile['idle_ms'], network_idle_timeout(profile, _remaining(deadline))):
+        logger.debug("Ağ boşa çıkmadı, beklemeden devam ediliyor")
+    if kind == 'images' and selector and found and profile['lazy_images']:
+        missing = resolve_lazy_images(driver, selector, profile['idle_ms'], _remaining(deadline))
+        if missing:
+            logger.warning(f"{missing} tembel resmin adresi çözülemedi")
+    return found
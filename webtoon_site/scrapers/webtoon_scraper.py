@@ -1,10 +1,10 @@
 import os
 import json
 import re
-import time
 import requests
 from urllib.parse import urljoin, urlparse
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, conditional_headers
+from . import http_client
 from bs4 import BeautifulSoup
 
 class WebtoonScraper(BaseScraper):
@@ -13,6 +13,13 @@ class WebtoonScraper(BaseScraper):
     MangaDex bir API sunduğu için doğrudan API'yi kullanacağız.
     """
     
+    # Bölüm akışı isteğinin parametreleri
+    chapter_feed_params = {
+        "limit": 10,
+        "translatedLanguage[]": ["en"],
+        "order[chapter]": "desc"
+    }
+    
     def __init__(self, base_url="https://api.mangadex.org", download_folder='scraped_webtoons'):
         """
         WebtoonScraper sınıfını başlat
@@ -45,7 +52,7 @@ class WebtoonScraper(BaseScraper):
         }
         
         try:
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -107,58 +114,41 @@ class WebtoonScraper(BaseScraper):
         Returns:
             list: Bölüm bilgilerinin listesi
         """
+        return self.get_webtoon_chapters_if_changed(webtoon_url)[0]
+    
+    def get_webtoon_chapters_if_changed(self, webtoon_url, validators=None):
+        """
+        Bölüm akışını koşullu istekle çek, değişmediyse None döndür
+        
+        Args:
+            webtoon_url (str): Webtoon detay sayfasının URL'si
+            validators (dict, optional): Önceki çağrının döndürdüğü doğrulayıcılar
+            
+        Returns:
+            tuple: (bölüm listesi, değişmediyse None; yeni doğrulayıcılar)
+        """
         # Manga ID'sini URL'den çıkar
         manga_id = webtoon_url.split("/")[-1]
         
         # MangaDex API üzerinden bölümleri çek
         url = f"{self.base_url}/manga/{manga_id}/feed"
-        params = {
-            "limit": 10,
-            "translatedLanguage[]": ["en"],
-            "order[chapter]": "desc"
-        }
         
         try:
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=self.chapter_feed_params, headers=conditional_headers(validators))
+            if response.status_code == 304:
+                return None, dict(validators)
             response.raise_for_status()
             data = response.json()
             
             if "data" not in data or not data["data"]:
                 print("MangaDex API'den bölüm verisi alınamadı veya boş veri döndü.")
-                return []
-            
-            chapters = []
-            
-            for chapter in data["data"]:
-                try:
-                    chapter_id = chapter["id"]
-                    attributes = chapter["attributes"]
-                    
-                    chapter_num = attributes.get("chapter", "1")
-                    title = attributes.get("title", f"Bölüm {chapter_num}")
-                    full_title = f"Bölüm {chapter_num}: {title}" if title else f"Bölüm {chapter_num}"
-                    
-                    # Yayınlanma tarihi
-                    publish_date = attributes.get("publishAt", "Bilinmeyen tarih")
-                    
-                    # Bölüm URL'si
-                    chapter_url = f"{self.frontend_url}/chapter/{chapter_id}"
-                    
-                    chapter_info = {
-                        "title": full_title,
-                        "url": chapter_url,
-                        "date": publish_date
-                    }
-                    
-                    chapters.append(chapter_info)
-                except Exception as e:
-                    print(f"Bölüm bilgilerini işlerken hata: {e}")
+                return [], dict(validators or {})
             
-            return chapters
+            return self._chapter_list_result(self._parse_chapter_feed(data), validators, response)
             
         except Exception as e:
             print(f"MangaDex API'den bölüm verisi çekerken hata: {e}")
-            return []
+            return [], dict(validators or {})
     
     def get_chapter_images(self, chapter_url):
         """
@@ -184,118 +174,66 @@ class WebtoonScraper(BaseScraper):
             
             print(f"API URL: {url}")
             
-            # API yanıtında hata durumunda 3 kez daha dene
-            max_retries = 4
-            for attempt in range(max_retries):
-                try:
-                    # Özel header ekle - MangaDex bazen User-Agent ve referrer kontrol eder
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Referer': 'https://mangadex.org/',
-                        'Accept': 'application/json'
-                    }
-                    
-                    print(f"API isteği gönderiliyor...")
-                    response = requests.get(url, headers=headers, timeout=30)
-                    
-                    print(f"API yanıt kodu: {response.status_code}")
-                    
-                    # Hata kodlarını kontrol et
-                    if response.status_code != 200:
-                        print(f"API hata kodu döndü: {response.status_code}")
-                        print(f"API yanıtı: {response.text}")
-                        
-                        # Başarısız denemeden sonra biraz bekle ve tekrar dene
-                        if attempt < max_retries - 1:
-                            wait_time = 5 * (attempt + 1)
-                            print(f"{wait_time} saniye bekleniyor ve tekrar deneniyor...")
-                            time.sleep(wait_time)
-                            continue
-                        return []
-                    
-                    try:
-                        data = response.json()
-                        print(f"API yanıtı alındı, yanıt anahtarları: {list(data.keys())}")
-                    except Exception as e:
-                        print(f"JSON parse hatası: {e}")
-                        print(f"Yanıt içeriği: {response.text[:500]}...")
-                        if attempt < max_retries - 1:
-                            time.sleep(5 * (attempt + 1))
-                            continue
-                        return []
-                    
-                    if "baseUrl" not in data or "chapter" not in data:
-                        print(f"MangaDex API'den resim verisi alınamadı. Yanıt: {data}")
-                        
-                        # Eğer result varsa ve hata mesajı içeriyorsa
-                        if "result" in data and data["result"] == "error":
-                            print(f"API hata döndü: {data.get('errors', [])}")
-                            
-                            # Bölüm bulunamadı durumunda
-                            if any("Chapter not found" in str(err.get("detail", "")) for err in data.get("errors", [])):
-                                print("Bölüm bulunamadı. MangaDex API değişmiş olabilir veya bölüm mevcut değil.")
-                                # Alternatif bir yaklaşım dene
-                                return self._fallback_get_images(chapter_id)
-                        
-                        # Başarısız denemeden sonra biraz bekle ve tekrar dene
-                        if attempt < max_retries - 1:
-                            time.sleep(5 * (attempt + 1))
-                            continue
-                        return []
-                    
-                    base_url = data["baseUrl"]
-                    chapter_hash = data["chapter"]["hash"]
-                    
-                    # Önce data sonra dataSaver'ı dene (data daha yüksek kaliteli)
-                    if "data" in data["chapter"] and data["chapter"]["data"]:
-                        page_filenames = data["chapter"]["data"]
-                        quality_mode = "data"
-                    elif "dataSaver" in data["chapter"] and data["chapter"]["dataSaver"]:
-                        page_filenames = data["chapter"]["dataSaver"]
-                        quality_mode = "dataSaver"
-                    else:
-                        print("API'den sayfa verileri alınamadı.")
-                        if attempt < max_retries - 1:
-                            time.sleep(5 * (attempt + 1))
-                            continue
-                        return []
-                    
-                    print(f"Resimler için base URL: {base_url}")
-                    print(f"Chapter hash: {chapter_hash}")
-                    print(f"Kalite modu: {quality_mode}")
-                    print(f"Sayfa sayısı: {len(page_filenames)}")
-                    
-                    images = []
-                    
-                    for filename in page_filenames:
-                        # MangaDex API formatına göre URL oluştur
-                        image_url = f"{base_url}/{quality_mode}/{chapter_hash}/{filename}"
-                        images.append(image_url)
-                    
-                    # İlk ve son resim URL'lerini yazdır (debug için)
-                    if images:
-                        print(f"İlk resim URL: {images[0]}")
-                        if len(images) > 1:
-                            print(f"Son resim URL: {images[-1]}")
-                    
-                    return images
-                
-                except requests.exceptions.RequestException as e:
-                    print(f"MangaDex API isteği başarısız (deneme {attempt+1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(5 * (attempt + 1))
-                    else:
-                        print("Maksimum deneme sayısına ulaşıldı.")
-                        return []
+            # Özel header ekle - MangaDex bazen User-Agent ve referrer kontrol eder
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Referer': 'https://mangadex.org/',
+                'Accept': 'application/json'
+            }
+            
+            # Hız sınırı, 429 beklemeleri ve 5xx tekrar denemeleri paylaşılan
+            # HTTP oturumunda yapılır
+            print(f"API isteği gönderiliyor...")
+            try:
+                response = http_client.get(url, headers=headers)
+            except requests.exceptions.RequestException as e:
+                print(f"MangaDex API isteği başarısız: {e}")
+                return []
+            
+            print(f"API yanıt kodu: {response.status_code}")
+            
+            # Hata kodlarını kontrol et
+            if response.status_code != 200:
+                print(f"API hata kodu döndü: {response.status_code}")
+                print(f"API yanıtı: {response.text}")
+                return []
+            
+            try:
+                data = response.json()
+                print(f"API yanıtı alındı, yanıt anahtarları: {list(data.keys())}")
+            except Exception as e:
+                print(f"JSON parse hatası: {e}")
+                print(f"Yanıt içeriği: {response.text[:500]}...")
+                return []
+            
+            if "baseUrl" not in data or "chapter" not in data:
+                print(f"MangaDex API'den resim verisi alınamadı. Yanıt: {data}")
                 
-                except Exception as e:
-                    print(f"MangaDex API'den resim verisi çekerken hata: {e}")
-                    import traceback
-                    print(traceback.format_exc())
-                    if attempt < max_retries - 1:
-                        time.sleep(5 * (attempt + 1))
-                    else:
-                        return []
+                # Eğer result varsa ve hata mesajı içeriyorsa
+                if "result" in data and data["result"] == "error":
+                    print(f"API hata döndü: {data.get('errors', [])}")
+                    
+                    # Bölüm bulunamadı durumunda
+                    if any("Chapter not found" in str(err.get("detail", "")) for err in data.get("errors", [])):
+                        print("Bölüm bulunamadı. MangaDex API değişmiş olabilir veya bölüm mevcut değil.")
+                        # Alternatif bir yaklaşım dene
+                        return self._fallback_get_images(chapter_id)
+                return []
+            
+            images = self._parse_at_home_response(data)
+            if images is None:
+                print("API'den sayfa verileri alınamadı.")
+                return []
+            
+            print(f"Sayfa sayısı: {len(images)}")
+            
+            # İlk ve son resim URL'lerini yazdır (debug için)
+            if images:
+                print(f"İlk resim URL: {images[0]}")
+                if len(images) > 1:
+                    print(f"Son resim URL: {images[-1]}")
+            
+            return images
         
         except Exception as e:
             print(f"Bölüm ID ayıklanırken veya işlenirken hata: {e}")
@@ -303,6 +241,74 @@ class WebtoonScraper(BaseScraper):
             print(traceback.format_exc())
             return []
             
+    def _parse_chapter_feed(self, data):
+        """
+        MangaDex bölüm akışı yanıtını bölüm listesine dönüştür
+        
+        Args:
+            data (dict): `/manga/{id}/feed` yanıtı
+            
+        Returns:
+            list: Bölüm bilgilerinin listesi
+        """
+        chapters = []
+        
+        for chapter in data["data"]:
+            try:
+                chapter_id = chapter["id"]
+                attributes = chapter["attributes"]
+                
+                chapter_num = attributes.get("chapter", "1")
+                title = attributes.get("title", f"Bölüm {chapter_num}")
+                full_title = f"Bölüm {chapter_num}: {title}" if title else f"Bölüm {chapter_num}"
+                
+                # Yayınlanma tarihi
+                publish_date = attributes.get("publishAt", "Bilinmeyen tarih")
+                
+                # Bölüm URL'si
+                chapter_url = f"{self.frontend_url}/chapter/{chapter_id}"
+                
+                chapter_info = {
+                    "title": full_title,
+                    "url": chapter_url,
+                    "date": publish_date
+                }
+                
+                chapters.append(chapter_info)
+            except Exception as e:
+                print(f"Bölüm bilgilerini işlerken hata: {e}")
+        
+        return chapters
+    
+    def _parse_at_home_response(self, data):
+        """
+        MangaDex at-home sunucu yanıtından resim URL'lerini oluştur
+        
+        Args:
+            data (dict): `/at-home/server/{id}` yanıtı
+            
+        Returns:
+            list: Resim URL'leri, yanıtta sayfa verisi yoksa None
+        """
+        if "baseUrl" not in data or "chapter" not in data:
+            return None
+        
+        base_url = data["baseUrl"]
+        chapter_hash = data["chapter"]["hash"]
+        
+        # Önce data sonra dataSaver'ı dene (data daha yüksek kaliteli)
+        if data["chapter"].get("data"):
+            page_filenames = data["chapter"]["data"]
+            quality_mode = "data"
+        elif data["chapter"].get("dataSaver"):
+            page_filenames = data["chapter"]["dataSaver"]
+            quality_mode = "dataSaver"
+        else:
+            return None
+        
+        # MangaDex API formatına göre URL oluştur
+        return [f"{base_url}/{quality_mode}/{chapter_hash}/{filename}" for filename in page_filenames]
+    
     def _fallback_get_images(self, chapter_id):
         """
         MangaDex API başarısız olduğunda alternatif yöntem kullan
@@ -184,6 +184,38 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    // Search autocomplete
+    const searchInput = document.querySelector('input[data-autocomplete-url]');
+    if (searchInput) {
+        const suggestionList = document.getElementById(searchInput.getAttribute('list'));
+        let debounceTimer = null;
+        let lastQuery = '';
+        
+        searchInput.addEventListener('input', function() {
+            clearTimeout(debounceTimer);
+            const query = this.value.trim();
+            if (query.length < 2 || query === lastQuery) {
+                return;
+            }
+            
+            debounceTimer = setTimeout(() => {
+                lastQuery = query;
+                const url = `${this.dataset.autocompleteUrl}?q=${encodeURIComponent(query)}`;
+                fetch(url)
+                .then(response => response.json())
+                .then(data => {
+                    suggestionList.innerHTML = '';
+                    data.results.forEach(result => {
+                        const option = document.createElement('option');
+                        option.value = result.label;
+                        suggestionList.appendChild(option);
+                    });
+                })
+                .catch(error => console.error('Error:', error));
+            }, 150);
+        });
+    }
+    
     // Helper function to get CSRF token from cookies
     function getCookie(name) {
         let cookieValue = null;
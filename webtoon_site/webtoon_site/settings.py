@@ -134,6 +134,175 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Gece çalışan toplu senkronizasyon her webtoon için ayrı görev başlatır
+# (bkz. webtoons.tasks): kaynak sunucu deseni -> aynı anda senkronize
+# edilebilecek en fazla webtoon (bkz. webtoons.sync_slots); sınır yalnızca
+# paylaşılan bir önbellekle (REDIS_CACHE_URL) uygulanır
+SYNC_SOURCE_CONCURRENCY = {
+    '*mangadex.org': 4,
+    '*mangazure.net': 1,
+    '*': 2,
+}
+# Tek webtoon senkronizasyonunun süre sınırı ve toplu çalıştırmanın bitmesi
+# gereken süre (saniye); pencere içinde başlayamayan görevler atlanır
+SYNC_WEBTOON_TIME_LIMIT = 30 * 60
+SYNC_ALL_WINDOW = 4 * 60 * 60
+# MangaDex senkronizasyonunda resim adresleri birlikte (asenkron) çekilen bölüm sayısı
+SYNC_IMAGE_PREFETCH = 10
+
+# Önbellek: REDIS_CACHE_URL ortam değişkeni tanımlıysa Redis (tüm süreçler
+# arasında paylaşılır), değilse süreç içi bellek önbelleği kullanılır.
+# Süreç içi önbellekte `warm_cache` komutu çalışmaz ve senkronizasyon
+# yuvaları uygulanmaz; üretimde Redis önerilir.
+REDIS_CACHE_URL = os.environ.get('REDIS_CACHE_URL', '')
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'KEY_PREFIX': 'webtoon_site',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'webtoon_site',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+# Webtoon detay sayfası verisinin önbellekte tutulma süresi (saniye)
+WEBTOON_CACHE_TIMEOUT = 5 * 60
+# Kategori listesinin önbellekte tutulma süresi (saniye)
+CATEGORY_CACHE_TIMEOUT = 60 * 60
+
+# Görüntülenme sayaçları bellekte biriktirilir ve bu aralıkla (saniye) toplu yazılır
+VIEW_COUNTER_FLUSH_INTERVAL = 10
+# Bu kadar farklı kayıt birikirse tampon beklemeden boşaltılır
+VIEW_COUNTER_MAX_PENDING = 1000
+# Tekrar eden ziyaretleri veritabanına gitmeden elemek için bellekte tutulan
+# (webtoon, kullanıcı/IP) çifti sayısı
+VIEW_DEDUP_CACHE_SIZE = 100000
+# WebtoonsView kayıtlarının toplu eklenirken kullanılacak parti boyutu
+VIEW_LOG_BATCH_SIZE = 500
+# Okuma geçmişi yazımları bu aralıkla (saniye) birleştirilip toplu yazılır
+READING_HISTORY_FLUSH_INTERVAL = 5
+
+# Bölüm okuma sayfası verisinin önbellekte tutulma süresi (saniye)
+READER_CACHE_TIMEOUT = 60 * 60
+
+# Aramada ilgi sırasına göre döndürülecek en fazla sonuç sayısı
+SEARCH_MAX_RESULTS = 1000
+# Otomatik tamamlama indeksinin arka planda tamamen yenilenme aralığı (saniye)
+AUTOCOMPLETE_REFRESH_INTERVAL = 10 * 60
+
+# Ana sayfa bölümlerinin taze sayıldığı süre; sonrasında eski veri sunulurken
+# arka planda yenilenir (saniye)
+HOME_CACHE_FRESH_TIMEOUT = 60
+# Eski verinin en fazla ne kadar süre sunulabileceği (saniye)
+HOME_CACHE_STALE_TIMEOUT = 24 * 60 * 60
+
+# Liste sayfalarında gösterilen yaklaşık toplamın önbellekte tutulma süresi (saniye)
+PAGINATION_COUNT_CACHE_TIMEOUT = 5 * 60
+
+# Bölüm resimleri indirilirken kullanılacak eşzamanlı iş parçacığı sayısı
+IMAGE_DOWNLOAD_WORKERS = 8
+# Aynı sunucuya aynı anda yapılabilecek en fazla indirme
+IMAGE_DOWNLOAD_PER_HOST = 4
+# Resim başına deneme sayısı
+IMAGE_DOWNLOAD_RETRIES = 2
+# İndirilen resimler bu boyuta kadar bellekte tutulur, büyükleri geçici
+# olarak diske taşar; IMAGE_MAX_BYTES'tan büyük yanıtlar reddedilir (bayt)
+IMAGE_SPOOL_MAX_MEMORY = 2 * 1024 * 1024
+IMAGE_MAX_BYTES = 20 * 1024 * 1024
+# 'content': içe aktarılan bölüm sayfaları içeriklerinin özetine göre bir kez
+# saklanır ve tekrar eden resimler paylaşılır (bkz. webtoons.blobs);
+# 'path': her sayfa bölüm klasörüne ayrı dosya olarak yazılır
+IMAGE_STORAGE_MODE = 'content'
+# Okuma sayfası için üretilen küçültülmüş kopyalar (bkz. webtoons.derivatives):
+# genişlikler (piksel) ve tercih sırasına göre biçimler; AVIF yalnızca Pillow
+# destekliyorsa (Pillow 11.3+ veya pillow-avif-plugin) üretilir
+IMAGE_DERIVATIVE_WIDTHS = (480, 800, 1200)
+IMAGE_DERIVATIVE_FORMATS = ('avif', 'webp')
+IMAGE_DERIVATIVE_QUALITY = {'avif': 60, 'webp': 80}
+# Kopyaları üreten süreç havuzunun boyutu (None: işlemci sayısı)
+IMAGE_DERIVATIVE_WORKERS = None
+# Yeni resimlerden sonra bölüm görevinin kuyrukta bekleyeceği süre (saniye)
+IMAGE_DERIVATIVE_DELAY = 30
+# Yeni bölümlerin kopyaları otomatik üretilsin mi. Celery uygulaması yüklüyse
+# (webtoon_site/__init__.py) bölüm görevi kuyruğa alınır; yüklü değilse veya
+# aracıya erişilemezse kopyalar aynı süreçte arka plan thread'inde üretilir.
+# False ise yalnızca generate_image_derivatives komutuyla üretilir.
+IMAGE_DERIVATIVES_AUTO = True
+
+# Liste sayfalarındaki kapak küçük resimleri (bkz. webtoons.covers): boyut adı ->
+# (genişlik, yükseklik); ilk istendiğinde üretilir ve diskte önbelleklenir
+COVER_SIZES = {
+    'thumb': (100, 140),
+    'card': (360, 500),
+    'detail': (600, 840),
+}
+COVER_CACHE_DIR = os.path.join(MEDIA_ROOT, 'cache', 'covers')
+# Önbellek bu boyutu aşarsa en uzun süredir kullanılmayan kapaklar silinir (bayt)
+COVER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Scraper'ların paylaştığı HTTP oturumu (bkz. scrapers.http_client)
+HTTP_CONNECT_TIMEOUT = 10
+HTTP_READ_TIMEOUT = 30
+# Havuzda tutulacak sunucu sayısı ve sunucu başına açık bağlantı sayısı
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 16
+# Bağlantı hataları ve 429/5xx yanıtları için tekrar deneme
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 1.0
+
+# Asenkron scraper motoru (bkz. scrapers.async_scraper): toplam ve sunucu
+# başına aynı anda yapılabilecek en fazla istek
+ASYNC_SCRAPER_CONCURRENCY = 100
+ASYNC_SCRAPER_PER_HOST = 8
+
+# Scraper'ların sunucu başına hız sınırları (bkz. scrapers.rate_limit):
+# sunucu deseni -> (saniyedeki istek, ani yük kapasitesi), ilk eşleşen kullanılır
+SCRAPER_RATE_LIMITS = {
+    'api.mangadex.org': (5, 5),
+    'uploads.mangadex.org': (10, 10),
+    '*.mangadex.network': (20, 20),
+    'mangazure.net': (2, 4),
+    '*.mangazure.net': (2, 4),
+    '*': (10, 10),
+}
+# Tanımlıysa hız sınırı kovaları Redis'te tutulur ve tüm çalışanlar arasında paylaşılır
+SCRAPER_RATE_LIMIT_REDIS_URL = os.environ.get('SCRAPER_RATE_LIMIT_REDIS_URL', REDIS_CACHE_URL)
+
+# Selenium scraper'larının paylaştığı başsız tarayıcı havuzu (bkz. scrapers.browser_pool):
+# süreç başına en fazla tarayıcı, yenilenmeden önce yüklenecek sayfa sayısı ve
+# boştaki tarayıcının kapatılacağı süre (saniye)
+SCRAPER_BROWSER_POOL_SIZE = 2
+SCRAPER_BROWSER_MAX_PAGES = 50
+SCRAPER_BROWSER_IDLE_TIMEOUT = 5 * 60
+
+# Scraper'ların HTML sayfa önbelleği (bkz. scrapers.page_cache): aynı içe aktarmada
+# tekrar istenen sayfalar bu süre (saniye) boyunca diskten okunur, sonra
+# ETag/Last-Modified ile doğrulanır
+SCRAPER_PAGE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'pages')
+SCRAPER_PAGE_CACHE_TTL = 10 * 60
+SCRAPER_PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Selenium sayfaları için site başına bekleme profilleri (bkz. scrapers.waits):
+# sunucu deseni -> {'timeout', 'idle_ms', 'idle_timeout', 'lazy_images', 'selectors'}, ilk eşleşen kullanılır;
+# seçici verilmeyen sayfa türleri için site profilinin seçicileri beklenir
+SCRAPER_WAIT_PROFILES = {
+    '*mangazure.net': {'timeout': 20},
+    '*': {},
+}
+
+# Yerleşik olanlara ek site profilleri (bkz. scrapers.profiles): her sözlük bir
+# SiteProfile'ın parametreleridir; Madara temalı siteler için 'theme': 'madara'
+# yeterlidir, örn. {'name': 'ÖrnekManga', 'hosts': ['ornekmanga.com'],
+# 'base_url': 'https://ornekmanga.com', 'theme': 'madara'}
+SCRAPER_SITE_PROFILES = []
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -6,7 +6,8 @@ from django.template.response import TemplateResponse
 from django.utils.html import format_html
 from .models import (
     Category, Webtoon, Chapter, ChapterImage, Comment, Rating, Bookmark, ReadingHistory,
-    ExternalSource, ImportedWebtoon, ImportedChapter, ImportLog
+    ExternalSource, ImportedWebtoon, ImportedChapter, ImportLog, ImageBlob,
+    ImageDerivative
 )
 from .services import import_webtoon_from_source, sync_webtoon_chapters
 from .forms import ImportWebtoonForm
@@ -43,12 +44,14 @@ class ChapterAdmin(admin.ModelAdmin):
 
 @admin.register(Webtoon)
 class WebtoonAdmin(admin.ModelAdmin):
-    list_display = ['title', 'status', 'published', 'views', 'thumbnail_preview']
+    list_display = ['title', 'status', 'published', 'views', 'rating_avg', 'thumbnail_preview']
     list_filter = ['status', 'published', 'categories']
     search_fields = ['title', 'author', 'artist']
     prepopulated_fields = {'slug': ('title',)}
     inlines = [ChapterInline]
     filter_horizontal = ('categories',)
+    # Filtrelenmiş listelerde ek COUNT(*) sorgusunu atla
+    show_full_result_count = False
     
     def thumbnail_preview(self, obj):
         if obj.thumbnail:
@@ -182,16 +185,24 @@ class ImportedWebtoonAdmin(admin.ModelAdmin):
                     from django.utils.text import slugify
                     import os
                     
-                    # Önce MangaZure scraper'ı içe aktar
-                    from scrapers.mangazure_scraper import MangaZureScraper
+                    from scrapers.engine import ProfileScraper
+                    from scrapers.profiles import get_scraper_for_url
                     
-                    # URL'ye göre uygun scraper'ı seç
-                    if "mangazure.net" in imported_webtoon.original_url.lower():
-                        scraper = MangaZureScraper()
-                        # Detayları çek
-                        details = scraper.get_webtoon_details(imported_webtoon.original_url)
+                    # URL'ye göre uygun scraper'ı seç; kapak zaten varsa detay sayfası çekilmez
+                    scraper = None
+                    if not imported_webtoon.webtoon.thumbnail:
+                        scraper = get_scraper_for_url(imported_webtoon.original_url)
+                        if scraper is not None and not isinstance(scraper, ProfileScraper):
+                            scraper.close()
+                            scraper = None
+                    if scraper is not None:
+                        # Detayları çek (senkronizasyonun çektiği sayfa önbellekten gelir)
+                        try:
+                            details = scraper.get_webtoon_details(imported_webtoon.original_url)
+                        finally:
+                            scraper.close()
                         
-                        if details and details.get('cover_url') and not imported_webtoon.webtoon.thumbnail:
+                        if details and details.get('cover_url'):
                             logger.info(f"Kapak resmi yenileniyor: {details['cover_url']}")
                             
                             # Kapak resmini indir
@@ -202,7 +213,8 @@ class ImportedWebtoonAdmin(admin.ModelAdmin):
                             if thumbnail:
                                 # Webtoon'u güncelle
                                 imported_webtoon.webtoon.thumbnail = thumbnail
-                                imported_webtoon.webtoon.save()
+                                # Görüntülenme ve puan sayaçlarının üzerine yazılmasın
+                                imported_webtoon.webtoon.save(update_fields=['thumbnail', 'updated_date'])
                                 messages.success(request, "Kapak resmi başarıyla güncellendi.")
                                 logger.info("Kapak resmi başarıyla güncellendi.")
                 except Exception as cover_error:
@@ -266,6 +278,19 @@ class ImportLogAdmin(admin.ModelAdmin):
     
     imported_webtoon_title.short_description = "Webtoon"
 
+@admin.register(ImageBlob)
+class ImageBlobAdmin(admin.ModelAdmin):
+    list_display = ('sha256', 'size', 'ref_count', 'created_date')
+    search_fields = ('sha256', 'sources__url')
+    readonly_fields = ('sha256', 'file', 'size', 'ref_count', 'created_date')
+
+@admin.register(ImageDerivative)
+class ImageDerivativeAdmin(admin.ModelAdmin):
+    list_display = ('source', 'width', 'format', 'size', 'created_date')
+    list_filter = ('format', 'width')
+    search_fields = ('source',)
+    readonly_fields = ('source', 'width', 'format', 'file', 'size', 'created_date')
+
 # Admin site başlığını ve index başlığını değiştir
 admin.site.site_header = 'Webtoon Yönetim Paneli'
 admin.site.site_title = 'Webtoon Yönetimi'
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class WebtoonsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'webtoons'
+
+    def ready(self):
+        # Önbellek geçersiz kılma sinyallerini bağla
+        from . import signals  # noqa: F401
@@ -0,0 +1,335 @@
+"""
+Arama kutusu için bellek içi önek (prefix) tabanlı otomatik tamamlama
+
+Webtoon başlıkları, yazar/çizer adları ve kategori adları normalleştirilip
+her kelime başından itibaren birer anahtar olarak sıralı bir diziye eklenir.
+Sorgu, `bisect` ile dizide önekin başladığı yere atlar ve eşleşen kayıtlar
+arasından popülerliği en yüksek olanları döndürür; tuş vuruşu başına
+veritabanına gidilmez. Bir-iki harflik öneklerde eşleşen kayıt sayısı çok
+büyük olabileceğinden bu önekler için en popüler `AUTOCOMPLETE_SHORT_PREFIX_TOP`
+kayıt ayrıca tutulur.
+
+İndeks süreç içidir: süreçteki ilk istekte arka planda oluşturulmaya başlar
+(oluşturma bitene kadar öneri döndürülmez), aynı süreçteki kayıtlar
+sinyallerle artımlı olarak güncellenir, diğer süreçlerdeki değişiklikler ve
+görüntülenme sayıları ise `AUTOCOMPLETE_REFRESH_INTERVAL` saniyede bir arka
+planda yapılan tam yenileme ile yansır.
+"""
+import bisect
+import heapq
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Q
+from django.urls import reverse
+from django.utils.http import urlencode
+
+from .models import Category, Webtoon
+from .search import normalize_text, tokenize
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_REFRESH_INTERVAL = getattr(settings, 'AUTOCOMPLETE_REFRESH_INTERVAL', 10 * 60)
+# Bu uzunluğa kadar olan önekler için en popüler kayıtlar önceden sıralanır
+AUTOCOMPLETE_SHORT_PREFIX_LENGTH = 2
+# Kısa önekler için tutulan en popüler kayıt sayısı (görünümdeki en büyük limit)
+AUTOCOMPLETE_SHORT_PREFIX_TOP = getattr(settings, 'AUTOCOMPLETE_SHORT_PREFIX_TOP', 20)
+# Oluşturma başarısız olursa yeniden denemeden önce beklenecek süre (saniye)
+AUTOCOMPLETE_RETRY_INTERVAL = 60
+
+
+def _prefix_keys(text):
+    """Metnin her kelime başından başlayan normalleştirilmiş anahtarlarını döndür"""
+    words = tokenize(text)
+    return {' '.join(words[i:]) for i in range(len(words))}
+
+
+def _short_prefixes(prefix_keys):
+    """Anahtarların en popüler kayıtları önceden tutulan kısa öneklerini döndür"""
+    return {
+        key[:length]
+        for key in prefix_keys
+        for length in range(1, min(len(key), AUTOCOMPLETE_SHORT_PREFIX_LENGTH) + 1)
+    }
+
+
+class AutocompleteIndex:
+    """
+    Sıralı dizi + bisect ile önek araması yapan otomatik tamamlama indeksi
+
+    Her kayıt ('webtoon', id), ('author', ad) veya ('category', id) şeklinde
+    bir anahtarla tutulur. `_keys` dizisi (önek anahtarı, kayıt anahtarı)
+    çiftlerinden oluşur ve her zaman sıralıdır. `_short` kısa önekle
+    eşleşen kayıtları, `_top` ise bunların puana göre sıralı ilk
+    `AUTOCOMPLETE_SHORT_PREFIX_TOP` tanesini tutar; `_top` kayıtları
+    değiştiğinde silinir ve ilk sorguda yeniden hesaplanır.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._keys = []
+        self._entries = {}
+        self._short = defaultdict(set)
+        self._top = {}
+        # Yazar/çizer adı -> {webtoon_id: görüntülenme}, popülerlik toplamı için
+        self._people = defaultdict(dict)
+        self._webtoon_people = {}
+        self.built_at = None
+        self._refreshing = False
+        self._retry_at = 0
+
+    # Oluşturma
+
+    def build(self):
+        """İndeksi veritabanından baştan oluştur"""
+        entries = {}
+        people = defaultdict(dict)
+        webtoon_people = {}
+
+        webtoons = Webtoon.objects.filter(published=True).only(
+            'id', 'title', 'slug', 'author', 'artist', 'views'
+        )
+        for webtoon in webtoons.iterator(chunk_size=1000):
+            entries[('webtoon', webtoon.id)] = self._webtoon_entry(webtoon)
+            names = self._names(webtoon)
+            webtoon_people[webtoon.id] = names
+            for name in names:
+                people[name][webtoon.id] = webtoon.views
+
+        categories = Category.objects.annotate(
+            webtoon_count=Count('webtoons', filter=Q(webtoons__published=True))
+        )
+        for category in categories:
+            entries[('category', category.id)] = self._category_entry(category, category.webtoon_count)
+
+        for name, views in people.items():
+            entries[('author', name)] = self._person_entry(name, views)
+
+        keys = sorted(
+            (prefix, entry_key)
+            for entry_key, entry in entries.items()
+            for prefix in _prefix_keys(entry['label'])
+        )
+
+        short = defaultdict(set)
+        for prefix, entry_key in keys:
+            for short_prefix in _short_prefixes((prefix,)):
+                short[short_prefix].add(entry_key)
+        top = {
+            short_prefix: self._rank(entries, entry_keys, AUTOCOMPLETE_SHORT_PREFIX_TOP)
+            for short_prefix, entry_keys in short.items()
+        }
+
+        with self._lock:
+            self._keys = keys
+            self._entries = entries
+            self._short = short
+            self._top = top
+            self._people = people
+            self._webtoon_people = webtoon_people
+            self.built_at = time.monotonic()
+        logger.info(f"Otomatik tamamlama indeksi oluşturuldu: {len(entries)} kayıt, {len(keys)} anahtar")
+
+    def ensure_fresh(self):
+        """İndeks hiç oluşturulmadıysa veya eskidiyse arka planda (yeniden) oluştur"""
+        now = time.monotonic()
+        if self.built_at is not None and now - self.built_at < AUTOCOMPLETE_REFRESH_INTERVAL:
+            return
+        if now < self._retry_at:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name='autocomplete-refresh', daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            self.build()
+        except Exception as e:
+            logger.error(f"Otomatik tamamlama indeksi yenilenemedi: {str(e)}")
+            self._retry_at = time.monotonic() + AUTOCOMPLETE_RETRY_INTERVAL
+        finally:
+            self._refreshing = False
+            close_old_connections()
+
+    # Kayıt oluşturucular
+
+    @staticmethod
+    def _names(webtoon):
+        return {name.strip() for name in (webtoon.author, webtoon.artist) if name and name.strip()}
+
+    @staticmethod
+    def _webtoon_entry(webtoon):
+        return {
+            'type': 'webtoon',
+            'label': webtoon.title,
+            'url': reverse('webtoons:webtoon_detail', args=[webtoon.slug]),
+            'score': webtoon.views,
+        }
+
+    @staticmethod
+    def _category_entry(category, webtoon_count):
+        return {
+            'type': 'category',
+            'label': category.name,
+            'url': reverse('webtoons:category_detail', args=[category.slug]),
+            'score': webtoon_count,
+        }
+
+    @staticmethod
+    def _person_entry(name, views):
+        return {
+            'type': 'author',
+            'label': name,
+            'url': f"{reverse('webtoons:search')}?{urlencode({'q': name})}",
+            'score': sum(views.values()),
+        }
+
+    @staticmethod
+    def _rank(entries, entry_keys, limit):
+        return heapq.nlargest(limit, entry_keys, key=lambda entry_key: entries[entry_key]['score'])
+
+    # Artımlı güncelleme (çağıran `_lock`'u tutmalıdır)
+
+    def _put(self, entry_key, entry):
+        self._drop(entry_key)
+        self._entries[entry_key] = entry
+        prefixes = _prefix_keys(entry['label'])
+        for prefix in prefixes:
+            bisect.insort(self._keys, (prefix, entry_key))
+        for short_prefix in _short_prefixes(prefixes):
+            self._short[short_prefix].add(entry_key)
+            self._top.pop(short_prefix, None)
+
+    def _drop(self, entry_key):
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        prefixes = _prefix_keys(entry['label'])
+        for prefix in prefixes:
+            index = bisect.bisect_left(self._keys, (prefix, entry_key))
+            if index < len(self._keys) and self._keys[index] == (prefix, entry_key):
+                del self._keys[index]
+        for short_prefix in _short_prefixes(prefixes):
+            matches = self._short.get(short_prefix)
+            if matches is not None:
+                matches.discard(entry_key)
+                if not matches:
+                    del self._short[short_prefix]
+            self._top.pop(short_prefix, None)
+
+    def _set_person_views(self, name, webtoon_id, views):
+        person = self._people[name]
+        if views is None:
+            person.pop(webtoon_id, None)
+        else:
+            person[webtoon_id] = views
+        if person:
+            self._put(('author', name), self._person_entry(name, person))
+        else:
+            del self._people[name]
+            self._drop(('author', name))
+
+    def update_webtoon(self, webtoon):
+        """Kaydedilen webtoon'u indekste güncelle"""
+        with self._lock:
+            if self.built_at is None:
+                return
+            old_names = self._webtoon_people.pop(webtoon.id, set())
+            for name in old_names:
+                self._set_person_views(name, webtoon.id, None)
+            if not webtoon.published:
+                self._drop(('webtoon', webtoon.id))
+                return
+            self._put(('webtoon', webtoon.id), self._webtoon_entry(webtoon))
+            names = self._names(webtoon)
+            self._webtoon_people[webtoon.id] = names
+            for name in names:
+                self._set_person_views(name, webtoon.id, webtoon.views)
+
+    def remove_webtoon(self, webtoon_id):
+        """Silinen webtoon'u indeksten çıkar"""
+        with self._lock:
+            if self.built_at is None:
+                return
+            for name in self._webtoon_people.pop(webtoon_id, set()):
+                self._set_person_views(name, webtoon_id, None)
+            self._drop(('webtoon', webtoon_id))
+
+    def update_category(self, category):
+        """Kaydedilen kategoriyi indekste güncelle"""
+        with self._lock:
+            if self.built_at is None:
+                return
+            old = self._entries.get(('category', category.id))
+            webtoon_count = old['score'] if old else 0
+            self._put(('category', category.id), self._category_entry(category, webtoon_count))
+
+    def remove_category(self, category_id):
+        """Silinen kategoriyi indeksten çıkar"""
+        with self._lock:
+            if self.built_at is None:
+                return
+            self._drop(('category', category_id))
+
+    # Sorgu
+
+    def suggest(self, query, limit=10):
+        """
+        Sorgu önekiyle başlayan kelimelere sahip en popüler kayıtları döndür
+
+        Args:
+            query (str): Kullanıcının yazdığı metin
+            limit (int): Döndürülecek en fazla öneri sayısı
+
+        Returns:
+            list: {'type', 'label', 'url'} sözlükleri
+        """
+        prefix = ' '.join(tokenize(query))
+        if not prefix:
+            return []
+        # Sorgu kelime ortasında bitmiyorsa son boşluk da önekin parçasıdır
+        if normalize_text(query)[-1:].isspace():
+            prefix += ' '
+
+        with self._lock:
+            entries = self._entries
+            if len(prefix) <= AUTOCOMPLETE_SHORT_PREFIX_LENGTH:
+                best = self._short_prefix_top(prefix, limit)
+            else:
+                keys = self._keys
+                matches = set()
+                index = bisect.bisect_left(keys, (prefix,))
+                while index < len(keys) and keys[index][0].startswith(prefix):
+                    matches.add(keys[index][1])
+                    index += 1
+                best = self._rank(entries, matches, limit)
+            return [
+                {'type': entries[key]['type'], 'label': entries[key]['label'], 'url': entries[key]['url']}
+                for key in best
+            ]
+
+
+    def _short_prefix_top(self, prefix, limit):
+        """Kısa önek için önceden sıralanmış en popüler kayıtlar (çağıran `_lock`'u tutmalıdır)"""
+        matches = self._short.get(prefix, ())
+        if limit > AUTOCOMPLETE_SHORT_PREFIX_TOP:
+            return self._rank(self._entries, matches, limit)
+        top = self._top.get(prefix)
+        if top is None:
+            top = self._top[prefix] = self._rank(self._entries, matches, AUTOCOMPLETE_SHORT_PREFIX_TOP)
+        return top[:limit]
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def suggest(query, limit=10):
+    """Otomatik tamamlama önerilerini döndür, gerekirse indeksi oluştur veya yenile"""
+    autocomplete_index.ensure_fresh()
+    return autocomplete_index.suggest(query, limit=limit)
@@ -0,0 +1,200 @@
+"""
+İçerik adresli resim deposu
+
+`IMAGE_STORAGE_MODE = 'content'` iken bölüm sayfaları içeriklerinin SHA-256
+özetine göre `webtoons/blobs/` altında bir kez saklanır (`ImageBlob`). Aynı
+baytlar (yer tutucu resimler, çevirmen sayfaları, yeniden içe aktarmalar)
+kaç bölümde kullanılırsa kullanılsın diskte tek kopya bulunur;
+`ChapterImage.image` bu dosyanın yolunu gösterir.
+
+İndirilen her URL, `ImageSource` tablosunda vardığı dosyayla eşleştirilir;
+aynı URL tekrar istendiğinde indirme yapılmaz. Dosyalar `ref_count` ile
+referans sayılır ve son bölüm resmi silindiğinde diskten kaldırılır.
+"""
+import hashlib
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from .derivatives import delete_derivatives
+from .models import ChapterImage, ImageBlob, ImageSource
+
+logger = logging.getLogger(__name__)
+
+# 'content': içerik adresli depolama, 'path': bölüm başına ayrı dosyalar
+IMAGE_STORAGE_MODE = getattr(settings, 'IMAGE_STORAGE_MODE', 'content')
+
+# Paralel indirme iş parçacıklarının depo kayıtlarını sırayla yazması için;
+# SQLite eşzamanlı yazma işlemlerinde beklemeden "database is locked" verir
+_write_lock = threading.Lock()
+
+
+def content_addressed_enabled():
+    return IMAGE_STORAGE_MODE == 'content'
+
+
+def url_hash(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def hash_file(image_file):
+    """Dosya içeriğinin SHA-256 özetini hesapla (dosya başa sarılır)"""
+    digest = hashlib.sha256()
+    for chunk in image_file.chunks():
+        digest.update(chunk)
+    image_file.seek(0)
+    return digest.hexdigest()
+
+
+def store_blob(image_file):
+    """
+    Dosyayı içerik adresli depoya yaz, aynı içerik zaten varsa onu kullan
+
+    Args:
+        image_file (File): Uzantısı resim türünü gösteren dosya
+
+    Returns:
+        tuple: (ImageBlob, yeni oluşturuldu mu)
+    """
+    digest = hash_file(image_file)
+    blob = ImageBlob.objects.filter(sha256=digest).first()
+    if blob is not None:
+        return blob, False
+
+    blob = ImageBlob(sha256=digest, size=image_file.size)
+    blob.file.save(image_file.name, image_file, save=False)
+    try:
+        with transaction.atomic():
+            blob.save()
+    except IntegrityError:
+        # Aynı içerik eş zamanlı olarak başka bir işlem tarafından kaydedildi;
+        # depolama yeni dosyaya farklı bir ad verdiğinden yalnızca bizimki silinir
+        blob.file.storage.delete(blob.file.name)
+        return ImageBlob.objects.get(sha256=digest), False
+    return blob, True
+
+
+def lookup_url(url):
+    """URL daha önce indirildiyse eşleştiği dosyayı döndür, yoksa None"""
+    source = ImageSource.objects.filter(url_hash=url_hash(url)).select_related('blob').first()
+    return source.blob if source else None
+
+
+def remember_url(url, blob):
+    """URL'nin hangi dosyaya vardığını kaydet"""
+    ImageSource.objects.update_or_create(url_hash=url_hash(url), defaults={'url': url[:1000], 'blob': blob})
+
+
+def fetch_blob(url, file_name=None):
+    """
+    URL'deki resmi içerik adresli depoya al
+
+    URL daha önce indirildiyse ağa çıkılmaz.
+
+    Returns:
+        ImageBlob: Resim dosyası, indirilemezse None
+    """
+    blob = lookup_url(url)
+    if blob is not None:
+        logger.info(f"Resim zaten depoda, indirme atlandı: {url}")
+        return blob
+
+    # Döngüsel içe aktarmayı önlemek için burada içe aktarılır
+    from .services import download_image_to_django
+
+    image_file = download_image_to_django(url, file_name)
+    if image_file is None:
+        return None
+    try:
+        with _write_lock:
+            blob, created = store_blob(image_file)
+            remember_url(url, blob)
+    finally:
+        image_file.close()
+    if not created:
+        logger.info(f"Aynı içerik zaten depoda: {url} -> {blob.sha256}")
+    return blob
+
+
+def create_chapter_image(chapter, order, page):
+    """
+    Bölüme resim ekle
+
+    Args:
+        chapter (Chapter): Bölüm
+        order (int): Sayfa sırası
+        page (ImageBlob | File): İçerik adresli dosya veya yüklenecek dosya
+
+    Returns:
+        ChapterImage: Oluşturulan kayıt, dosya bu arada silindiyse None
+    """
+    if not isinstance(page, ImageBlob):
+        return ChapterImage.objects.create(chapter=chapter, image=page, order=order)
+
+    with transaction.atomic():
+        if not ImageBlob.objects.filter(pk=page.pk).update(ref_count=F('ref_count') + 1):
+            logger.error(f"İçerik adresli dosya bulunamadı: {page.sha256}")
+            return None
+        return ChapterImage.objects.create(chapter=chapter, image=page.file.name, order=order, blob=page)
+
+
+def release_blob(blob_id):
+    """Dosyanın referans sayısını azalt, kullanan kalmadıysa dosyayı sil"""
+    with transaction.atomic():
+        ImageBlob.objects.filter(pk=blob_id).update(ref_count=F('ref_count') - 1)
+        blob = ImageBlob.objects.select_for_update().filter(pk=blob_id, ref_count__lte=0).first()
+        if blob is None or blob.chapter_images.exists():
+            return
+        delete_blob(blob)
+
+
+def delete_blob(blob):
+    """Dosya kaydını sil; dosya işlem onaylandıktan sonra diskten kaldırılır"""
+    storage, name = blob.file.storage, blob.file.name
+    blob.delete()
+    delete_derivatives(name)
+    transaction.on_commit(lambda: storage.delete(name))
+
+
+def reconcile_blob_refcounts(dry_run=False):
+    """
+    `ref_count` değerlerini ChapterImage kayıtlarından yeniden hesapla
+
+    Returns:
+        list: Sayısı düzeltilen (veya dry_run ise düzeltilecek) dosyalar
+    """
+    changed = []
+    for blob in ImageBlob.objects.annotate(actual=Count('chapter_images')).iterator():
+        if blob.ref_count != blob.actual:
+            changed.append(blob)
+            if not dry_run:
+                ImageBlob.objects.filter(pk=blob.pk).update(ref_count=blob.actual)
+    return changed
+
+
+def prune_unreferenced_blobs(min_age=timedelta(hours=24), dry_run=False):
+    """
+    Hiçbir bölüm resminin kullanmadığı dosyaları sil
+
+    Bölüm kaydı oluşturulamadan yarıda kalan içe aktarmalardan artan dosyalar
+    bu şekilde temizlenir. Yeni indirilip henüz bölüme eklenmemiş dosyalara
+    dokunmamak için `min_age`'den yeni olanlar atlanır.
+
+    Returns:
+        list: Silinen (veya dry_run ise silinecek) dosyalar
+    """
+    candidates = list(
+        ImageBlob.objects.filter(ref_count__lte=0, created_date__lt=timezone.now() - min_age)
+        .annotate(actual=Count('chapter_images'))
+        .filter(actual=0)
+    )
+    if not dry_run:
+        for blob in candidates:
+            with transaction.atomic():
+                delete_blob(blob)
+    return candidates
@@ -0,0 +1,362 @@
+"""
+Sık yazılan verileri (görüntülenme sayaçları vb.) bellekte biriktirip
+veritabanına toplu halde yazan tamponlar
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# Görüntülenme sayaçları veritabanına yazıldıktan sonra gönderilir;
+# `models` argümanı sayaçları güncellenen model sınıflarının kümesidir.
+views_flushed = Signal()
+
+
+class WriteBehindBuffer:
+    """
+    Süreç içi (process-local) yazma tamponu için temel sınıf.
+
+    Kayıtlar `add` ile anahtar bazında birleştirilerek biriktirilir ve arka
+    planda çalışan bir thread tarafından `flush_interval` saniyede bir
+    veritabanına yazılır. Bekleyen kayıt sayısı `max_pending` değerini
+    aşarsa tampon, isteği yapan thread içinde hemen boşaltılır.
+
+    Alt sınıflar `_merge` ve `_write` metodlarını uygulamalıdır. `_write`
+    tek bir transaction içinde çalışır; yazma başarılı olduktan sonra
+    yapılacak işler `_after_write` içinde yapılır.
+    """
+
+    def __init__(self, flush_interval=10, max_pending=1000):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._worker = None
+        atexit.register(self.flush)
+
+    def _merge(self, pending, key, value):
+        """Yeni kaydı bekleyen kayıtlarla birleştir"""
+        raise NotImplementedError
+
+    def _write(self, batch):
+        """Biriktirilen kayıtları veritabanına yaz"""
+        raise NotImplementedError
+
+    def _after_write(self, batch):
+        """Kayıtlar veritabanına yazıldıktan sonra çağrılır"""
+
+    def add(self, key, value):
+        """
+        Tampona bir kayıt ekle
+
+        Args:
+            key: Kaydın birleştirileceği anahtar
+            value: Eklenecek değer
+        """
+        with self._lock:
+            self._merge(self._pending, key, value)
+            full = len(self._pending) >= self.max_pending
+        self._ensure_worker()
+        if full:
+            self.flush()
+
+    def get_pending(self, key, default=None):
+        """Henüz yazılmamış kaydı döndür"""
+        with self._lock:
+            return self._pending.get(key, default)
+
+    def flush(self):
+        """
+        Bekleyen kayıtları veritabanına yaz
+
+        Returns:
+            int: Yazılan kayıt (anahtar) sayısı
+        """
+        # Aynı anda yalnızca bir thread boşaltma yapabilir, diğerleri beklemez
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        try:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                # Kısmi yazma olmasın; hata durumunda tüm grup geri alınır
+                with transaction.atomic():
+                    self._write(batch)
+            except Exception as e:
+                logger.error(f"Tampon yazılırken hata: {e}")
+                # Kayıtları kaybetmemek için tampona geri koy
+                with self._lock:
+                    for key, value in batch.items():
+                        self._merge(self._pending, key, value)
+                return 0
+            # Kayıtlar artık yazıldı; buradaki hatalar tamponu geri doldurmamalı
+            try:
+                self._after_write(batch)
+            except Exception as e:
+                logger.error(f"Tampon yazıldıktan sonra hata: {e}")
+            return len(batch)
+        finally:
+            self._flush_lock.release()
+
+    def _ensure_worker(self):
+        """Arka plan boşaltma thread'ini gerekirse başlat"""
+        # fork sonrası thread'ler kopyalanmadığı için her süreçte yeniden başlatılır
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name=f"{self.__class__.__name__}-flusher", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+
+class ViewCounterBuffer(WriteBehindBuffer):
+    """
+    Görüntülenme sayaçlarını biriktirir.
+
+    Artışlar (model, pk) anahtarı ile toplanır ve aynı artış miktarına sahip
+    satırlar tek bir `UPDATE ... SET views = views + n` sorgusuyla yazılır.
+    `QuerySet.update` kullanıldığı için `auto_now` alanları (ör.
+    `Webtoon.updated_date`) değişmez ve tüm satır yeniden yazılmaz.
+    """
+
+    def _merge(self, pending, key, value):
+        pending[key] = pending.get(key, 0) + value
+
+    def _write(self, batch):
+        # (model, artış) -> [pk, ...]
+        groups = defaultdict(list)
+        for (model, pk), delta in batch.items():
+            groups[(model, delta)].append(pk)
+
+        for (model, delta), pks in groups.items():
+            model.objects.filter(pk__in=pks).update(views=F('views') + delta)
+
+    def _after_write(self, batch):
+        # Alıcı hataları Django tarafından loglanır, sayaçlar tekrar yazılmaz
+        views_flushed.send_robust(sender=self.__class__, models={model for model, _ in batch})
+
+
+view_counter = ViewCounterBuffer(
+    flush_interval=getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 10),
+    max_pending=getattr(settings, 'VIEW_COUNTER_MAX_PENDING', 1000),
+)
+
+
+def record_view(model, pk, count=1):
+    """
+    Bir Webtoon veya Chapter için görüntülenme kaydet
+
+    Args:
+        model (type): Webtoon veya Chapter modeli
+        pk (int): Görüntülenen kaydın ID'si
+        count (int): Artış miktarı
+    """
+    view_counter.add((model, pk), count)
+
+
+def pending_views(model, pk):
+    """Bir kayıt için henüz veritabanına yazılmamış görüntülenme sayısı"""
+    return view_counter.get_pending((model, pk), 0)
+
+
+class SeenSet:
+    """
+    Boyutu sınırlı, thread-safe LRU küme.
+
+    Veritabanına gitmeden "bu ziyaretçi bu webtoon'u daha önce gördü mü?"
+    sorusunu yanıtlamak için kullanılır. Küme dolduğunda en uzun süredir
+    kullanılmayan anahtar atılır; atılan bir anahtar tekrar gelirse son
+    kontrol veritabanındaki benzersizlik kısıtlarıyla yapılır.
+    """
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        """
+        Anahtarı kümeye ekle
+
+        Returns:
+            bool: Anahtar yeni eklendiyse True, zaten varsa False
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return False
+            self._items[key] = None
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+            return True
+
+
+class ViewLogBuffer(WriteBehindBuffer):
+    """
+    Benzersiz görüntülenme kayıtlarını (WebtoonsView) biriktirir.
+
+    Anahtar (webtoon_id, user_id, ip_address) üçlüsüdür; giriş yapmış
+    kullanıcılar için yalnızca user_id, anonim ziyaretçiler için yalnızca
+    ip_address doldurulur. Boşaltma sırasında veritabanında zaten bulunan
+    kayıtlar ayıklanır, yeniler `ignore_conflicts` ile toplu eklenir ve her
+    webtoon için gerçekten eklenen kayıt sayısı görüntülenme sayacına
+    aktarılır.
+    """
+
+    def __init__(self, batch_size=500, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_size = batch_size
+
+    def _merge(self, pending, key, value):
+        pending.setdefault(key, value)
+
+    def _write(self, batch):
+        from .models import Webtoon, WebtoonsView
+
+        keys = set(batch)
+        webtoon_ids = {webtoon_id for webtoon_id, _, _ in keys}
+        user_ids = {user_id for _, user_id, _ in keys if user_id is not None}
+        ips = {ip for _, user_id, ip in keys if user_id is None}
+
+        # Tek sorguda veritabanında zaten bulunan ziyaretleri ayıkla
+        existing_filter = Q()
+        if user_ids:
+            existing_filter |= Q(user_id__in=user_ids)
+        if ips:
+            existing_filter |= Q(ip_address__in=ips)
+        existing = WebtoonsView.objects.filter(
+            existing_filter, webtoon_id__in=webtoon_ids
+        ).values_list('webtoon_id', 'user_id', 'ip_address')
+        for webtoon_id, user_id, ip in existing:
+            # Her iki benzersizlik kısıtı da ayrı ayrı çakışmaya yol açar
+            keys.discard((webtoon_id, user_id, None))
+            keys.discard((webtoon_id, None, ip))
+
+        if not keys:
+            return
+
+        WebtoonsView.objects.bulk_create(
+            [
+                WebtoonsView(webtoon_id=webtoon_id, user_id=user_id, ip_address=ip)
+                for webtoon_id, user_id, ip in keys
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+        # Sayaç, eklenen benzersiz ziyaretlerden türetilir
+        new_views = defaultdict(int)
+        for webtoon_id, _, _ in keys:
+            new_views[webtoon_id] += 1
+        for webtoon_id, count in new_views.items():
+            view_counter.add((Webtoon, webtoon_id), count)
+
+
+seen_views = SeenSet(max_size=getattr(settings, 'VIEW_DEDUP_CACHE_SIZE', 100000))
+
+view_log = ViewLogBuffer(
+    batch_size=getattr(settings, 'VIEW_LOG_BATCH_SIZE', 500),
+    flush_interval=getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 10),
+    max_pending=getattr(settings, 'VIEW_COUNTER_MAX_PENDING', 1000),
+)
+
+
+def record_unique_view(webtoon, user=None, ip_address=None):
+    """
+    Bir webtoon için benzersiz ziyaretçi görüntülenmesi kaydet
+
+    Ziyaretçi giriş yapmışsa kullanıcıya, yapmamışsa IP adresine göre
+    tekilleştirilir. Aynı ziyaretçinin tekrar eden görüntülemeleri bellekteki
+    LRU küme tarafından veritabanına gitmeden elenir.
+
+    Args:
+        webtoon (Webtoon): Görüntülenen webtoon
+        user (User, optional): Giriş yapmış kullanıcı
+        ip_address (str, optional): Ziyaretçinin IP adresi
+
+    Returns:
+        bool: Görüntülenme yeni bir ziyaretçiye aitse True
+    """
+    if user is not None and user.is_authenticated:
+        key = (webtoon.pk, user.pk, None)
+    elif ip_address:
+        key = (webtoon.pk, None, ip_address)
+    else:
+        return False
+
+    if not seen_views.add(key):
+        return False
+
+    view_log.add(key, None)
+    return True
+
+
+class ReadingHistoryBuffer(WriteBehindBuffer):
+    """
+    Okuma geçmişi yazımlarını biriktirir.
+
+    Aynı (user_id, chapter_id) çifti için tampon süresi içinde gelen tüm
+    okumalar tek kayda indirgenir ve boşaltmada tek bir toplu upsert
+    (`bulk_create(update_conflicts=True)`) ile yazılır. `last_read` alanı
+    `auto_now` olduğu için yazma anındaki zamanı alır.
+    """
+
+    def __init__(self, batch_size=500, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_size = batch_size
+
+    def _merge(self, pending, key, value):
+        pending[key] = value
+
+    def _write(self, batch):
+        from .models import ReadingHistory
+
+        ReadingHistory.objects.bulk_create(
+            [
+                ReadingHistory(user_id=user_id, chapter_id=chapter_id)
+                for user_id, chapter_id in batch
+            ],
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['user', 'chapter'],
+            update_fields=['last_read'],
+        )
+
+
+reading_history = ReadingHistoryBuffer(
+    flush_interval=getattr(settings, 'READING_HISTORY_FLUSH_INTERVAL', 5),
+    max_pending=getattr(settings, 'VIEW_COUNTER_MAX_PENDING', 1000),
+)
+
+
+def record_reading(user, chapter_id):
+    """
+    Kullanıcının bir bölümü okuduğunu kaydet (tamponda biriktirilir)
+
+    Args:
+        user (User): Giriş yapmış kullanıcı
+        chapter_id (int): Okunan bölümün ID'si
+    """
+    reading_history.add((user.pk, chapter_id), None)
@@ -0,0 +1,162 @@
+"""
+Sürümlü önbellek anahtarları ve nesne/sayfa verisi önbellekleri
+
+Anahtarlar `<ad alanı>:v<şema sürümü>:g<nesil>:<parçalar>` biçimindedir.
+Şema sürümü (`CACHE_KEY_VERSION`) önbelleğe yazılan verinin yapısı
+değiştiğinde artırılır; böylece yeni sürüm eski biçimdeki verileri hiç okumaz.
+Nesil ise ad alanı başına önbellekte tutulan bir sayaçtır; `bump_generation`
+ile artırıldığında o ad alanındaki tüm anahtarlar tek işlemle geçersiz olur
+(eski kayıtlar zaman aşımıyla kendiliğinden silinir). Sayaç önbellekten
+düşerse (LocMem ayıklaması, Redis LRU) yeniden zamana dayalı bir değerle
+başlatılır; böylece eski nesillerin anahtarları tekrar geçerli hale gelmez.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import Count
+
+from .models import Category, Chapter, Webtoon
+
+logger = logging.getLogger(__name__)
+
+# Önbelleğe yazılan verilerin yapısı değiştiğinde artırın
+CACHE_KEY_VERSION = 1
+
+WEBTOON_CACHE_TIMEOUT = getattr(settings, 'WEBTOON_CACHE_TIMEOUT', 5 * 60)
+CATEGORY_CACHE_TIMEOUT = getattr(settings, 'CATEGORY_CACHE_TIMEOUT', 60 * 60)
+
+
+def cache_is_shared():
+    """Varsayılan önbellek tüm çalışan süreçler arasında paylaşılıyor mu"""
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def _generation_key(namespace):
+    return f"gen:{namespace}"
+
+
+def _new_generation():
+    # Mikrosaniye cinsinden zaman; daha önce verilmiş (ve artırılmış) bir
+    # nesille çakışmaz, sabit bir başlangıç değeri ise eski anahtarları diriltir
+    return time.time_ns() // 1000
+
+
+def get_generation(namespace):
+    """Ad alanının geçerli nesil numarasını döndür"""
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # Nesil sayaçları hiçbir zaman zaman aşımına uğramamalı
+        generation = _new_generation()
+        cache.add(key, generation, None)
+        generation = cache.get(key, generation)
+    return generation
+
+
+def bump_generation(namespace):
+    """Ad alanındaki tüm anahtarları geçersiz kılmak için nesli artır"""
+    key = _generation_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Sayaç yoksa (veya silinmişse) yeni bir nesille başlat
+        cache.add(key, _new_generation(), None)
+
+
+def versioned_key(namespace, *parts):
+    """
+    Ad alanı için sürümlü önbellek anahtarı oluştur
+
+    Args:
+        namespace (str): Anahtar grubu, ör. 'webtoon' veya 'reader:solo-leveling'
+        *parts: Anahtarın geri kalanı
+
+    Returns:
+        str: Önbellek anahtarı
+    """
+    return ':'.join(
+        [namespace, f"v{CACHE_KEY_VERSION}", f"g{get_generation(namespace)}"] + [str(part) for part in parts]
+    )
+
+
+def get_or_build(key, builder, timeout):
+    """
+    Anahtarı önbellekten oku, yoksa `builder()` ile oluşturup yaz
+
+    `builder` None döndürürse sonuç önbelleğe yazılmaz.
+    """
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        if value is not None:
+            cache.set(key, value, timeout)
+    return value
+
+
+# Webtoon detay sayfası
+
+def webtoon_detail_key(slug):
+    return versioned_key('webtoon', slug)
+
+
+def build_webtoon_detail(slug):
+    """
+    Webtoon detay sayfasının kullanıcıdan bağımsız kısmını topla
+
+    Returns:
+        dict: Kategorileri önceden yüklenmiş webtoon ve yayındaki bölümler,
+            webtoon yoksa None
+    """
+    webtoon = Webtoon.objects.filter(slug=slug, published=True).prefetch_related('categories').first()
+    if webtoon is None:
+        return None
+    chapters = list(
+        Chapter.objects.filter(webtoon_id=webtoon.id, published=True)
+        .order_by('number')
+        .only('id', 'webtoon_id', 'number', 'title', 'release_date', 'views')
+    )
+    return {'webtoon': webtoon, 'chapters': chapters}
+
+
+def get_webtoon_detail(slug):
+    """Webtoon detay verisini önbellekten getir, yoksa oluştur"""
+    return get_or_build(webtoon_detail_key(slug), lambda: build_webtoon_detail(slug), WEBTOON_CACHE_TIMEOUT)
+
+
+def invalidate_webtoon_detail(*slugs):
+    """Verilen slug'lara ait webtoon detay verilerini önbellekten sil"""
+    cache.delete_many([webtoon_detail_key(slug) for slug in slugs if slug])
+
+
+def invalidate_all_webtoon_details():
+    """Tüm webtoon detay verilerini geçersiz kıl (ör. kategori adı değiştiğinde)"""
+    bump_generation('webtoon')
+
+
+# Kategori listesi
+
+def build_category_list():
+    """Webtoon sayılarıyla birlikte tüm kategoriler"""
+    return list(Category.objects.annotate(webtoon_count=Count('webtoons')))
+
+
+def get_category_list():
+    """Kategori listesini önbellekten getir, yoksa oluştur"""
+    return get_or_build(versioned_key('categories', 'list'), build_category_list, CATEGORY_CACHE_TIMEOUT)
+
+
+def get_category(slug):
+    """Kategoriyi önbellekteki listeden slug ile bul, yoksa None"""
+    for category in get_category_list():
+        if category.slug == slug:
+            return category
+    return None
+
+
+def invalidate_category_lists():
+    """Kategori listelerini geçersiz kıl"""
+    bump_generation('categories')
@@ -0,0 +1,273 @@
+"""
+Liste sayfaları için kapak küçük resimleri
+
+Kapaklar sabit boyutlarda (`COVER_SIZES`) ilk istendiklerinde üretilir ve
+`COVER_CACHE_DIR` altında diskte saklanır; sonraki istekler veritabanına
+gitmeden dosyadan sunulur. Önbellek `COVER_CACHE_MAX_BYTES` boyutunu
+aştığında en uzun süredir kullanılmayan dosyalar silinir (LRU; kullanım
+zamanı dosyanın değiştirilme zamanında tutulur).
+
+URL'ler kapak dosyasının adından ve webtoon'un güncellenme zamanından
+türetilen bir sürüm içerir, bu yüzden tarayıcılar dosyayı süresiz
+önbelleğe alabilir. Kapağı olmayan webtoonlar için başlıklı bir yer tutucu
+kapak aynı şekilde üretilir.
+
+Yayınlanmamış webtoonların kapakları (yalnızca yöneticilere gösterilir)
+ayrı bir `private` alt dizininde tutulur; veritabanına gitmeyen hızlı yol
+yalnızca genel dizine baktığı için bu dosyalar ziyaretçilere sunulmaz.
+"""
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.urls import reverse
+
+from . import imaging
+
+logger = logging.getLogger(__name__)
+
+# Boyut adı -> (genişlik, yükseklik); kartlar 250px yüksekliğinde gösterilir,
+# yüksek çözünürlüklü ekranlar için iki katı üretilir
+COVER_SIZES = getattr(settings, 'COVER_SIZES', {
+    'thumb': (100, 140),
+    'card': (360, 500),
+    'detail': (600, 840),
+})
+COVER_CACHE_DIR = getattr(settings, 'COVER_CACHE_DIR', os.path.join(settings.MEDIA_ROOT, 'cache', 'covers'))
+COVER_CACHE_MAX_BYTES = getattr(settings, 'COVER_CACHE_MAX_BYTES', 256 * 1024 * 1024)
+COVER_QUALITY = getattr(settings, 'COVER_QUALITY', 80)
+# Bir dosyanın kullanım zamanı en fazla bu sıklıkla güncellenir (saniye)
+COVER_TOUCH_INTERVAL = 60 * 60
+
+COVER_PLACEHOLDER_BACKGROUND = (50, 50, 150)
+
+_cache_lock = threading.Lock()
+# Önbellekteki toplam boyut tahmini; ilk yazmada dizin taranarak hesaplanır
+_cache_bytes = None
+
+
+def cover_format():
+    """Kapakların kodlanacağı biçim ve MIME türü"""
+    if imaging.supported_formats(['webp']):
+        return 'webp', 'image/webp'
+    return 'jpeg', 'image/jpeg'
+
+
+def cover_version(thumbnail_name, updated_date):
+    """Kapak veya başlık değiştiğinde değişen kısa sürüm anahtarı"""
+    stamp = updated_date.timestamp() if updated_date else 0
+    return hashlib.md5(f"{thumbnail_name or ''}|{stamp}".encode('utf-8')).hexdigest()[:10]
+
+
+def cover_url(webtoon, size='card'):
+    """
+    Webtoon kapağının istenen boyuttaki küçük resminin URL'si
+
+    Args:
+        webtoon (Webtoon): `id`, `thumbnail` ve `updated_date` alanları yüklü webtoon
+        size (str): COVER_SIZES içindeki boyut adı
+
+    Returns:
+        str: Kapak URL'si; kapak yoksa yer tutucu kapağı gösterir
+    """
+    version = cover_version(webtoon.thumbnail.name if webtoon.thumbnail else '', webtoon.updated_date)
+    return f"{reverse('webtoons:webtoon_cover', args=[webtoon.id, size])}?v={version}"
+
+
+def cache_path(webtoon_id, size, version, public=True):
+    """Önbellekteki kapak dosyasının yolu; yayınlanmamış kapaklar ayrı dizindedir"""
+    ext = cover_format()[0]
+    directory = os.path.join(COVER_CACHE_DIR, str(webtoon_id))
+    if not public:
+        directory = os.path.join(directory, 'private')
+    return os.path.join(directory, f"{size}-{version}.{ext}")
+
+
+def cached_cover(path):
+    """Önbellekteki dosyanın yolunu döndür ve kullanım zamanını güncelle, yoksa None"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+    if time.time() - mtime > COVER_TOUCH_INTERVAL:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    return path
+
+
+def _load_font(size):
+    from PIL import ImageFont
+
+    # Windows için yaygın fontlar
+    font_paths = [
+        'C:\\Windows\\Fonts\\Arial.ttf',
+        'C:\\Windows\\Fonts\\calibri.ttf',
+        'C:\\Windows\\Fonts\\segoeui.ttf'
+    ]
+    for path in font_paths:
+        if os.path.exists(path):
+            try:
+                return ImageFont.truetype(path, size)
+            except Exception:
+                break
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow 10.1 öncesinde boyut verilemez
+        return ImageFont.load_default()
+
+
+def render_placeholder(title, width, height):
+    """Kapağı olmayan webtoon için başlık içeren basit bir kapak çiz"""
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (width, height), color=COVER_PLACEHOLDER_BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    font = _load_font(max(10, width // 15))
+
+    # Başlığı hazırla (maksimum 30 karakter)
+    title_text = title[:27] + "..." if len(title) > 30 else title
+    for text, fill, offset in ((title_text, (255, 255, 255), 0), ("No Cover Available", (200, 200, 200), height // 8)):
+        text_width, text_height = draw.textbbox((0, 0), text, font=font)[2:4]
+        draw.text(((width - text_width) // 2, (height - text_height) // 2 + offset), text, fill=fill, font=font)
+    return img
+
+
+def render_cover(source, title, size):
+    """
+    Kapağı istenen boyuta kırparak küçült ve kodla
+
+    Args:
+        source (file): Orijinal kapak dosyası, yoksa None
+        title (str): Yer tutucu kapakta yazacak başlık
+        size (str): COVER_SIZES içindeki boyut adı
+
+    Returns:
+        bytes: Kodlanmış küçük resim
+    """
+    from PIL import Image, ImageOps
+
+    width, height = COVER_SIZES[size]
+    img = None
+    if source is not None:
+        try:
+            with Image.open(source) as original:
+                # JPEG'lerde küçültme çözme sırasında yapılır, tam boyut belleğe açılmaz
+                original.draft('RGB', (width * 2, height * 2))
+                img = ImageOps.fit(ImageOps.exif_transpose(original).convert('RGB'), (width, height), Image.LANCZOS)
+        except Exception as e:
+            logger.warning(f"Kapak okunamadı, yer tutucu kullanılıyor: {e}")
+    if img is None:
+        img = render_placeholder(title, width, height)
+
+    fmt = cover_format()[0]
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt.upper(), quality=COVER_QUALITY)
+    return buffer.getvalue()
+
+
+def build_cover(webtoon, size, path):
+    """Küçük resmi üretip önbelleğe yaz"""
+    source = None
+    if webtoon.thumbnail:
+        try:
+            source = webtoon.thumbnail.open('rb')
+        except (FileNotFoundError, OSError) as e:
+            logger.warning(f"Kapak dosyası bulunamadı: {webtoon.thumbnail.name}: {e}")
+    try:
+        data = render_cover(source, webtoon.title, size)
+    finally:
+        if source is not None:
+            source.close()
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Eş zamanlı istekler yarım dosya görmesin diye geçici dosyaya yazıp taşı
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _account(len(data))
+    return path
+
+
+def _scan_cache():
+    """Önbellekteki dosyaları (değiştirilme zamanı, boyut, yol) olarak listele"""
+    entries = []
+    for root, _dirs, files in os.walk(COVER_CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def _account(size):
+    """Yeni dosyayı toplam boyuta ekle, sınır aşıldıysa eski dosyaları sil"""
+    global _cache_bytes
+    with _cache_lock:
+        if _cache_bytes is None:
+            _cache_bytes = sum(entry[1] for entry in _scan_cache())
+        else:
+            _cache_bytes += size
+        if _cache_bytes > COVER_CACHE_MAX_BYTES:
+            _cache_bytes = evict(int(COVER_CACHE_MAX_BYTES * 0.9))
+
+
+def evict(target_bytes):
+    """
+    Toplam boyut `target_bytes` altına inene kadar en eski dosyaları sil
+
+    Returns:
+        int: Kalan toplam boyut
+    """
+    entries = sorted(_scan_cache())
+    total = sum(entry[1] for entry in entries)
+    removed = 0
+    for _mtime, size, path in entries:
+        if total <= target_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"Kapak önbelleğinden {removed} dosya silindi")
+    return total
+
+
+def clear_cover_cache(webtoon_id):
+    """Bir webtoon'un önbellekteki tüm kapaklarını sil"""
+    global _cache_bytes
+    directory = os.path.join(COVER_CACHE_DIR, str(webtoon_id))
+    if not os.path.isdir(directory):
+        return
+    for root, dirs, files in os.walk(directory, topdown=False):
+        for name in files:
+            try:
+                os.remove(os.path.join(root, name))
+            except FileNotFoundError:
+                pass
+        try:
+            os.rmdir(root)
+        except OSError:
+            pass
+    with _cache_lock:
+        _cache_bytes = None
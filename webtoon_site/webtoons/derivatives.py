@@ -0,0 +1,283 @@
+"""
+Bölüm resimlerinin duyarlı (responsive) okuyucu kopyaları
+
+Her bölüm resmi için `IMAGE_DERIVATIVE_WIDTHS` genişliklerinde WebP ve
+Pillow destekliyorsa AVIF kopyaları üretilir (`ImageDerivative`). Okuma
+sayfası bunları `<picture>`/`srcset` ile sunar; tarayıcı ekran genişliğine ve
+desteklediği biçime göre en küçük uygun dosyayı indirir.
+
+Kopyalar istek sırasında üretilmez. Yeni resim eklendiğinde bölüm için
+gecikmeli bir Celery görevi kuyruğa alınır; Celery uygulaması yüklenmemişse
+(aracı yapılandırılmamışsa) ya da kuyruğa erişilemezse bölüm aynı süreçte
+arka plan thread'inde işlenir. Birikmiş resimler `generate_image_derivatives`
+komutuyla süreç havuzunda işlenir. Kopyası henüz üretilmemiş resimler
+orijinal dosyayla gösterilir.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, close_old_connections, transaction
+
+from . import imaging, reader
+from .models import ChapterImage, ImageDerivative
+
+logger = logging.getLogger(__name__)
+
+# Üretilecek genişlikler (piksel)
+IMAGE_DERIVATIVE_WIDTHS = getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (480, 800, 1200))
+# Tercih sırasına göre biçimler; kurulu Pillow'un kaydedemedikleri atlanır
+IMAGE_DERIVATIVE_FORMATS = getattr(settings, 'IMAGE_DERIVATIVE_FORMATS', ('avif', 'webp'))
+IMAGE_DERIVATIVE_QUALITY = getattr(settings, 'IMAGE_DERIVATIVE_QUALITY', {'avif': 60, 'webp': 80})
+# Süreç havuzundaki çalışan sayısı (varsayılan: işlemci sayısı)
+IMAGE_DERIVATIVE_WORKERS = getattr(settings, 'IMAGE_DERIVATIVE_WORKERS', None) or os.cpu_count() or 1
+# Yeni resimler eklendikten sonra bölüm görevinin bekleyeceği süre (saniye);
+# bu sürede eklenen tüm sayfalar tek görevde işlenir
+IMAGE_DERIVATIVE_DELAY = getattr(settings, 'IMAGE_DERIVATIVE_DELAY', 30)
+# False ise kopyalar yalnızca yönetim komutuyla üretilir
+IMAGE_DERIVATIVES_AUTO = getattr(settings, 'IMAGE_DERIVATIVES_AUTO', True)
+
+
+def derivative_formats():
+    """Bu ortamda üretilebilen biçimler"""
+    return imaging.supported_formats(IMAGE_DERIVATIVE_FORMATS)
+
+
+def derivatives_for(sources):
+    """
+    Verilen orijinal dosyaların kopyalarını tek sorguda getir
+
+    Returns:
+        dict: Orijinal dosya adı -> ImageDerivative listesi (genişliğe göre sıralı)
+    """
+    grouped = {}
+    if not sources:
+        return grouped
+    for derivative in ImageDerivative.objects.filter(source__in=sources).order_by('width'):
+        grouped.setdefault(derivative.source, []).append(derivative)
+    return grouped
+
+
+def picture_sources(derivatives):
+    """
+    Kopyaları `<source>` etiketleri için biçim sırasıyla grupla
+
+    Returns:
+        list: {'type': MIME türü, 'srcset': "url 480w, url 800w"} sözlükleri
+    """
+    sources = []
+    for fmt in IMAGE_DERIVATIVE_FORMATS:
+        candidates = [d for d in derivatives if d.format == fmt]
+        if candidates:
+            sources.append({
+                'type': imaging.MIME_TYPES.get(fmt, f'image/{fmt}'),
+                'srcset': ', '.join(f"{d.file.url} {d.width}w" for d in candidates),
+            })
+    return sources
+
+
+def pending_sources(webtoon_slug=None, chapter_id=None, limit=None):
+    """Henüz kopyası üretilmemiş bölüm resimlerinin dosya adları"""
+    images = ChapterImage.objects.exclude(image='').exclude(
+        image__in=ImageDerivative.objects.values('source')
+    )
+    if webtoon_slug:
+        images = images.filter(chapter__webtoon__slug=webtoon_slug)
+    if chapter_id:
+        images = images.filter(chapter_id=chapter_id)
+    sources = images.order_by('image').values_list('image', flat=True).distinct()
+    return list(sources[:limit] if limit else sources)
+
+
+def _read_source(source):
+    with default_storage.open(source, 'rb') as f:
+        return f.read()
+
+
+def _render_all(sources, formats, workers):
+    """
+    Kaynakları sırayla veya süreç havuzunda işle
+
+    Yields:
+        tuple: (orijinal dosya adı, imaging.render_derivatives sonucu); başarısız olanlar atlanır
+    """
+    args = (IMAGE_DERIVATIVE_WIDTHS, formats, IMAGE_DERIVATIVE_QUALITY)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # Bellekte aynı anda çok fazla orijinal tutmamak için gruplar halinde gönder
+        batch_size = workers * 2
+        for start in range(0, len(sources), batch_size):
+            jobs = []
+            for source in sources[start:start + batch_size]:
+                try:
+                    data = _read_source(source)
+                except Exception as e:
+                    logger.error(f"Orijinal resim okunamadı: {source}: {e}")
+                    continue
+                if executor is None:
+                    jobs.append((source, lambda data=data: imaging.render_derivatives(data, *args)))
+                else:
+                    jobs.append((source, executor.submit(imaging.render_derivatives, data, *args).result))
+            for source, result in jobs:
+                try:
+                    yield source, result()
+                except Exception as e:
+                    logger.error(f"Okuyucu kopyası üretilemedi: {source}: {e}")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _save_derivatives(source, rendered):
+    """Üretilen kopyaları depolamaya yaz ve kaydet"""
+    created = 0
+    for width, fmt, data in rendered:
+        derivative = ImageDerivative(source=source, width=width, format=fmt, size=len(data))
+        derivative.file.save(f"{width}w.{fmt}", ContentFile(data), save=False)
+        try:
+            with transaction.atomic():
+                derivative.save()
+        except IntegrityError:
+            # Aynı kopya eş zamanlı olarak başka bir çalışan tarafından üretildi
+            default_storage.delete(derivative.file.name)
+            continue
+        created += 1
+    return created
+
+
+def _invalidate_readers(sources):
+    """Kopyaları değişen resimleri gösteren bölümlerin okuma verisini temizle"""
+    keys = (
+        ChapterImage.objects.filter(image__in=sources)
+        .values_list('chapter__webtoon__slug', 'chapter__number')
+        .distinct()
+    )
+    for slug, number in keys:
+        reader.invalidate_chapter(slug, number)
+
+
+def _can_fork_workers():
+    # Celery'nin prefork çalışanları daemon süreçlerdir ve alt süreç açamaz
+    return not multiprocessing.current_process().daemon
+
+
+def generate_derivatives(sources, workers=None):
+    """
+    Verilen orijinal dosyaların eksik kopyalarını üret
+
+    Resimler `workers` > 1 ise süreç havuzunda çözülüp kodlanır; dosyalar ve
+    kayıtlar ana süreçte yazılır.
+
+    Args:
+        sources (list): Orijinal dosya adları
+        workers (int, optional): Süreç sayısı (varsayılan: IMAGE_DERIVATIVE_WORKERS)
+
+    Returns:
+        int: Oluşturulan kopya sayısı
+    """
+    formats = derivative_formats()
+    if not formats:
+        logger.warning("Pillow WebP/AVIF kaydedemiyor, okuyucu kopyaları üretilmedi")
+        return 0
+
+    done = set(ImageDerivative.objects.filter(source__in=sources).values_list('source', flat=True))
+    sources = [source for source in dict.fromkeys(sources) if source and source not in done]
+    if not sources:
+        return 0
+
+    workers = min(workers or IMAGE_DERIVATIVE_WORKERS, len(sources))
+    if workers > 1 and not _can_fork_workers():
+        workers = 1
+
+    created = 0
+    finished = []
+    for source, rendered in _render_all(sources, formats, workers):
+        created += _save_derivatives(source, rendered)
+        finished.append(source)
+
+    if finished:
+        _invalidate_readers(finished)
+    return created
+
+
+def generate_chapter_derivatives(chapter_id, workers=None):
+    """Bir bölümün kopyası eksik resimlerini işle"""
+    cache.delete(_schedule_key(chapter_id))
+    return generate_derivatives(pending_sources(chapter_id=chapter_id), workers=workers)
+
+
+def _schedule_key(chapter_id):
+    return f"derivatives:scheduled:{chapter_id}"
+
+
+def _celery_configured():
+    """Görevlerin gönderileceği bir Celery aracısı yapılandırılmış mı"""
+    from celery import current_app
+    # Proje uygulaması yüklenmemişse varsayılan uygulamanın aracı adresi yoktur
+    return bool(current_app.conf.broker_url)
+
+
+def _generate_in_background(chapter_id):
+    """Bölümün kopyalarını gecikmeyle bu süreçteki bir arka plan thread'inde üret"""
+    def run():
+        try:
+            # Thread içinden süreç açmak güvenli değildir, resimler sırayla işlenir
+            generate_chapter_derivatives(chapter_id, workers=1)
+        except Exception:
+            logger.exception(f"Okuyucu kopyaları üretilemedi (bölüm {chapter_id})")
+        finally:
+            close_old_connections()
+
+    timer = threading.Timer(IMAGE_DERIVATIVE_DELAY, run)
+    timer.name = f"derivatives-{chapter_id}"
+    timer.daemon = True
+    timer.start()
+
+
+def schedule_chapter(chapter_id):
+    """
+    Bölüm için gecikmeli kopya üretim görevini kuyruğa al
+
+    Aynı bölüme art arda eklenen sayfalar tek göreve toplanır: görev
+    kuyruktayken yeni istekler yok sayılır. Celery yapılandırılmamışsa veya
+    kuyruğa erişilemezse bölüm bu süreçte arka planda işlenir.
+    """
+    if not IMAGE_DERIVATIVES_AUTO:
+        return
+    if not cache.add(_schedule_key(chapter_id), 1, timeout=IMAGE_DERIVATIVE_DELAY * 4):
+        return
+
+    def enqueue():
+        if not _celery_configured():
+            _generate_in_background(chapter_id)
+            return
+        # Döngüsel içe aktarmayı önlemek için burada içe aktarılır
+        from .tasks import generate_image_derivatives
+        try:
+            generate_image_derivatives.apply_async((chapter_id,), countdown=IMAGE_DERIVATIVE_DELAY)
+        except Exception as e:
+            logger.warning(f"Okuyucu kopyası görevi kuyruğa alınamadı, bölüm yerel olarak işlenecek (bölüm {chapter_id}): {e}")
+            _generate_in_background(chapter_id)
+
+    transaction.on_commit(enqueue)
+
+
+def delete_derivatives(source):
+    """Orijinal dosyanın kopyalarını sil; dosyalar işlem onaylandıktan sonra kaldırılır"""
+    derivatives = list(ImageDerivative.objects.filter(source=source))
+    if not derivatives:
+        return
+    names = [derivative.file.name for derivative in derivatives]
+    ImageDerivative.objects.filter(pk__in=[derivative.pk for derivative in derivatives]).delete()
+
+    def remove_files():
+        for name in names:
+            default_storage.delete(name)
+
+    transaction.on_commit(remove_files)
@@ -0,0 +1,123 @@
+"""
+Bölüm resimlerini eşzamanlı indiren sınırlı iş parçacığı havuzu
+
+Bir bölümün sayfaları bir `ThreadPoolExecutor` ile paralel indirilir. Aynı
+sunucuya aynı anda açılan bağlantı sayısı, süreç genelinde paylaşılan
+sunucu başına semaforlarla sınırlandırılır; böylece birden fazla bölüm veya
+webtoon aynı anda senkronize edilse bile kaynak siteye aşırı yük binmez.
+Sonuçlar giriş sırasıyla döndürülür, veritabanı kayıtları çağıran tarafta
+sırayla oluşturulur.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.files import File
+from django.db import connection
+
+from .blobs import content_addressed_enabled, fetch_blob
+
+logger = logging.getLogger(__name__)
+
+IMAGE_DOWNLOAD_WORKERS = getattr(settings, 'IMAGE_DOWNLOAD_WORKERS', 8)
+IMAGE_DOWNLOAD_PER_HOST = getattr(settings, 'IMAGE_DOWNLOAD_PER_HOST', 4)
+IMAGE_DOWNLOAD_RETRIES = getattr(settings, 'IMAGE_DOWNLOAD_RETRIES', 2)
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url):
+    """URL'nin sunucusu için paylaşılan semaforu döndür"""
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = _host_semaphores[host] = threading.BoundedSemaphore(IMAGE_DOWNLOAD_PER_HOST)
+        return semaphore
+
+
+def _download_with_retries(url, file_name, retries, fetch):
+    """Tek bir resmi sunucu sınırına uyarak, artan beklemeyle tekrar deneyerek indir"""
+    semaphore = _host_semaphore(url)
+    for attempt in range(retries):
+        try:
+            with semaphore:
+                image_file = fetch(url, file_name)
+            if image_file:
+                return image_file
+        except Exception as e:
+            logger.error(f"Resim indirme hatası (deneme {attempt+1}/{retries}): {e}")
+        if attempt < retries - 1:
+            # Bekleme yalnızca bu iş parçacığını durdurur, diğer sayfalar inmeye devam eder
+            time.sleep(2 ** attempt)
+    logger.error(f"Resim indirilemedi: {url}")
+    return None
+
+
+def download_images(urls, file_names, max_workers=IMAGE_DOWNLOAD_WORKERS, retries=IMAGE_DOWNLOAD_RETRIES, fetch=None):
+    """
+    Resimleri eşzamanlı indir
+
+    Args:
+        urls (list): Resim URL'leri
+        file_names (list): Her URL için kaydedilecek dosya adı
+        max_workers (int): En fazla eşzamanlı indirme
+        retries (int): Resim başına deneme sayısı
+        fetch (callable, optional): `fetch(url, file_name)` ile tek resmi
+            indiren fonksiyon; varsayılan `download_image_to_django`
+
+    Returns:
+        list: Giriş sırasıyla `fetch` sonuçları (varsayılan olarak Django File
+            nesneleri), indirilemeyenler için None
+    """
+    if not urls:
+        return []
+    if fetch is None:
+        # Döngüsel içe aktarmayı önlemek için burada içe aktarılır
+        from .services import download_image_to_django
+        fetch = download_image_to_django
+    workers = max(1, min(max_workers, len(urls)))
+
+    def download(args):
+        try:
+            return _download_with_retries(args[0], args[1], retries, fetch)
+        finally:
+            # İş parçacığı sonlanınca açık kalmaması için veritabanı bağlantısını kapat
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-download') as executor:
+        return list(executor.map(download, zip(urls, file_names)))
+
+
+def download_chapter_pages(urls, file_names, **kwargs):
+    """
+    Bölüm sayfalarını eşzamanlı indir
+
+    İçerik adresli depolama açıksa sayfalar doğrudan depoya alınır ve
+    `ImageBlob` döner (daha önce indirilmiş URL'ler ağa çıkmadan gelir);
+    kapalıysa Django File nesneleri döner. Her iki durumda da sonuçlar
+    `blobs.create_chapter_image` ile bölüme eklenir.
+    """
+    if content_addressed_enabled():
+        kwargs.setdefault('fetch', fetch_blob)
+    return download_images(urls, file_names, **kwargs)
+
+
+def discard_downloaded(files):
+    """
+    İndirilen resimlerin tamponlarını kapat
+
+    Tamponlar (diske taşmış olanlar dahil) kapatıldığında silinir.
+    """
+    for image_file in files:
+        if not isinstance(image_file, File):
+            # İçerik adresli depodaki dosyalar (ImageBlob) kapatılmaz
+            continue
+        try:
+            image_file.close()
+        except OSError as e:
+            logger.warning(f"İndirilen dosya kapatılamadı: {image_file.name}: {e}")
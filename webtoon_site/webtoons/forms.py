@@ -4,6 +4,7 @@ from django.forms import inlineformset_factory
 from .models import Webtoon, Category, Chapter, ChapterImage
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
+from scrapers.profiles import get_profile, registered_profiles
 
 class WebtoonForm(forms.ModelForm):
     GENRE_CHOICES = [
@@ -127,7 +128,8 @@ class ImportWebtoonForm(forms.Form):
     
     def clean_source_url(self):
         url = self.cleaned_data['source_url']
-        # Desteklenen siteleri kontrol et
-        if not ("mangazure.net" in url.lower() or "mangadex.org" in url.lower()):
-            raise forms.ValidationError("Sadece MangaZure ve MangaDex URL'leri desteklenmektedir.")
+        # URL'nin sunucusu kayıtlı bir site profiline uymalı (bkz. scrapers.profiles)
+        if get_profile(url) is None:
+            supported = ', '.join(profile.name for profile in registered_profiles())
+            raise forms.ValidationError(f"Desteklenmeyen kaynak sitesi. Desteklenen siteler: {supported}")
         return url 
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Ana sayfa bölümlerinin (son eklenenler, popülerler, kategoriler) önbelleği
+
+Bölümler şablonun ek sorgu yapmasına gerek kalmayacak şekilde düz sözlükler
+olarak hesaplanıp önbelleğe yazılır. Önbellekteki veri `HOME_CACHE_FRESH_TIMEOUT`
+saniye boyunca tazedir; bu süre geçtikten sonra gelen istekler eski veriyle
+hemen yanıtlanır ve veri arka planda yenilenir (stale-while-revalidate).
+Aynı anda yalnızca bir yenileme yapılması için önbellekte kısa ömürlü bir
+kilit anahtarı kullanılır.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from .caching import versioned_key
+from .covers import cover_url
+from .models import Category, Webtoon
+
+logger = logging.getLogger(__name__)
+
+HOME_CACHE_LOCK_KEY = 'home:sections:lock'
+HOME_CACHE_FRESH_TIMEOUT = getattr(settings, 'HOME_CACHE_FRESH_TIMEOUT', 60)
+HOME_CACHE_STALE_TIMEOUT = getattr(settings, 'HOME_CACHE_STALE_TIMEOUT', 24 * 60 * 60)
+HOME_SECTION_SIZE = 12
+# Yenileme kilidinin en uzun tutulma süresi (saniye)
+HOME_CACHE_LOCK_TIMEOUT = 30
+
+
+def home_cache_key():
+    """Ana sayfa bölümleri için önbellek anahtarı"""
+    return versioned_key('home', 'sections')
+
+
+def _webtoon_card(webtoon):
+    """Şablondaki webtoon kartı için gereken alanlar"""
+    return {
+        'id': webtoon.id,
+        'title': webtoon.title,
+        'slug': webtoon.slug,
+        'author': webtoon.author,
+        'views': webtoon.views,
+        'status_display': webtoon.get_status_display(),
+        'thumbnail_url': cover_url(webtoon, 'card'),
+    }
+
+
+def build_home_sections():
+    """
+    Ana sayfa bölümlerini veritabanından hesapla
+
+    Returns:
+        dict: latest_webtoons, popular_webtoons ve categories listeleri
+    """
+    fields = ('id', 'title', 'slug', 'author', 'views', 'status', 'thumbnail', 'updated_date')
+    published = Webtoon.objects.filter(published=True).only(*fields)
+    return {
+        'latest_webtoons': [_webtoon_card(w) for w in published.order_by('-created_date')[:HOME_SECTION_SIZE]],
+        'popular_webtoons': [_webtoon_card(w) for w in published.order_by('-views')[:HOME_SECTION_SIZE]],
+        'categories': list(Category.objects.values('name', 'slug')),
+    }
+
+
+def refresh_home_sections():
+    """Ana sayfa bölümlerini yeniden hesaplayıp önbelleğe yaz"""
+    sections = build_home_sections()
+    cache.set(
+        home_cache_key(),
+        {'sections': sections, 'fresh_until': time.time() + HOME_CACHE_FRESH_TIMEOUT},
+        HOME_CACHE_STALE_TIMEOUT,
+    )
+    return sections
+
+
+def _background_refresh():
+    try:
+        refresh_home_sections()
+    except Exception as e:
+        logger.error(f"Ana sayfa önbelleği yenilenemedi: {str(e)}")
+    finally:
+        cache.delete(HOME_CACHE_LOCK_KEY)
+        close_old_connections()
+
+
+def get_home_sections():
+    """
+    Ana sayfa bölümlerini önbellekten getir
+
+    Önbellek boşsa veri hemen hesaplanır. Veri eskimişse eski veri döndürülür
+    ve kilidi alan ilk istek yenilemeyi arka planda başlatır.
+
+    Returns:
+        dict: latest_webtoons, popular_webtoons ve categories listeleri
+    """
+    entry = cache.get(home_cache_key())
+
+    if entry is None:
+        # Aynı anda gelen isteklerden yalnızca biri önbelleğe yazar
+        if cache.add(HOME_CACHE_LOCK_KEY, 1, HOME_CACHE_LOCK_TIMEOUT):
+            try:
+                return refresh_home_sections()
+            finally:
+                cache.delete(HOME_CACHE_LOCK_KEY)
+        return build_home_sections()
+
+    if entry['fresh_until'] < time.time() and cache.add(HOME_CACHE_LOCK_KEY, 1, HOME_CACHE_LOCK_TIMEOUT):
+        threading.Thread(target=_background_refresh, name='home-refresh', daemon=True).start()
+
+    return entry['sections']
+
+
+def invalidate_home_sections():
+    """
+    Ana sayfa önbelleğini sil
+
+    Yayından kaldırılan bir webtoon'un ana sayfada kalmaması gereken
+    durumlarda (yayın durumu, kategori değişiklikleri) kullanılır.
+    """
+    cache.delete(home_cache_key())
+
+
+def mark_home_sections_stale():
+    """
+    Ana sayfa önbelleğini eskimiş olarak işaretle
+
+    Veri silinmez; sonraki istek eski veriyle yanıtlanıp yenilemeyi başlatır.
+    Görüntülenme sayaçları gibi anlık doğruluk gerektirmeyen değişiklikler
+    için kullanılır.
+    """
+    entry = cache.get(home_cache_key())
+    if entry is not None and entry['fresh_until'] > 0:
+        entry['fresh_until'] = 0
+        cache.set(home_cache_key(), entry, HOME_CACHE_STALE_TIMEOUT)
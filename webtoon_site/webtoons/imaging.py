@@ -0,0 +1,97 @@
+"""
+Okuyucu için resim kopyalarının üretilmesi
+
+Bu modül Django'ya bağlı değildir; fonksiyonları süreç havuzundaki
+çalışanlarda (fork veya spawn) uygulama kayıt defteri yüklenmeden çalışır.
+Girdi ve çıktılar yalnızca bayt ve basit değerlerdir.
+"""
+import io
+
+# Kodlayıcıların desteklediği en büyük kenar uzunluğu (piksel); uzun webtoon
+# şeritleri bu sınırı aşarsa o biçimde kopya üretilmez
+MAX_DIMENSIONS = {
+    'webp': 16383,
+    'avif': 65535,
+}
+
+# Biçim -> MIME türü
+MIME_TYPES = {
+    'webp': 'image/webp',
+    'avif': 'image/avif',
+}
+
+
+def load_plugins():
+    """Pillow'un yerleşik olarak desteklemediği biçimler için eklentileri yükle"""
+    try:
+        # Pillow 11.3 öncesinde AVIF desteği bu eklentiyle gelir
+        import pillow_avif  # noqa: F401
+    except ImportError:
+        pass
+
+
+def supported_formats(formats):
+    """
+    Kurulu Pillow'un kaydedebildiği biçimleri döndür
+
+    Args:
+        formats (iterable): İstenen biçimler ('avif', 'webp')
+
+    Returns:
+        list: Kaydedilebilen biçimler, verilen sırayla
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+    load_plugins()
+    Image.init()
+    return [fmt for fmt in formats if fmt.upper() in Image.SAVE]
+
+
+def target_widths(original_width, widths):
+    """
+    Üretilecek genişlikleri belirle
+
+    Resim hiçbir zaman büyütülmez. Orijinal, en büyük genişlikten darsa
+    kendi genişliğinde de yeni biçime dönüştürülür.
+    """
+    targets = sorted({width for width in widths if width < original_width})
+    if widths and original_width <= max(widths):
+        targets.append(original_width)
+    return targets
+
+
+def render_derivatives(data, widths, formats, quality):
+    """
+    Resmin her genişlik ve biçim için küçültülmüş kopyasını üret
+
+    Args:
+        data (bytes): Orijinal resim
+        widths (iterable): Hedef genişlikler (piksel)
+        formats (iterable): Hedef biçimler ('avif', 'webp')
+        quality (dict): Biçim -> kalite (0-100)
+
+    Returns:
+        list: (genişlik, biçim, bayt) demetleri
+    """
+    from PIL import Image
+
+    load_plugins()
+    results = []
+    with Image.open(io.BytesIO(data)) as img:
+        if img.mode not in ('RGB', 'RGBA'):
+            has_alpha = img.mode in ('LA', 'PA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+        original_width, original_height = img.size
+
+        for width in target_widths(original_width, widths):
+            height = max(1, round(original_height * width / original_width))
+            resized = img if width == original_width else img.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                if max(width, height) > MAX_DIMENSIONS.get(fmt, 16383):
+                    continue
+                buffer = io.BytesIO()
+                resized.save(buffer, format=fmt.upper(), quality=quality.get(fmt, 80))
+                results.append((width, fmt, buffer.getvalue()))
+    return results
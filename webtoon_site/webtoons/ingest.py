@@ -0,0 +1,178 @@
+"""
+Resimlerin geçici dosyaya yazılmadan, akış halinde içeri alınması
+
+Yanıt gövdesi parça parça okunup `SpooledTemporaryFile` içinde biriktirilir;
+dosya `IMAGE_SPOOL_MAX_MEMORY` baytı aşmadıkça bellekte kalır, aşarsa
+otomatik olarak diske taşar ve kapatıldığında silinir. Resim türü ilk
+baytlardan (magic bytes) anlaşılır, resim tamamen çözülmez. Dönen Django
+`File` nesnesi modele atandığında içerik depolamaya bir kez yazılır.
+"""
+import logging
+import os
+import tempfile
+import uuid
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from django.core.files import File
+
+from scrapers import http_client
+
+logger = logging.getLogger(__name__)
+
+# Bu boyuta kadar resimler bellekte tutulur, büyükleri diske taşar (bayt)
+IMAGE_SPOOL_MAX_MEMORY = getattr(settings, 'IMAGE_SPOOL_MAX_MEMORY', 2 * 1024 * 1024)
+# Bundan büyük yanıtlar resim olarak kabul edilmez (bayt)
+IMAGE_MAX_BYTES = getattr(settings, 'IMAGE_MAX_BYTES', 20 * 1024 * 1024)
+# Bundan küçük yanıtlar muhtemelen hata sayfası veya boş içeriktir (bayt)
+IMAGE_MIN_BYTES = 100
+
+IMAGE_REQUEST_HEADERS = {
+    'Referer': 'https://mangazure.net/',
+    'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8'
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ImageIngestError(Exception):
+    """İndirilen içerik geçerli bir resim değil"""
+
+
+def sniff_image_type(header):
+    """
+    Dosyanın ilk baytlarından resim türünü belirle
+
+    Args:
+        header (bytes): Dosyanın en az ilk 16 baytı
+
+    Returns:
+        str: Dosya uzantısı ('jpg', 'png', 'gif', 'webp', 'avif', 'bmp'), tanınmazsa None
+    """
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    if header[4:8] == b'ftyp' and header[8:12] in (b'avif', b'avis'):
+        return 'avif'
+    if header.startswith(b'BM'):
+        return 'bmp'
+    return None
+
+
+def spool_response(response, max_bytes=IMAGE_MAX_BYTES):
+    """
+    Yanıt gövdesini sınırlı bir bellek tamponuna oku
+
+    Returns:
+        SpooledTemporaryFile: Başa sarılmış tampon
+
+    Raises:
+        ImageIngestError: Gövde `max_bytes` sınırını aşarsa
+    """
+    declared = response.headers.get('Content-Length')
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ImageIngestError(f"Dosya çok büyük ({declared} byte)")
+
+    buffer = tempfile.SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_MEMORY)
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ImageIngestError(f"Dosya çok büyük (>{max_bytes} byte)")
+            buffer.write(chunk)
+    except Exception:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
+
+
+def validate_image(buffer):
+    """
+    Tamponun desteklenen bir resim olduğunu doğrula
+
+    Tür ilk baytlardan anlaşılır. Pillow kuruluysa yalnızca başlık okunarak
+    boyutların geçerli olduğu da kontrol edilir; piksel verisi çözülmez.
+
+    Returns:
+        str: Dosya uzantısı
+
+    Raises:
+        ImageIngestError: İçerik resim değilse
+    """
+    buffer.seek(0, os.SEEK_END)
+    size = buffer.tell()
+    buffer.seek(0)
+    if size < IMAGE_MIN_BYTES:
+        raise ImageIngestError(f"Dosya çok küçük ({size} byte)")
+
+    ext = sniff_image_type(buffer.read(32))
+    buffer.seek(0)
+    if ext is None:
+        raise ImageIngestError("Tanınmayan resim biçimi")
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return ext
+    try:
+        with Image.open(buffer) as img:
+            width, height = img.size
+    except Exception as e:
+        # Pillow bazı biçimleri (ör. eklentisiz AVIF) açamayabilir; tür zaten doğrulandı
+        logger.debug(f"Resim başlığı okunamadı ({ext}): {e}")
+    else:
+        if not width or not height:
+            raise ImageIngestError(f"Geçersiz resim boyutu: {width}x{height}")
+    finally:
+        buffer.seek(0)
+    return ext
+
+
+def image_file_name(image_url, file_name, ext):
+    """İstenen dosya adının uzantısını gerçek resim türüyle değiştir"""
+    if not file_name:
+        file_name = os.path.basename(urlparse(image_url).path)
+        if not file_name or file_name == '/':
+            file_name = uuid.uuid4().hex
+    return f"{os.path.splitext(file_name)[0]}.{ext}"
+
+
+def fetch_image(image_url, file_name=None, headers=None):
+    """
+    Resmi indir, doğrula ve depolamaya yazılmaya hazır bir File döndür
+
+    Args:
+        image_url (str): Resim URL'si
+        file_name (str, optional): Dosya adı; uzantı resim türüne göre düzeltilir
+        headers (dict, optional): İstek başlıkları
+
+    Returns:
+        File: Tampona bağlı Django File nesnesi, başarısız olursa None.
+            Kapatıldığında tampon (diske taşmışsa dosyası da) silinir.
+    """
+    try:
+        with http_client.get(image_url, stream=True, headers=headers or IMAGE_REQUEST_HEADERS) as response:
+            if response.status_code != 200:
+                logger.error(f"HTTP hata kodu: {response.status_code}: {image_url}")
+                return None
+            buffer = spool_response(response)
+    except (requests.exceptions.RequestException, ImageIngestError) as e:
+        logger.error(f"Resim indirilemedi: {image_url}: {e}")
+        return None
+
+    try:
+        ext = validate_image(buffer)
+    except ImageIngestError as e:
+        logger.error(f"Geçersiz resim: {image_url}: {e}")
+        buffer.close()
+        return None
+
+    return File(buffer, name=image_file_name(image_url, file_name, ext))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from webtoons.derivatives import derivative_formats, generate_derivatives, pending_sources
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Bölüm resimleri için eksik okuyucu kopyalarını (WebP/AVIF, farklı genişlikler) süreç havuzunda üretir'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--webtoon-slug',
+            help='Yalnızca belirli bir webtoon\'un resimlerini işlemek için slug belirtin'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Kullanılacak süreç sayısı (varsayılan: IMAGE_DERIVATIVE_WORKERS)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='En fazla bu kadar resim işle'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Gerçekte kopya üretmeden işlenecek resim sayısını gösterir'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get('dry_run', False)
+
+        formats = derivative_formats()
+        if not formats:
+            self.stdout.write(self.style.ERROR("Pillow WebP veya AVIF kaydedemiyor, kopya üretilemez."))
+            return
+
+        sources = pending_sources(webtoon_slug=options.get('webtoon_slug'), limit=options.get('limit'))
+        self.stdout.write(f"{len(sources)} resim için kopya üretilecek (biçimler: {', '.join(formats)})")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("Bu bir kuru çalıştırma idi, herhangi bir değişiklik yapılmadı."))
+            return
+
+        created = generate_derivatives(sources, workers=options.get('workers'))
+        self.stdout.write(self.style.SUCCESS(f"İşlem tamamlandı! {created} kopya oluşturuldu."))
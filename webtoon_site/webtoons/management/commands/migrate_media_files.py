@@ -79,7 +79,8 @@ class Command(BaseCommand):
                 
                 # Bölüm resimlerini taşı
                 for image in chapter.images.all():
-                    if image.image:
+                    # İçerik adresli dosyalar bölümler arasında paylaşılır, taşınmaz
+                    if image.image and not image.blob_id:
                         old_path = image.image.path
                         old_name = os.path.basename(old_path)
                         
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from webtoons.blobs import prune_unreferenced_blobs, reconcile_blob_refcounts
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'İçerik adresli resim deposunun referans sayılarını düzeltir ve kullanılmayan dosyaları siler'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age-hours',
+            type=int,
+            default=24,
+            help='Bu süreden (saat) yeni kullanılmayan dosyalara dokunma (varsayılan: 24)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Gerçekte değişiklik yapmadan yapılacakları gösterir'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get('dry_run', False)
+
+        recounted = reconcile_blob_refcounts(dry_run=dry_run)
+        for blob in recounted:
+            self.stdout.write(f"  - {blob.sha256}: referans sayısı {blob.ref_count} -> {blob.actual}")
+
+        pruned = prune_unreferenced_blobs(min_age=timedelta(hours=options['min_age_hours']), dry_run=dry_run)
+        for blob in pruned:
+            self.stdout.write(f"  - Silindi: {blob.file.name}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"İşlem tamamlandı! {len(recounted)} referans sayısı düzeltildi, {len(pruned)} dosya silindi."
+        ))
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("Bu bir kuru çalıştırma idi, herhangi bir değişiklik yapılmadı."))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from webtoons.search import get_backend, rebuild_index
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Webtoon tam metin arama indeksini baştan oluşturur'
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        self.stdout.write(f"Arama arka ucu: {backend.__class__.__name__}")
+
+        count = rebuild_index()
+
+        self.stdout.write(self.style.SUCCESS(f"İşlem tamamlandı! {count} webtoon indekslendi."))
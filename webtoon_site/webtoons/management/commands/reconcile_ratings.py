@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from webtoons.models import Webtoon
+from webtoons.ratings import reconcile_rating_aggregates
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Webtoon puan özetlerini (toplam, adet, ortalama) Rating kayıtlarından yeniden hesaplar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--webtoon-slug',
+            help='Yalnızca belirli bir webtoon\'u kontrol etmek için slug belirtin'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Gerçekte güncelleme yapmadan farklı olan webtoonları gösterir'
+        )
+
+    def handle(self, *args, **options):
+        webtoon_slug = options.get('webtoon_slug')
+        dry_run = options.get('dry_run', False)
+
+        webtoon_ids = None
+        if webtoon_slug:
+            webtoon_ids = list(Webtoon.objects.filter(slug=webtoon_slug).values_list('id', flat=True))
+            if not webtoon_ids:
+                self.stdout.write(self.style.ERROR(f"'{webtoon_slug}' slug'ına sahip webtoon bulunamadı."))
+                return
+
+        changed = reconcile_rating_aggregates(webtoon_ids=webtoon_ids, dry_run=dry_run)
+
+        for webtoon in changed:
+            self.stdout.write(
+                f"  - {webtoon.title}: {webtoon.rating_count} puan, ortalama {webtoon.rating_avg:.2f}"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"İşlem tamamlandı! {len(changed)} webtoon için puan özeti düzeltildi."))
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("Bu bir kuru çalıştırma idi, herhangi bir değişiklik yapılmadı."))
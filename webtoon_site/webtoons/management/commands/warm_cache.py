@@ -0,0 +1,63 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from webtoons.models import Webtoon, Chapter
+from webtoons import caching, home, reader
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'En çok okunan webtoonların detay ve bölüm verilerini önbelleğe önceden yükler (deploy sonrası)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=50,
+            help='Önbelleğe alınacak en popüler webtoon sayısı (varsayılan: 50)'
+        )
+        parser.add_argument(
+            '--chapters',
+            type=int,
+            default=5,
+            help='Her webtoon için önbelleğe alınacak en çok okunan bölüm sayısı (varsayılan: 5)'
+        )
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        chapter_limit = options['chapters']
+
+        # Süreç içi önbelleğe yazılanlar komut bitince kaybolur, sunucu süreçleri görmez
+        if not caching.cache_is_shared():
+            raise CommandError(
+                "Varsayılan önbellek süreçler arasında paylaşılmıyor (LocMem/Dummy); "
+                "önbelleği ısıtmak için REDIS_CACHE_URL ile Redis önbelleği tanımlayın."
+            )
+
+        # Ana sayfa ve kategori listesi
+        home.refresh_home_sections()
+        cache.set(caching.versioned_key('categories', 'list'), caching.build_category_list(), caching.CATEGORY_CACHE_TIMEOUT)
+        self.stdout.write("Ana sayfa ve kategori listesi önbelleğe alındı.")
+
+        webtoons = Webtoon.objects.filter(published=True).order_by('-views').only('id', 'slug', 'title')[:limit]
+        chapter_count = 0
+
+        for webtoon in webtoons:
+            detail = caching.build_webtoon_detail(webtoon.slug)
+            if detail is None:
+                continue
+            cache.set(caching.webtoon_detail_key(webtoon.slug), detail, caching.WEBTOON_CACHE_TIMEOUT)
+
+            numbers = Chapter.objects.filter(webtoon_id=webtoon.id, published=True) \
+                .order_by('-views', '-number').values_list('number', flat=True)[:chapter_limit]
+            for number in numbers:
+                payload = reader.build_reader_payload(webtoon.slug, number)
+                if payload is not None:
+                    cache.set(reader.reader_cache_key(webtoon.slug, number), payload, reader.READER_CACHE_TIMEOUT)
+                    chapter_count += 1
+
+            self.stdout.write(f"  - {webtoon.title}: {len(numbers)} bölüm")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"İşlem tamamlandı! {len(webtoons)} webtoon ve {chapter_count} bölüm önbelleğe alındı."
+        ))
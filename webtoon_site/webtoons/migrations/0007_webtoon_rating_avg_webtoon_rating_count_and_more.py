@@ -0,0 +1,43 @@
+# Generated by Django 5.0.7 on 2026-10-18 13:12
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    """Mevcut puanlardan özet alanlarını doldur"""
+    Webtoon = apps.get_model('webtoons', 'Webtoon')
+    webtoons = Webtoon.objects.annotate(
+        score_sum=Sum('ratings__score'), score_count=Count('ratings')
+    ).filter(score_count__gt=0)
+    for webtoon in webtoons:
+        webtoon.rating_sum = webtoon.score_sum
+        webtoon.rating_count = webtoon.score_count
+        webtoon.rating_avg = webtoon.score_sum / webtoon.score_count
+    Webtoon.objects.bulk_update(webtoons, ['rating_sum', 'rating_count', 'rating_avg'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webtoons', '0006_category_description_alter_chapterimage_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webtoon',
+            name='rating_avg',
+            field=models.FloatField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='webtoon',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='webtoon',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
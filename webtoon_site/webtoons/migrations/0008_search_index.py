@@ -0,0 +1,88 @@
+import unicodedata
+
+from django.db import migrations
+
+FTS_TABLE = 'webtoons_search_fts'
+PG_TABLE = 'webtoons_search_index'
+
+# webtoons.search'teki alanların bu migration anındaki kopyası; uygulama kodu
+# sonradan değişse de boş bir veritabanında aynı tablo oluşturulur
+FIELD_WEIGHTS = (
+    ('title', 10.0, 'A'),
+    ('author', 5.0, 'B'),
+    ('artist', 5.0, 'B'),
+    ('categories', 3.0, 'C'),
+    ('description', 1.0, 'D'),
+)
+
+_CHAR_MAP = str.maketrans({'ı': 'i', 'İ': 'i'})
+
+
+def normalize_text(text):
+    text = (text or '').translate(_CHAR_MAP).casefold()
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def create_search_index(apps, schema_editor):
+    """Veritabanına uygun tam metin indeks tablosunu oluştur ve doldur"""
+    connection = schema_editor.connection
+    columns = [name for name, _, _ in FIELD_WEIGHTS]
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                    f"{', '.join(columns)}, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+            except Exception:
+                # FTS5 derlenmemişse arama icontains ile çalışmaya devam eder
+                return
+            insert = (
+                f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(columns)}) "
+                f"VALUES (%s, {', '.join(['%s'] * len(columns))})"
+            )
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                f"CREATE TABLE {PG_TABLE} ("
+                f"webtoon_id bigint PRIMARY KEY REFERENCES webtoons_webtoon(id) ON DELETE CASCADE "
+                f"DEFERRABLE INITIALLY DEFERRED, document tsvector NOT NULL)"
+            )
+            cursor.execute(f"CREATE INDEX {PG_TABLE}_document_gin ON {PG_TABLE} USING GIN (document)")
+            vector = ' || '.join(
+                f"setweight(to_tsvector('simple', %s), '{label}')" for _, _, label in FIELD_WEIGHTS
+            )
+            insert = f"INSERT INTO {PG_TABLE} (webtoon_id, document) VALUES (%s, {vector})"
+        else:
+            return
+
+        Webtoon = apps.get_model('webtoons', 'Webtoon')
+        for webtoon in Webtoon.objects.filter(published=True).prefetch_related('categories').iterator(chunk_size=500):
+            document = {
+                'title': webtoon.title,
+                'author': webtoon.author,
+                'artist': webtoon.artist,
+                'categories': ' '.join(category.name for category in webtoon.categories.all()),
+                'description': webtoon.description,
+            }
+            cursor.execute(insert, [webtoon.pk] + [normalize_text(document[name]) for name in columns])
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    table = {'sqlite': FTS_TABLE, 'postgresql': PG_TABLE}.get(connection.vendor)
+    if table:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webtoons', '0007_webtoon_rating_avg_webtoon_rating_count_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.7 on 2026-10-18 13:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webtoons', '0010_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebtoonSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('content_hash', models.CharField(blank=True, max_length=64)),
+                ('last_chapter_url', models.URLField(blank=True)),
+                ('chapter_count', models.PositiveIntegerField(default=0)),
+                ('last_checked', models.DateTimeField(blank=True, null=True)),
+                ('last_changed', models.DateTimeField(blank=True, null=True)),
+                ('imported_webtoon', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='sync_state', to='webtoons.importedwebtoon')),
+            ],
+        ),
+    ]
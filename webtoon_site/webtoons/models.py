@@ -32,6 +32,21 @@ def chapter_image_path(instance, filename):
     # Dosya yolunu döndür
     return f'webtoons/content/{webtoon_slug}/chapter-{chapter_number}/{filename}'
 
+def image_blob_path(instance, filename):
+    """İçerik adresli resimler için dosya yolu belirler (içeriğin SHA-256 özeti)"""
+    # Dosya uzantısını al
+    ext = filename.split('.')[-1]
+    digest = instance.sha256
+    # Tek klasörde çok fazla dosya olmaması için özetin ilk karakterleriyle dağıt
+    return f'webtoons/blobs/{digest[:2]}/{digest[2:4]}/{digest}.{ext}'
+
+def image_derivative_path(instance, filename):
+    """Okuyucu kopyaları için dosya yolu belirler (orijinalin yolundan türetilir)"""
+    stem = os.path.splitext(instance.source)[0]
+    if stem.startswith('webtoons/'):
+        stem = stem[len('webtoons/'):]
+    return f'webtoons/derivatives/{stem}-{instance.width}w.{instance.format}'
+
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
     slug = models.SlugField(max_length=100, unique=True)
@@ -65,6 +80,10 @@ class Webtoon(models.Model):
     updated_date = models.DateTimeField(auto_now=True)
     published = models.BooleanField(default=True)
     views = models.PositiveIntegerField(default=0)
+    # Puan özetleri Rating kayıtlarından artımlı olarak güncellenir
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_avg = models.FloatField(default=0, editable=False, db_index=True)
     
     class Meta:
         ordering = ['-created_date']
@@ -123,10 +142,51 @@ class Chapter(models.Model):
     def get_absolute_url(self):
         return reverse('chapter_detail', args=[self.webtoon.slug, self.number])
 
+class ImageBlob(models.Model):
+    """İçeriğine göre bir kez saklanan resim dosyası"""
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.ImageField(upload_to=image_blob_path)
+    size = models.PositiveIntegerField(default=0)
+    # Bu dosyayı kullanan ChapterImage sayısı; sıfıra düştüğünde dosya silinir
+    ref_count = models.IntegerField(default=0)
+    created_date = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return self.sha256
+
+class ImageSource(models.Model):
+    """Kaynak resim URL'si ile içerik adresli dosya eşleşmesi (tekrar indirmeyi önler)"""
+    url_hash = models.CharField(max_length=64, unique=True)
+    url = models.URLField(max_length=1000)
+    blob = models.ForeignKey(ImageBlob, on_delete=models.CASCADE, related_name='sources')
+    last_seen = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return self.url
+
+class ImageDerivative(models.Model):
+    """Bölüm resminin okuyucu için küçültülmüş ve yeniden kodlanmış kopyası"""
+    # Orijinal dosyanın depolamadaki adı (ChapterImage.image); içerik adresli
+    # dosyaları kullanan tüm bölümler aynı kopyaları paylaşır
+    source = models.CharField(max_length=255, db_index=True)
+    width = models.PositiveIntegerField()
+    format = models.CharField(max_length=10)
+    file = models.FileField(upload_to=image_derivative_path, max_length=255)
+    size = models.PositiveIntegerField(default=0)
+    created_date = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ['source', 'width', 'format']
+    
+    def __str__(self):
+        return f"{self.source} ({self.width}w {self.format})"
+
 class ChapterImage(models.Model):
     chapter = models.ForeignKey(Chapter, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to=chapter_image_path)
     order = models.PositiveIntegerField()
+    # İçerik adresli depolamada `image` bu dosyanın yolunu gösterir
+    blob = models.ForeignKey(ImageBlob, on_delete=models.PROTECT, related_name='chapter_images', null=True, blank=True)
     
     def __str__(self):
         return f"{self.chapter} - Image {self.order}"
@@ -209,6 +269,26 @@ class ImportedWebtoon(models.Model):
     def __str__(self):
         return f"{self.webtoon.title} (from {self.source.name})"
 
+class WebtoonSyncState(models.Model):
+    """Bir webtoon'un kaynak sitedeki bölüm listesinin son görülen hali"""
+    imported_webtoon = models.OneToOneField(ImportedWebtoon, on_delete=models.CASCADE, related_name='sync_state')
+    # Bölüm listesi yanıtının HTTP doğrulayıcıları (koşullu istekler için)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    # Bölüm listesinin içerik özeti; sunucu koşullu istek desteklemese de değişiklik anlaşılır
+    content_hash = models.CharField(max_length=64, blank=True)
+    last_chapter_url = models.URLField(blank=True)
+    chapter_count = models.PositiveIntegerField(default=0)
+    last_checked = models.DateTimeField(null=True, blank=True)
+    last_changed = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"{self.imported_webtoon} senkronizasyon durumu"
+    
+    def validators(self):
+        """Scraper'a verilecek doğrulayıcılar"""
+        return {'etag': self.etag, 'last_modified': self.last_modified, 'content_hash': self.content_hash}
+
 class ImportedChapter(models.Model):
     """Dış kaynaklardan içeri aktarılan bölümleri temsil eder"""
     chapter = models.OneToOneField(Chapter, on_delete=models.CASCADE, related_name='import_info')
@@ -256,7 +336,15 @@ def auto_delete_webtoon_file_on_delete(sender, instance, **kwargs):
 def auto_delete_chapter_image_on_delete(sender, instance, **kwargs):
     """
     ChapterImage silindiğinde ilişkili dosyayı da sil
+    
+    İçerik adresli dosyalar başka bölümlerce de kullanılabildiğinden doğrudan
+    silinmez; referans sayısı azaltılır ve son referansla birlikte silinir.
     """
-    if instance.image:
+    if instance.blob_id:
+        from .blobs import release_blob
+        release_blob(instance.blob_id)
+    elif instance.image:
+        from .derivatives import delete_derivatives
+        delete_derivatives(instance.image.name)
         if os.path.isfile(instance.image.path):
             os.remove(instance.image.path)
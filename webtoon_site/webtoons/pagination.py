@@ -0,0 +1,262 @@
+"""
+Anahtar kümesi (keyset / cursor) tabanlı sayfalama
+
+`django.core.paginator.Paginator` her sayfa için `COUNT(*)` ve `OFFSET`
+sorgusu çalıştırır; sayfa numarası büyüdükçe veritabanı atlanan satırları da
+okumak zorunda kalır. Burada sayfa, bir önceki sayfanın son satırının sıralama
+değerleri (ör. `(created_date, id)`) ile belirlenir ve sorgu
+`WHERE (created_date, id) < (...) ORDER BY ... LIMIT n` şeklinde çalışır; bu
+sayede 500. sayfa da 1. sayfa kadar hızlıdır.
+
+Toplam sayı isteğe bağlıdır ve önbelleğe alınmış yaklaşık bir değerdir.
+"""
+import base64
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import QueryDict
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_COUNT_CACHE_TIMEOUT = getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 5 * 60)
+
+# Liste görünümlerinde izin verilen sıralamalar; son alan her zaman benzersiz
+# olmalıdır (id), aksi halde eşit değerli satırlar sayfalar arasında kaybolur.
+WEBTOON_ORDERINGS = {
+    '-created_date': ('-created_date', '-id'),
+    'created_date': ('created_date', 'id'),
+    '-views': ('-views', '-id'),
+    '-rating_avg': ('-rating_avg', '-id'),
+    'title': ('title', 'id'),
+    '-title': ('-title', '-id'),
+}
+DEFAULT_WEBTOON_ORDERING = '-created_date'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(values, direction):
+    """Sıralama değerlerini ve yönü URL'de taşınabilir bir metne dönüştür"""
+    payload = json.dumps({'v': values, 'd': direction}, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """`encode_cursor` ile oluşturulan metni (değerler, yön) olarak çöz"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = payload['v'], payload['d']
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor(cursor)
+    if direction not in ('next', 'prev') or not isinstance(values, list):
+        raise InvalidCursor(cursor)
+    return values, direction
+
+
+def approximate_count(queryset, timeout=PAGINATION_COUNT_CACHE_TIMEOUT):
+    """
+    Sorgunun satır sayısını önbellekten döndür, yoksa sayıp önbelleğe yaz
+
+    Sonuç `timeout` saniyeye kadar eski olabilir.
+    """
+    digest = hashlib.md5(str(queryset.query).encode()).hexdigest()
+    key = f"pagination:count:{digest}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+class CursorPage:
+    """
+    Bir cursor sayfası
+
+    Şablonlarda Django `Page` nesnesi gibi gezilebilir; sayfa numarası yerine
+    `next_query`, `previous_query` ve `first_query` bağlantı parametrelerini
+    sunar.
+    """
+
+    def __init__(self, object_list, paginator, has_next, has_previous, next_cursor, previous_cursor, params):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self._params = params
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __bool__(self):
+        return bool(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def _query(self, cursor):
+        params = self._params.copy() if self._params is not None else QueryDict(mutable=True)
+        params.pop('cursor', None)
+        params.pop('page', None)
+        if cursor:
+            params['cursor'] = cursor
+        return params.urlencode()
+
+    @property
+    def next_query(self):
+        return self._query(self.next_cursor)
+
+    @property
+    def previous_query(self):
+        return self._query(self.previous_cursor)
+
+    @property
+    def first_query(self):
+        return self._query(None)
+
+    @property
+    def approximate_total(self):
+        """Önbelleğe alınmış yaklaşık toplam (sayfalayıcıda açıksa), aksi halde None"""
+        return self.paginator.approximate_total()
+
+
+class CursorPaginator:
+    """
+    Anahtar kümesi tabanlı sayfalayıcı
+
+    Args:
+        queryset (QuerySet): Sayfalanacak sorgu
+        ordering (tuple): Sıralama alanları, ör. ('-created_date', '-id');
+            son alan benzersiz olmalıdır
+        per_page (int): Sayfa başına kayıt
+        with_total (bool): Yaklaşık toplamı hesapla ve önbelleğe al
+    """
+
+    def __init__(self, queryset, ordering, per_page=24, with_total=False):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.with_total = with_total
+        self._fields = [field.lstrip('-') for field in self.ordering]
+        self._descending = [field.startswith('-') for field in self.ordering]
+
+    def approximate_total(self):
+        if not self.with_total:
+            return None
+        return approximate_count(self.queryset)
+
+    def _values(self, obj):
+        return [getattr(obj, field) for field in self._fields]
+
+    def _parse_values(self, values):
+        """Cursor'dan gelen metin değerleri model alan türlerine dönüştür"""
+        if len(values) != len(self._fields):
+            raise InvalidCursor(values)
+        model = self.queryset.model
+        try:
+            return [
+                model._meta.pk.to_python(value) if field in ('id', 'pk')
+                else model._meta.get_field(field).to_python(value)
+                for field, value in zip(self._fields, values)
+            ]
+        except Exception:
+            raise InvalidCursor(values)
+
+    def _after(self, values, reverse):
+        """Sıralamada verilen değerlerden sonra (reverse ise önce) gelen satırlar için filtre"""
+        condition = Q()
+        for i, field in enumerate(self._fields):
+            descending = self._descending[i] != reverse
+            lookup = 'lt' if descending else 'gt'
+            step = Q(**{f"{field}__{lookup}": values[i]})
+            for prev_field, prev_value in zip(self._fields[:i], values[:i]):
+                step &= Q(**{prev_field: prev_value})
+            condition |= step
+        return condition
+
+    def page(self, cursor=None, params=None):
+        """
+        Cursor ile belirtilen sayfayı döndür
+
+        Geçersiz bir cursor verilirse ilk sayfa döndürülür.
+
+        Args:
+            cursor (str, optional): `next_cursor` veya `previous_cursor` değeri
+            params (QueryDict, optional): Bağlantılarda korunacak diğer parametreler
+
+        Returns:
+            CursorPage
+        """
+        values, direction = None, 'next'
+        if cursor:
+            try:
+                raw_values, direction = decode_cursor(cursor)
+                values = self._parse_values(raw_values)
+            except InvalidCursor:
+                logger.debug(f"Geçersiz sayfalama cursor'ı: {cursor}")
+                values, direction = None, 'next'
+
+        reverse = direction == 'prev'
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._after(values, reverse))
+
+        if reverse:
+            ordering = [field[1:] if field.startswith('-') else f"-{field}" for field in self.ordering]
+        else:
+            ordering = list(self.ordering)
+
+        # Bir fazla satır çekerek sonraki sayfanın olup olmadığını anla
+        rows = list(queryset.order_by(*ordering)[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = encode_cursor(self._values(rows[-1]), 'next') if rows and has_next else None
+        previous_cursor = encode_cursor(self._values(rows[0]), 'prev') if rows and has_previous else None
+
+        return CursorPage(rows, self, has_next, has_previous, next_cursor, previous_cursor, params)
+
+
+def paginate_webtoons(request, queryset, ordering=DEFAULT_WEBTOON_ORDERING, per_page=24, with_total=True):
+    """
+    Webtoon listesi için istekteki `cursor` parametresine göre sayfa döndür
+
+    Args:
+        request (HttpRequest): İstek
+        queryset (QuerySet): Webtoon sorgusu
+        ordering (str): `WEBTOON_ORDERINGS` anahtarlarından biri
+        per_page (int): Sayfa başına webtoon
+        with_total (bool): Yaklaşık toplamı hesapla
+
+    Returns:
+        CursorPage
+    """
+    fields = WEBTOON_ORDERINGS.get(ordering, WEBTOON_ORDERINGS[DEFAULT_WEBTOON_ORDERING])
+    paginator = CursorPaginator(queryset, fields, per_page=per_page, with_total=with_total)
+    return paginator.page(request.GET.get('cursor'), params=request.GET)
@@ -0,0 +1,76 @@
+"""
+Webtoon puan özetlerinin (toplam, adet, ortalama) bakımı
+"""
+import logging
+
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThan
+
+from .models import Webtoon
+
+logger = logging.getLogger(__name__)
+
+
+def apply_rating_delta(webtoon_id, score_delta, count_delta):
+    """
+    Bir webtoon'un puan özetini tek bir UPDATE sorgusuyla artımlı güncelle
+
+    Args:
+        webtoon_id (int): Webtoon ID
+        score_delta (int): Puan toplamındaki değişim
+        count_delta (int): Puan adedindeki değişim (-1, 0 veya 1)
+    """
+    if not score_delta and not count_delta:
+        return
+
+    new_sum = F('rating_sum') + score_delta
+    new_count = F('rating_count') + count_delta
+    Webtoon.objects.filter(pk=webtoon_id).update(
+        rating_sum=new_sum,
+        rating_count=new_count,
+        rating_avg=Case(
+            When(
+                GreaterThan(new_count, 0),
+                then=Cast(new_sum, FloatField()) / Cast(new_count, FloatField()),
+            ),
+            default=Value(0.0),
+            output_field=FloatField(),
+        ),
+    )
+
+
+def reconcile_rating_aggregates(webtoon_ids=None, dry_run=False):
+    """
+    Puan özetlerini Rating tablosundan yeniden hesapla ve farklı olanları düzelt
+
+    Args:
+        webtoon_ids (list, optional): Yalnızca bu webtoonları kontrol et
+        dry_run (bool): True ise değişiklik yapmadan yalnızca farkları döndür
+
+    Returns:
+        list: Düzeltilen (veya düzeltilecek) Webtoon nesneleri
+    """
+    webtoons = Webtoon.objects.annotate(
+        score_sum=Sum('ratings__score'), score_count=Count('ratings')
+    ).only('id', 'title', 'rating_sum', 'rating_count', 'rating_avg')
+    if webtoon_ids:
+        webtoons = webtoons.filter(pk__in=webtoon_ids)
+
+    changed = []
+    for webtoon in webtoons.iterator():
+        score_sum = webtoon.score_sum or 0
+        score_count = webtoon.score_count
+        score_avg = score_sum / score_count if score_count else 0
+        if (webtoon.rating_sum, webtoon.rating_count) != (score_sum, score_count) \
+                or abs(webtoon.rating_avg - score_avg) > 1e-9:
+            webtoon.rating_sum = score_sum
+            webtoon.rating_count = score_count
+            webtoon.rating_avg = score_avg
+            changed.append(webtoon)
+
+    if changed and not dry_run:
+        Webtoon.objects.bulk_update(changed, ['rating_sum', 'rating_count', 'rating_avg'], batch_size=500)
+        logger.info(f"{len(changed)} webtoon için puan özeti düzeltildi")
+
+    return changed
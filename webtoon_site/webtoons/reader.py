@@ -0,0 +1,115 @@
+"""
+Bölüm okuma sayfası için önceden hesaplanmış veri (reader payload) önbelleği
+"""
+import bisect
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import derivatives
+from .caching import bump_generation, get_or_build, versioned_key
+from .models import Chapter
+
+logger = logging.getLogger(__name__)
+
+READER_CACHE_TIMEOUT = getattr(settings, 'READER_CACHE_TIMEOUT', 60 * 60)
+
+
+def reader_cache_key(slug, number):
+    """Bir bölümün okuma verisi için önbellek anahtarı"""
+    return versioned_key(f"reader:{slug}", number)
+
+
+def build_reader_payload(slug, number):
+    """
+    Bir bölümün okuma sayfası için gereken tüm veriyi veritabanından topla
+
+    Args:
+        slug (str): Webtoon slug'ı
+        number (int): Bölüm numarası
+
+    Returns:
+        dict: Okuma verisi, bölüm yoksa veya yayında değilse None
+    """
+    chapter = Chapter.objects.select_related('webtoon').filter(
+        webtoon__slug=slug,
+        webtoon__published=True,
+        number=number,
+        published=True,
+    ).first()
+    if chapter is None:
+        return None
+
+    webtoon = chapter.webtoon
+
+    # Sayfa resimleri sırasıyla; okuyucu kopyaları varsa <picture> kaynakları olarak
+    chapter_images = [image for image in chapter.images.order_by('order') if image.image]
+    copies = derivatives.derivatives_for([image.image.name for image in chapter_images])
+    images = [
+        {
+            'url': image.image.url,
+            'order': image.order,
+            'sources': derivatives.picture_sources(copies.get(image.image.name, [])),
+        }
+        for image in chapter_images
+    ]
+
+    # Önceki ve sonraki bölümleri tek sorguda bul
+    numbers = list(
+        Chapter.objects.filter(webtoon_id=webtoon.id, published=True)
+        .order_by('number')
+        .values_list('number', flat=True)
+    )
+    index = bisect.bisect_left(numbers, chapter.number)
+    prev_number = numbers[index - 1] if index > 0 else None
+    next_number = numbers[index + 1] if index + 1 < len(numbers) else None
+
+    return {
+        'webtoon': {
+            'id': webtoon.id,
+            'slug': webtoon.slug,
+            'title': webtoon.title,
+        },
+        'chapter': {
+            'id': chapter.id,
+            'number': chapter.number,
+            'title': chapter.title,
+            'release_date': chapter.release_date,
+        },
+        'images': images,
+        'prev_chapter': {'number': prev_number} if prev_number is not None else None,
+        'next_chapter': {'number': next_number} if next_number is not None else None,
+    }
+
+
+def get_reader_payload(slug, number):
+    """
+    Bir bölümün okuma verisini önbellekten getir, yoksa oluşturup önbelleğe yaz
+
+    Args:
+        slug (str): Webtoon slug'ı
+        number (int): Bölüm numarası
+
+    Returns:
+        dict: Okuma verisi, bölüm yoksa None
+    """
+    return get_or_build(
+        reader_cache_key(slug, number), lambda: build_reader_payload(slug, number), READER_CACHE_TIMEOUT
+    )
+
+
+def invalidate_chapter(slug, number):
+    """Tek bir bölümün okuma verisini önbellekten sil"""
+    cache.delete(reader_cache_key(slug, number))
+
+
+def invalidate_webtoon(slug):
+    """
+    Bir webtoon'un tüm bölümlerinin okuma verisini geçersiz kıl
+
+    Bölüm eklenip silindiğinde komşu bölümlerin önceki/sonraki bilgisi de
+    değiştiği için tüm bölümler birlikte geçersiz kılınır. Bölümler tek tek
+    silinmez, webtoon'un anahtar nesli artırılır.
+    """
+    bump_generation(f"reader:{slug}")
@@ -0,0 +1,261 @@
+"""
+Webtoon tam metin arama altyapısı
+
+Başlık, yazar, çizer, açıklama ve kategori adları veritabanına özel bir ters
+indekste (SQLite'ta FTS5 sanal tablosu, PostgreSQL'de tsvector tablosu)
+tutulur. Tüm arka uçlar aynı arayüzü sunar: `index`, `remove`, `search` ve
+`rebuild`. İndeks, model sinyalleriyle kayıt anında güncellenir.
+"""
+import logging
+import re
+import unicodedata
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+
+from .models import Webtoon
+
+logger = logging.getLogger(__name__)
+
+SEARCH_MAX_RESULTS = getattr(settings, 'SEARCH_MAX_RESULTS', 1000)
+
+# Sütun ağırlıkları: başlık > yazar/çizer > kategori > açıklama
+FIELD_WEIGHTS = (
+    ('title', 10.0, 'A'),
+    ('author', 5.0, 'B'),
+    ('artist', 5.0, 'B'),
+    ('categories', 3.0, 'C'),
+    ('description', 1.0, 'D'),
+)
+
+# Türkçe karakterlerin aksan kaldırma ile eşleşmeyen karşılıkları
+_CHAR_MAP = str.maketrans({'ı': 'i', 'İ': 'i'})
+
+
+def normalize_text(text):
+    """
+    Arama ve indeksleme için metni normalleştir
+
+    Küçük harfe çevirir, Türkçe karakterleri ve aksanları sadeleştirir
+    (ör. "Çılgın" -> "cilgin").
+    """
+    text = (text or '').translate(_CHAR_MAP).casefold()
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def tokenize(text):
+    """Normalleştirilmiş metni kelimelere ayır"""
+    return re.findall(r'\w+', normalize_text(text))
+
+
+def _document(webtoon):
+    """Bir webtoon için indekslenecek alanları normalleştirilmiş olarak döndür"""
+    categories = ' '.join(category.name for category in webtoon.categories.all())
+    return {
+        'title': normalize_text(webtoon.title),
+        'author': normalize_text(webtoon.author),
+        'artist': normalize_text(webtoon.artist),
+        'categories': normalize_text(categories),
+        'description': normalize_text(webtoon.description),
+    }
+
+
+class SearchBackend:
+    """Arama arka uçları için ortak arayüz"""
+
+    def index(self, webtoon):
+        """Webtoon'u indekse ekle veya güncelle, yayında değilse indeksten çıkar"""
+        if not webtoon.published:
+            self.remove(webtoon.pk)
+            return
+        self._index(webtoon.pk, _document(webtoon))
+
+    def _index(self, webtoon_id, document):
+        raise NotImplementedError
+
+    def remove(self, webtoon_id):
+        """Webtoon'u indeksten çıkar"""
+        raise NotImplementedError
+
+    def search(self, query, limit=SEARCH_MAX_RESULTS):
+        """
+        Sorguya uyan webtoonların ID'lerini ilgi sırasına göre döndür
+
+        Args:
+            query (str): Kullanıcının arama metni
+            limit (int): Döndürülecek en fazla sonuç sayısı
+
+        Returns:
+            list: Webtoon ID'leri
+        """
+        raise NotImplementedError
+
+    def rebuild(self):
+        """İndeksi tüm yayındaki webtoonlardan yeniden oluştur"""
+        self.clear()
+        count = 0
+        for webtoon in Webtoon.objects.filter(published=True).prefetch_related('categories').iterator(chunk_size=500):
+            self._index(webtoon.pk, _document(webtoon))
+            count += 1
+        return count
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """SQLite FTS5 sanal tablosu üzerinde BM25 sıralamalı arama"""
+
+    table = 'webtoons_search_fts'
+
+    def _index(self, webtoon_id, document):
+        columns = [name for name, _, _ in FIELD_WEIGHTS]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [webtoon_id])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, {', '.join(columns)}) "
+                f"VALUES (%s, {', '.join(['%s'] * len(columns))})",
+                [webtoon_id] + [document[name] for name in columns],
+            )
+
+    def remove(self, webtoon_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [webtoon_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+
+    def search(self, query, limit=SEARCH_MAX_RESULTS):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Her kelime önek olarak aranır: "solo" "lev"* -> Solo Leveling
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        weights = ', '.join(str(weight) for _, weight, _ in FIELD_WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s "
+                f"ORDER BY bm25({self.table}, {weights}) LIMIT %s",
+                [match, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(SearchBackend):
+    """PostgreSQL tsvector + GIN indeksi üzerinde ts_rank sıralamalı arama"""
+
+    table = 'webtoons_search_index'
+
+    def _index(self, webtoon_id, document):
+        vector = ' || '.join(
+            f"setweight(to_tsvector('simple', %s), '{label}')" for _, _, label in FIELD_WEIGHTS
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.table} (webtoon_id, document) VALUES (%s, {vector}) "
+                f"ON CONFLICT (webtoon_id) DO UPDATE SET document = EXCLUDED.document",
+                [webtoon_id] + [document[name] for name, _, _ in FIELD_WEIGHTS],
+            )
+
+    def remove(self, webtoon_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE webtoon_id = %s", [webtoon_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+
+    def search(self, query, limit=SEARCH_MAX_RESULTS):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        tsquery = ' & '.join(f"{token}:*" for token in tokens)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT webtoon_id FROM {self.table}, to_tsquery('simple', %s) query "
+                f"WHERE document @@ query ORDER BY ts_rank(document, query) DESC LIMIT %s",
+                [tsquery, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class FallbackSearchBackend(SearchBackend):
+    """
+    Tam metin desteği olmayan veritabanları için icontains tabanlı arama
+
+    Ayrı bir indeks tutmaz; sonuçlar görüntülenme sayısına göre sıralanır.
+    """
+
+    def _index(self, webtoon_id, document):
+        pass
+
+    def remove(self, webtoon_id):
+        pass
+
+    def clear(self):
+        pass
+
+    def search(self, query, limit=SEARCH_MAX_RESULTS):
+        query = query.strip()
+        if not query:
+            return []
+        ids = Webtoon.objects.filter(
+            Q(title__icontains=query) |
+            Q(author__icontains=query) |
+            Q(artist__icontains=query) |
+            Q(description__icontains=query) |
+            Q(categories__name__icontains=query),
+            published=True,
+        ).order_by('-views', 'id').values_list('id', flat=True)
+        # Kategori birleştirmesinden gelen tekrarları sırayı bozmadan at
+        return list(dict.fromkeys(ids))[:limit]
+
+
+def _fts5_available():
+    """SQLite veritabanında arama tablosunun bulunup bulunmadığını kontrol et"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [SQLiteFTSBackend.table],
+        )
+        return cursor.fetchone() is not None
+
+
+_backend = None
+
+
+def get_backend():
+    """Veritabanı türüne uygun arama arka ucunu döndür"""
+    global _backend
+    if _backend is None:
+        if connection.vendor == 'sqlite' and _fts5_available():
+            _backend = SQLiteFTSBackend()
+        elif connection.vendor == 'postgresql':
+            _backend = PostgresSearchBackend()
+        else:
+            logger.warning("Tam metin arama desteklenmiyor, icontains araması kullanılacak")
+            _backend = FallbackSearchBackend()
+    return _backend
+
+
+def search_webtoons(query, limit=SEARCH_MAX_RESULTS):
+    """Sorguya uyan yayındaki webtoonların ID'lerini ilgi sırasına göre döndür"""
+    return get_backend().search(query, limit=limit)
+
+
+def index_webtoon(webtoon):
+    """Webtoon'u arama indeksinde güncelle"""
+    get_backend().index(webtoon)
+
+
+def remove_webtoon(webtoon_id):
+    """Webtoon'u arama indeksinden çıkar"""
+    get_backend().remove(webtoon_id)
+
+
+def rebuild_index():
+    """Arama indeksini baştan oluştur, indekslenen webtoon sayısını döndür"""
+    return get_backend().rebuild()
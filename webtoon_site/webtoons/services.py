@@ -1,34 +1,44 @@
 """
 Scraper ile veritabanı entegrasyonunu sağlayan servis fonksiyonları
 """
+import asyncio
 import os
-import tempfile
 from datetime import datetime
 from django.utils import timezone
-from django.core.files import File
 from django.db import transaction
 from django.utils.text import slugify
-import requests
 from django.conf import settings
+from scrapers.async_scraper import AsyncWebtoonScraper
+from scrapers.base_scraper import chapter_list_hash
 from scrapers.webtoon_scraper import WebtoonScraper
-from scrapers.mangazure_scraper import MangaZureScraper
+from scrapers.engine import ProfileScraper
+from scrapers.profiles import get_profile, get_profile_by_name
 from .models import (
-    Webtoon, Chapter, ChapterImage, Category,
-    ExternalSource, ImportedWebtoon, ImportedChapter, ImportLog
+    Webtoon, Chapter, Category,
+    ExternalSource, ImportedWebtoon, ImportedChapter, ImportLog, WebtoonSyncState
 )
+from .blobs import create_chapter_image
+from .downloads import download_chapter_pages, discard_downloaded
+from .ingest import fetch_image
 import logging
-from urllib.parse import urlparse
-import time
 
 logger = logging.getLogger(__name__)
 
+# MangaDex bölümlerinin resim adresleri bu kadar bölüm için birlikte (eşzamanlı)
+# çekilir; at-home sunucu adresleri kısa süre geçerli olduğundan tüm bölümler
+# için önceden çekilmez
+SYNC_IMAGE_PREFETCH = getattr(settings, 'SYNC_IMAGE_PREFETCH', 10)
+
 def download_image_to_django(image_url, file_name=None):
     """
     Bir URL'den resim indir ve Django File nesnesine dönüştür
     
+    İçerik geçici dosyaya yazılmaz; sınırlı bir bellek tamponunda tutulur ve
+    model kaydedilirken depolamaya bir kez yazılır (bkz. webtoons.ingest).
+    
     Args:
         image_url (str): İndirilecek resim URL'si
-        file_name (str, optional): Kaydedilecek dosya adı
+        file_name (str, optional): Kaydedilecek dosya adı; uzantı resim türüne göre düzeltilir
         
     Returns:
         File: Django File nesnesi, başarısız olursa None
@@ -37,261 +47,8 @@ def download_image_to_django(image_url, file_name=None):
         logger.error("Resim URL'si boş")
         return None
     
-    try:
-        logger.info(f"Resim indirme başlıyor: {image_url}")
-        
-        # Dosya adı belirtilmemişse URL'den al
-        if not file_name:
-            parsed_url = urlparse(image_url)
-            file_name = os.path.basename(parsed_url.path)
-            
-            # Dosya adı boşsa random bir isim oluştur
-            if not file_name or file_name == '/':
-                import uuid
-                file_name = f"{uuid.uuid4()}.jpg"
-        
-        logger.info(f"Kullanılacak dosya adı: {file_name}")
-        
-        # Media dizini var mı kontrol et
-        media_dir = settings.MEDIA_ROOT
-        if not os.path.exists(media_dir):
-            logger.info(f"Media dizini bulunamadı, oluşturuluyor: {media_dir}")
-            os.makedirs(media_dir, exist_ok=True)
-            
-        # Resimlerin kaydedileceği alt dizinleri kontrol et
-        webtoons_dir = os.path.join(media_dir, 'webtoons')
-        if not os.path.exists(webtoons_dir):
-            logger.info(f"Webtoons dizini bulunamadı, oluşturuluyor: {webtoons_dir}")
-            os.makedirs(webtoons_dir, exist_ok=True)
-            
-        chapters_dir = os.path.join(media_dir, 'webtoons', 'chapters')
-        if not os.path.exists(chapters_dir):
-            logger.info(f"Chapters dizini bulunamadı, oluşturuluyor: {chapters_dir}")
-            os.makedirs(chapters_dir, exist_ok=True)
-            
-        covers_dir = os.path.join(media_dir, 'webtoons', 'covers')
-        if not os.path.exists(covers_dir):
-            logger.info(f"Covers dizini bulunamadı, oluşturuluyor: {covers_dir}")
-            os.makedirs(covers_dir, exist_ok=True)
-        
-        # Geçici dosya oluştur
-        logger.info("Geçici dosya oluşturuluyor")
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file_path = temp_file.name
-        logger.info(f"Geçici dosya yolu: {temp_file_path}")
-        
-        # Resmi indir
-        logger.info("HTTP isteği başlatılıyor")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://mangazure.net/',
-            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8'
-        }
-        
-        # 3 deneme yap
-        max_retries = 5  # Deneme sayısını artırdık
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(image_url, stream=True, headers=headers, timeout=30)
-                logger.info(f"HTTP yanıt kodu: {response.status_code}")
-                
-                if response.status_code != 200:
-                    logger.error(f"HTTP hata kodu: {response.status_code}, yanıt: {response.text[:100]}")
-                    last_error = f"HTTP hata kodu: {response.status_code}"
-                    if attempt < max_retries - 1:
-                        logger.info(f"Tekrar deneniyor... ({attempt+1}/{max_retries})")
-                        time.sleep(3)
-                        continue
-                    os.unlink(temp_file_path)
-                    return None
-                
-                break  # Başarılı yanıt aldık, döngüden çık
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"HTTP isteği hatası: {e}")
-                last_error = str(e)
-                if attempt < max_retries - 1:
-                    logger.info(f"Tekrar deneniyor... ({attempt+1}/{max_retries})")
-                    time.sleep(3)
-                else:
-                    os.unlink(temp_file_path)
-                    return None
-        
-        if response.status_code != 200:
-            logger.error(f"Tüm denemeler başarısız oldu. Son hata: {last_error}")
-            os.unlink(temp_file_path)
-            return None
-        
-        # Gelen yanıtın içerik tipini kontrol et
-        content_type = response.headers.get('Content-Type', '')
-        logger.info(f"İçerik tipi: {content_type}")
-        
-        # İçerik tipini kontrol et - daha esnek hale getirdik
-        if not (
-            content_type.startswith('image/') or 
-            content_type == 'application/octet-stream' or
-            content_type == 'binary/octet-stream' or
-            'image' in content_type.lower()
-        ):
-            logger.warning(f"Beklenmeyen içerik tipi: {content_type}, URL: {image_url}")
-            # Ama devam ediyoruz, bazen sunucular yanlış content-type döndürebilir
-            
-        # Resmi geçici dosyaya yaz
-        logger.info("Dosya yazılıyor")
-        for chunk in response.iter_content(chunk_size=8192):
-            temp_file.write(chunk)
-        
-        temp_file.close()
-        logger.info("Geçici dosya kapatıldı")
-        
-        # Dosya boyutunu kontrol et
-        file_size = os.path.getsize(temp_file_path)
-        logger.info(f"İndirilen dosya boyutu: {file_size} byte")
-        
-        if file_size < 100:  # 100 byte'dan küçük dosyalar muhtemelen hatalıdır
-            logger.error(f"Dosya çok küçük ({file_size} byte), muhtemelen hatalı: {image_url}")
-            os.unlink(temp_file_path)
-            return None
-        
-        # Dosya türünü doğrula - imlib veya PIL ile
-        try:
-            from PIL import Image
-            try:
-                img = Image.open(temp_file_path)
-                img.verify()  # Doğrula
-                logger.info(f"Resim doğrulandı: {img.format}, {img.size}")
-                # Doğrulama başarılı, dosyayı yeniden açmamız gerekiyor
-                img = Image.open(temp_file_path)
-                # JPEG olarak kaydet (tüm formatlarda çalışmasını sağlamak için)
-                if img.format != 'JPEG' and img.mode != 'RGB':
-                    logger.info(f"Resim formatı dönüştürülüyor: {img.format} -> JPEG")
-                    img = img.convert('RGB')
-                    jpeg_path = temp_file_path + ".jpg"
-                    img.save(jpeg_path, 'JPEG')
-                    os.unlink(temp_file_path)  # Eski dosyayı sil
-                    temp_file_path = jpeg_path  # Yeni dosya yolunu kullan
-                    file_name = os.path.splitext(file_name)[0] + ".jpg"  # Dosya adını güncelle
-            except Exception as img_err:
-                logger.error(f"Resim doğrulama hatası: {img_err}, bu bir resim olmayabilir")
-                # Doğrulama hatası, ama yine de devam ediyoruz
-        except ImportError:
-            logger.warning("PIL kütüphanesi bulunamadı, resim doğrulama atlanıyor")
-        
-        # Django File nesnesi oluştur
-        logger.info("Django File nesnesi oluşturuluyor")
-        try:
-            django_file = File(open(temp_file_path, 'rb'))
-            django_file.name = file_name
-            logger.info(f"Django File nesnesi oluşturuldu: {django_file.name}")
-            return django_file
-        except Exception as e:
-            logger.error(f"Django File nesnesi oluşturulurken hata: {e}")
-            os.unlink(temp_file_path)
-            return None
-        
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Resim indirme HTTP hatası: {e}")
-        if 'temp_file_path' in locals():
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-        return None
-        
-    except Exception as e:
-        logger.error(f"Resim indirme hatası: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        if 'temp_file_path' in locals():
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-        return None
-
-def create_default_cover(webtoon_title, file_name):
-    """
-    Kapak resmi bulunamazsa, webtoon başlığı içeren basit bir resim oluştur
-    
-    Args:
-        webtoon_title (str): Webtoon başlığı
-        file_name (str): Kaydedilecek dosya adı
-        
-    Returns:
-        File: Django File nesnesi, başarısız olursa None
-    """
-    try:
-        # PIL (Pillow) kütüphanesini kullan
-        from PIL import Image, ImageDraw, ImageFont
-        import os
-        
-        # Basit bir resim oluştur (600x800 boyutunda)
-        width, height = 600, 800
-        background_color = (50, 50, 150)  # Koyu mavi
-        
-        # Yeni bir resim oluştur
-        img = Image.new('RGB', (width, height), color=background_color)
-        draw = ImageDraw.Draw(img)
-        
-        # Varsayılan font kullan
-        try:
-            # Windows için yaygın fontlar
-            font_paths = [
-                'C:\\Windows\\Fonts\\Arial.ttf',
-                'C:\\Windows\\Fonts\\calibri.ttf',
-                'C:\\Windows\\Fonts\\segoeui.ttf'
-            ]
-            
-            font = None
-            for path in font_paths:
-                if os.path.exists(path):
-                    font = ImageFont.truetype(path, 40)
-                    break
-                    
-            if not font:
-                # Varsayılan font
-                font = ImageFont.load_default()
-                
-        except Exception:
-            # Font yüklenemezse varsayılan kullan
-            font = ImageFont.load_default()
-        
-        # Başlığı hazırla (maksimum 30 karakter)
-        if len(webtoon_title) > 30:
-            title_text = webtoon_title[:27] + "..."
-        else:
-            title_text = webtoon_title
-            
-        # Başlığı ortalayarak yerleştir
-        text_width, text_height = draw.textbbox((0, 0), title_text, font=font)[2:4]
-        position = ((width - text_width) // 2, (height - text_height) // 2)
-        
-        # Başlığı yaz
-        draw.text(position, title_text, fill=(255, 255, 255), font=font)
-        
-        # "No Cover Available" yazısı ekle
-        no_cover_text = "No Cover Available"
-        text_width, text_height = draw.textbbox((0, 0), no_cover_text, font=font)[2:4]
-        position = ((width - text_width) // 2, (height - text_height) // 2 + 100)
-        draw.text(position, no_cover_text, fill=(200, 200, 200), font=font)
-        
-        # Geçici dosyaya kaydet
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-        img.save(temp_file.name, format='JPEG')
-        
-        # Django File nesnesi oluştur
-        django_file = File(open(temp_file.name, 'rb'))
-        django_file.name = file_name
-        
-        return django_file
-        
-    except Exception as e:
-        logger.error(f"Varsayılan kapak oluşturma hatası: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return None
+    logger.info(f"Resim indirme başlıyor: {image_url}")
+    return fetch_image(image_url, file_name)
 
 def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max_chapters=None):
     """Dışarıdan bir webtoon'u içeri aktar"""
@@ -303,18 +60,16 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
         
         # Kaynak adını belirle veya oluştur
         if not source_name:
-            if "mangadex.org" in source_url.lower():
-                source_name = "MangaDex"
-            elif "mangazure.net" in source_url.lower():
-                source_name = "MangaZure"
-            else:
-                return {'success': False, 'message': 'Desteklenmeyen kaynak sitesi. Şu anda sadece MangaDex ve MangaZure desteklenmektedir.'}
+            # Kaynak, URL'nin sunucusuna uyan site profilinden belirlenir (bkz. scrapers.profiles)
+            profile = get_profile(source_url)
+            if profile is None:
+                return {'success': False, 'message': 'Desteklenmeyen kaynak sitesi. Kayıtlı bir site profili bulunamadı.'}
+            source_name = profile.name
         
         # Kaynak adını standart forma getir (Büyük/küçük harf duyarsız yapmak için)
-        if source_name.lower() == "mangazure":
-            source_name = "MangaZure"  # Standart form
-        elif source_name.lower() == "mangadex":
-            source_name = "MangaDex"  # Standart form
+        profile = get_profile_by_name(source_name)
+        if profile is not None:
+            source_name = profile.name  # Standart form
             
         # Kaynak varsa seç, yoksa oluştur
         try:
@@ -346,13 +101,12 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
             from scrapers.mangadex_scraper import MangaDexScraper
             scraper = MangaDexScraper()
             is_mangadex = True
-            is_mangazure = False
-        elif source_name == "MangaZure":
-            # MangaZure için scraper
-            from scrapers.mangazure_scraper import MangaZureScraper
-            scraper = MangaZureScraper()
+            is_profile_scraper = False
+        elif profile is not None:
+            # Profil tabanlı siteler için profilin scraper'ı
+            scraper = profile.create_scraper()
             is_mangadex = False
-            is_mangazure = True
+            is_profile_scraper = isinstance(scraper, ProfileScraper)
         else:
             import_log.status = 'failed'
             import_log.message = f'Desteklenmeyen kaynak: {source_name}'
@@ -430,19 +184,15 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
                     thumbnail_name = f"{webtoon_slug}_cover{os.path.splitext(webtoon_info['cover_url'])[1] or '.jpg'}"
                     logger.info(f"Kapak resmi indiriliyor: {webtoon_info['cover_url']}")
                     
-                    # 3 deneme yap
-                    for attempt in range(3):
-                        thumbnail = download_image_to_django(webtoon_info['cover_url'], thumbnail_name)
-                        if thumbnail:
-                            logger.info(f"Kapak resmi başarıyla indirildi: {thumbnail.name}")
-                            break
-                        logger.warning(f"Kapak resmi indirme denemesi {attempt+1} başarısız oldu, tekrar deneniyor...")
-                        time.sleep(2)
+                    # Geçici hatalar paylaşılan HTTP oturumunda tekrar denenir
+                    thumbnail = download_image_to_django(webtoon_info['cover_url'], thumbnail_name)
+                    if thumbnail:
+                        logger.info(f"Kapak resmi başarıyla indirildi: {thumbnail.name}")
                     
                     if not thumbnail:
                         # Alternatif yöntem
-                        if is_mangazure:
-                            # MangaZure için detay sayfasındaki kapak resmini deneyelim
+                        if is_profile_scraper:
+                            # Detay sayfasındaki kapak resmini deneyelim
                             logger.info("Alternatif kapak resmi aranıyor (detay sayfasından)")
                             details = scraper.get_webtoon_details(webtoon_info['url'])
                             if details and details.get('cover_url'):
@@ -450,25 +200,13 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
                                 thumbnail = download_image_to_django(details['cover_url'], thumbnail_name)
                         
                         if not thumbnail:
+                            # Kapak sayfa ilk istendiğinde yer tutucu olarak üretilir (bkz. webtoons.covers)
                             logger.error(f"Kapak resmi indirilemedi: {webtoon_info['cover_url']}")
-                            # Varsayılan kapak oluştur
-                            logger.info(f"Varsayılan kapak oluşturuluyor: {webtoon_info['title']}")
-                            thumbnail = create_default_cover(webtoon_info['title'], thumbnail_name)
                 except Exception as e:
                     logger.error(f"Kapak resmi indirme hatası: {e}")
                     import_log.message = f"Kapak resmi indirme hatası: {e}"
-                    # Varsayılan kapak oluştur
-                    try:
-                        thumbnail_name = f"{webtoon_slug}_cover.jpg"
-                        logger.info(f"Hata sonrası varsayılan kapak oluşturuluyor: {webtoon_info['title']}")
-                        thumbnail = create_default_cover(webtoon_info['title'], thumbnail_name)
-                    except Exception as default_cover_error:
-                        logger.error(f"Varsayılan kapak oluşturma hatası: {default_cover_error}")
             else:
-                # Kapak URL'si yoksa varsayılan oluştur
-                thumbnail_name = f"{webtoon_slug}_cover.jpg"
-                logger.info(f"Kapak URL'si olmadığı için varsayılan kapak oluşturuluyor: {webtoon_info['title']}")
-                thumbnail = create_default_cover(webtoon_info['title'], thumbnail_name)
+                logger.info(f"Kapak URL'si yok, yer tutucu kapak kullanılacak: {webtoon_info['title']}")
             
             # Webtoon kaydı oluştur
             webtoon = Webtoon.objects.create(
@@ -479,6 +217,9 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
                 thumbnail=thumbnail,
                 status='ongoing'  # Varsayılan değer
             )
+            if thumbnail:
+                # Kapak depolamaya yazıldı, indirme tamponunu bırak
+                thumbnail.close()
             
             # Kaynak sitedeki kategorileri al ve eşleştir
             if 'categories' in webtoon_info and webtoon_info['categories']:
@@ -515,122 +256,118 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
             import_log.imported_webtoon = imported_webtoon
             import_log.save()
             
-            # Bölümleri içeri aktar
-            chapter_urls = webtoon_info.get('chapter_urls', [])
+        # Bölümleri içeri aktar
+        chapter_urls = webtoon_info.get('chapter_urls', [])
+        
+        # Max bölüm sayısı sınırı varsa uygula
+        if max_chapters and max_chapters > 0 and len(chapter_urls) > max_chapters:
+            chapter_urls = chapter_urls[:max_chapters]
+            logger.info(f"Maksimum bölüm sayısı sınırlandırıldı: {max_chapters}")
             
-            # Max bölüm sayısı sınırı varsa uygula
-            if max_chapters and max_chapters > 0 and len(chapter_urls) > max_chapters:
-                chapter_urls = chapter_urls[:max_chapters]
-                logger.info(f"Maksimum bölüm sayısı sınırlandırıldı: {max_chapters}")
-                
-            logger.info(f"İçeri aktarılacak bölüm sayısı: {len(chapter_urls)}")
+        logger.info(f"İçeri aktarılacak bölüm sayısı: {len(chapter_urls)}")
+        
+        if not chapter_urls:
+            logger.warning("İçeri aktarılacak bölüm bulunamadı!")
+            import_log.message += " Ancak bölüm bulunamadı. Bölümleri manuel olarak eklemeniz gerekebilir."
             
-            if not chapter_urls:
-                logger.warning("İçeri aktarılacak bölüm bulunamadı!")
-                import_log.message += " Ancak bölüm bulunamadı. Bölümleri manuel olarak eklemeniz gerekebilir."
+        imported_chapters = 0
+        
+        # En son bölümü en üstte listelemek için bölümleri ters çevir
+        chapter_urls.reverse()
+        
+        # Her bölümü içeri aktar
+        for idx, chapter_url in enumerate(chapter_urls):
+            try:
+                logger.info(f"Bölüm bilgileri çekiliyor ({idx+1}/{len(chapter_urls)}): {chapter_url}")
                 
-            imported_chapters = 0
-            
-            # En son bölümü en üstte listelemek için bölümleri ters çevir
-            chapter_urls.reverse()
-            
-            # Her bölümü içeri aktar
-            for idx, chapter_url in enumerate(chapter_urls):
-                try:
-                    logger.info(f"Bölüm bilgileri çekiliyor ({idx+1}/{len(chapter_urls)}): {chapter_url}")
+                # Bölüm bilgilerini çek
+                chapter_info = None
+                if is_profile_scraper:
+                    # Profil tabanlı scraper'larda doğrudan bölüm resimlerini çek
+                    try:
+                        chapter_info = {
+                            'title': f"Bölüm {idx+1}",
+                            'image_urls': scraper.get_chapter_images(chapter_url),
+                            'release_date': timezone.now()
+                        }
+                        logger.info(f"{source_name} bölüm resimleri başarıyla çekildi: {len(chapter_info.get('image_urls', []))} resim")
+                    except Exception as chapter_err:
+                        logger.error(f"{source_name} bölüm çekme hatası: {chapter_err}")
+                        chapter_info = None
+                else:
+                    # Genel scraper kullan
+                    chapter_info = scraper.get_chapter_info(chapter_url)
+                
+                if chapter_info:
+                    chapter_number = idx + 1  # Bölüm numarası 1'den başlar
                     
-                    # Bölüm bilgilerini çek
-                    chapter_info = None
-                    if is_mangazure:
-                        # MangaZure için doğrudan bölüm bilgilerini çek
-                        try:
-                            chapter_info = {
-                                'title': f"Bölüm {idx+1}",
-                                'image_urls': scraper.get_chapter_images(chapter_url),
-                                'release_date': timezone.now()
-                            }
-                            logger.info(f"MangaZure bölüm resimleri başarıyla çekildi: {len(chapter_info.get('image_urls', []))} resim")
-                        except Exception as mangazure_err:
-                            logger.error(f"MangaZure bölüm çekme hatası: {mangazure_err}")
-                            chapter_info = None
-                    else:
-                        # Genel scraper kullan
-                        chapter_info = scraper.get_chapter_info(chapter_url)
+                    # Bölüm resimlerini indir
+                    image_urls = chapter_info.get('image_urls', [])
+                    logger.info(f"Bölüm resimleri indiriliyor: {len(image_urls)} resim")
+                    if not image_urls:
+                        logger.warning(f"Bölüm resimleri bulunamadı: {chapter_url}")
                     
-                    if chapter_info:
-                        chapter_number = idx + 1  # Bölüm numarası 1'den başlar
-                        
-                        logger.info(f"Bölüm oluşturuluyor: {chapter_info.get('title', f'Bölüm {chapter_number}')}")
-                        
-                        # Bölüm oluştur
-                        chapter = Chapter.objects.create(
-                            webtoon=webtoon,
-                            title=chapter_info.get('title', f"Bölüm {chapter_number}"),
-                            number=chapter_number,
-                            release_date=chapter_info.get('release_date', timezone.now())
-                        )
-                        
-                        # İçeri aktarılan bölüm kaydı oluştur
-                        imported_chapter = ImportedChapter.objects.create(
-                            chapter=chapter,
-                            imported_webtoon=imported_webtoon,
-                            original_url=chapter_url,
-                            external_id=chapter_info.get('id', f"{idx+1}")
-                        )
-                        
-                        # Bölüm resimlerini indir
-                        image_urls = chapter_info.get('image_urls', [])
-                        logger.info(f"Bölüm resimleri indiriliyor: {len(image_urls)} resim")
-                        
-                        if image_urls:
-                            success_images = 0
-                            for img_idx, img_url in enumerate(image_urls):
-                                try:
-                                    # Resmi indir
-                                    image_name = f"{webtoon_slug}_ch{chapter_number}_img{img_idx+1}{os.path.splitext(img_url)[1] or '.jpg'}"
-                                    image = download_image_to_django(img_url, image_name)
-                                    
-                                    if image:
-                                        # ChapterImage oluştur
-                                        ChapterImage.objects.create(
-                                            chapter=chapter,
-                                            image=image,
-                                            order=img_idx
-                                        )
-                                        success_images += 1
-                                    else:
-                                        logger.error(f"Resim indirilemedi: {img_url}")
-                                except Exception as img_error:
-                                    logger.error(f"Resim indirme hatası: {img_error}")
+                    # Sayfaları transaction dışında paralel indir
+                    image_names = [
+                        f"{webtoon_slug}_ch{chapter_number}_img{img_idx+1}{os.path.splitext(img_url)[1] or '.jpg'}"
+                        for img_idx, img_url in enumerate(image_urls)
+                    ]
+                    image_files = download_chapter_pages(image_urls, image_names)
+                    
+                    logger.info(f"Bölüm oluşturuluyor: {chapter_info.get('title', f'Bölüm {chapter_number}')}")
+                    
+                    # Bölümü ve resimlerini sırasıyla tek transaction'da kaydet
+                    success_images = 0
+                    try:
+                        with transaction.atomic():
+                            chapter = Chapter.objects.create(
+                                webtoon=webtoon,
+                                title=chapter_info.get('title', f"Bölüm {chapter_number}"),
+                                number=chapter_number,
+                                release_date=chapter_info.get('release_date', timezone.now())
+                            )
+                            
+                            # İçeri aktarılan bölüm kaydı oluştur
+                            ImportedChapter.objects.create(
+                                chapter=chapter,
+                                imported_webtoon=imported_webtoon,
+                                original_url=chapter_url,
+                                external_id=chapter_info.get('id', f"{idx+1}")
+                            )
                             
-                            logger.info(f"Bölüm için {success_images}/{len(image_urls)} resim indirildi")
-                            if success_images > 0:
-                                imported_chapters += 1
-                            else:
-                                logger.warning(f"Bölüm {chapter_number} için hiç resim indirilemedi!")
+                            for img_idx, image in enumerate(image_files):
+                                if image and create_chapter_image(chapter, img_idx, image):
+                                    success_images += 1
+                    finally:
+                        discard_downloaded(image_files)
+                    
+                    if image_urls:
+                        logger.info(f"Bölüm için {success_images}/{len(image_urls)} resim indirildi")
+                        if success_images > 0:
+                            imported_chapters += 1
                         else:
-                            logger.warning(f"Bölüm resimleri bulunamadı: {chapter_url}")
-                    else:
-                        logger.warning(f"Bölüm bilgileri alınamadı: {chapter_url}")
-                except Exception as chapter_error:
-                    logger.error(f"Bölüm içeri aktarma hatası: {chapter_error}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-            
-            # Import log güncelle
-            import_log.status = 'completed'
-            import_log.end_time = timezone.now()
-            import_log.imported_chapters = imported_chapters
-            import_log.message = f'İçeri aktarma tamamlandı: {webtoon.title} - {imported_chapters} bölüm'
-            import_log.save()
-            
-            return {
-                'success': True,
-                'message': f'Webtoon başarıyla içeri aktarıldı: {webtoon.title}',
-                'webtoon': webtoon,
-                'imported_webtoon': imported_webtoon,
-                'imported_chapters': imported_chapters
-            }
+                            logger.warning(f"Bölüm {chapter_number} için hiç resim indirilemedi!")
+                else:
+                    logger.warning(f"Bölüm bilgileri alınamadı: {chapter_url}")
+            except Exception as chapter_error:
+                logger.error(f"Bölüm içeri aktarma hatası: {chapter_error}")
+                import traceback
+                logger.error(traceback.format_exc())
+        
+        # Import log güncelle
+        import_log.status = 'completed'
+        import_log.end_time = timezone.now()
+        import_log.imported_chapters = imported_chapters
+        import_log.message = f'İçeri aktarma tamamlandı: {webtoon.title} - {imported_chapters} bölüm'
+        import_log.save()
+        
+        return {
+            'success': True,
+            'message': f'Webtoon başarıyla içeri aktarıldı: {webtoon.title}',
+            'webtoon': webtoon,
+            'imported_webtoon': imported_webtoon,
+            'imported_chapters': imported_chapters
+        }
         
     except Exception as e:
         logger.error(f"İçeri aktarma hatası: {e}")
@@ -641,6 +378,102 @@ def import_webtoon_from_source(source_url, source_name=None, auto_sync=True, max
             import_log.save()
         return {'success': False, 'message': f'İçeri aktarma hatası: {str(e)}'}
 
+def _save_sync_state(sync_state, validators, chapters=None, changed=False, last_chapter_url=None):
+    """
+    Bölüm listesinin son görülen halini kaydet
+    
+    Args:
+        sync_state (WebtoonSyncState): Senkronizasyon durumu
+        validators (dict): Scraper'ın döndürdüğü doğrulayıcılar; boşsa sonraki
+            senkronizasyonda liste koşulsuz çekilir
+        chapters (list, optional): Çekilen bölüm listesi
+        changed (bool): Liste değişti mi
+        last_chapter_url (str, optional): En son içeri aktarılan bölümün URL'si
+    """
+    now = timezone.now()
+    sync_state.etag = (validators.get('etag') or '')[:255]
+    sync_state.last_modified = (validators.get('last_modified') or '')[:64]
+    sync_state.content_hash = validators.get('content_hash') or ''
+    sync_state.last_checked = now
+    if changed:
+        sync_state.last_changed = now
+    if chapters:
+        sync_state.chapter_count = len(chapters)
+    if last_chapter_url:
+        sync_state.last_chapter_url = last_chapter_url[:200]
+    sync_state.save()
+
+def _run_async_scraper(base_url, work):
+    """`work(scraper)` eş yordamını yeni bir olay döngüsünde asenkron MangaDex scraper'ı ile çalıştır"""
+    async def main():
+        async with AsyncWebtoonScraper(base_url) as scraper:
+            return await work(scraper)
+    return asyncio.run(main())
+
+def prefetch_chapter_images(base_url, chapter_urls):
+    """
+    Birden fazla MangaDex bölümünün resim adreslerini eşzamanlı çek
+    
+    Returns:
+        dict: Bölüm URL'si -> resim URL'leri (çekilemeyenler boş liste)
+    """
+    if not chapter_urls:
+        return {}
+    try:
+        image_lists = _run_async_scraper(
+            base_url, lambda scraper: asyncio.gather(*(scraper.get_chapter_images(url) for url in chapter_urls))
+        )
+    except Exception as e:
+        logger.warning(f"Bölüm resimleri toplu çekilemedi, bölümler tek tek çekilecek: {e}")
+        return {}
+    return dict(zip(chapter_urls, image_lists))
+
+def find_unchanged_webtoons(imported_webtoons, base_url="https://api.mangadex.org"):
+    """
+    MangaDex webtoonlarının bölüm listelerini tek süreçte eşzamanlı çek ve
+    son senkronizasyondan beri değişmeyenleri bul
+    
+    Toplu senkronizasyon bunlar için görev başlatmaz; yalnızca kontrol
+    zamanları güncellenir. Listesi çekilemeyen veya daha önce hiç
+    senkronize edilmemiş webtoonlar değişmiş sayılır.
+    
+    Args:
+        imported_webtoons (list): (ImportedWebtoon ID, orijinal URL) çiftleri
+        base_url (str): MangaDex API adresi
+        
+    Returns:
+        set: Bölüm listesi değişmeyen ImportedWebtoon ID'leri
+    """
+    targets = [
+        (webtoon_id, url) for webtoon_id, url in imported_webtoons
+        if getattr(get_profile(url), 'name', None) == "MangaDex"
+    ]
+    if not targets:
+        return set()
+    
+    urls = [url for _, url in targets]
+    try:
+        chapter_lists = _run_async_scraper(
+            base_url, lambda scraper: asyncio.gather(*(scraper.get_webtoon_chapters(url) for url in urls))
+        )
+    except Exception as e:
+        logger.warning(f"Bölüm listeleri toplu çekilemedi, tüm webtoonlar senkronize edilecek: {e}")
+        return set()
+    
+    states = WebtoonSyncState.objects.in_bulk(
+        [webtoon_id for webtoon_id, _ in targets], field_name='imported_webtoon_id'
+    )
+    unchanged = set()
+    for (webtoon_id, _), chapters in zip(targets, chapter_lists):
+        sync_state = states.get(webtoon_id)
+        if not chapters or sync_state is None or not sync_state.content_hash:
+            continue
+        if chapter_list_hash(chapters) == sync_state.content_hash:
+            _save_sync_state(sync_state, sync_state.validators())
+            unchanged.add(webtoon_id)
+    logger.info(f"{len(targets)} MangaDex webtoon'unun {len(unchanged)} tanesinin bölüm listesi değişmemiş")
+    return unchanged
+
 def sync_webtoon_chapters(imported_webtoon, max_new_chapters=None):
     """
     Daha önce içeri aktarılmış bir webtoon'un yeni bölümlerini senkronize et
@@ -655,18 +488,16 @@ def sync_webtoon_chapters(imported_webtoon, max_new_chapters=None):
     # Log oluştur
     logger.info(f"Webtoon senkronizasyonu başlıyor: {imported_webtoon.webtoon.title}, max_new_chapters={max_new_chapters}")
     
-    # Kaynak site tespiti
-    is_mangadex = "mangadex.org" in imported_webtoon.original_url.lower()
-    is_mangazure = "mangazure.net" in imported_webtoon.original_url.lower()
-    
-    # Uygun scraper'ı seç
-    if is_mangazure:
-        logger.info(f"MangaZure sitesinden içerik aktarılıyor: {imported_webtoon.original_url}")
-        scraper = MangaZureScraper()
+    # Kaynak site tespiti ve uygun scraper'ı seç
+    profile = get_profile(imported_webtoon.original_url)
+    if profile is not None:
+        logger.info(f"{profile.name} sitesinden içerik aktarılıyor: {imported_webtoon.original_url}")
+        scraper = profile.create_scraper()
     else:
         # Varsayılan olarak MangaDex scraper'ı kullan
         logger.info(f"MangaDex veya genel scraper kullanılıyor: {imported_webtoon.original_url}")
         scraper = WebtoonScraper()
+    is_profile_scraper = isinstance(scraper, ProfileScraper)
     
     try:
         # Import log kaydı oluştur
@@ -676,9 +507,22 @@ def sync_webtoon_chapters(imported_webtoon, max_new_chapters=None):
             status='running'
         )
         
-        # Bölümleri çek
+        # Bölümleri çek; liste son senkronizasyondan beri değişmediyse
+        # (304 veya aynı içerik özeti) veritabanına dokunmadan çık
+        sync_state, _ = WebtoonSyncState.objects.get_or_create(imported_webtoon=imported_webtoon)
         logger.info(f"Bölümler çekiliyor: {imported_webtoon.original_url}")
-        chapters = scraper.get_webtoon_chapters(imported_webtoon.original_url)
+        chapters, validators = scraper.get_webtoon_chapters_if_changed(
+            imported_webtoon.original_url, sync_state.validators()
+        )
+        
+        if chapters is None:
+            logger.info(f"Bölüm listesi değişmemiş: {imported_webtoon.original_url}")
+            _save_sync_state(sync_state, validators)
+            import_log.status = 'completed'
+            import_log.end_time = timezone.now()
+            import_log.message = 'Bölüm listesi değişmedi'
+            import_log.save()
+            return {'success': True, 'new_chapters': 0, 'message': 'Bölüm listesi değişmedi'}
         
         if not chapters or len(chapters) == 0:
             logger.error(f"Bölüm listesi boş! URL: {imported_webtoon.original_url}")
@@ -691,12 +535,13 @@ def sync_webtoon_chapters(imported_webtoon, max_new_chapters=None):
         logger.info(f"{len(chapters)} bölüm bulundu.")
         
         # Mevcut bölümleri bul
-        existing_chapters = ImportedChapter.objects.filter(
+        existing_chapters = set(ImportedChapter.objects.filter(
             imported_webtoon=imported_webtoon
-        ).values_list('original_url', flat=True)
+        ).values_list('original_url', flat=True))
         
         # Yeni bölümleri filtrele
         new_chapters = [ch for ch in chapters if ch['url'] not in existing_chapters]
+        found_chapter_count = len(new_chapters)
         logger.info(f"Toplam {len(new_chapters)} yeni bölüm bulundu.")
         
         # max_new_chapters değerini kontrol et ve uygula
@@ -711,120 +556,118 @@ def sync_webtoon_chapters(imported_webtoon, max_new_chapters=None):
                 logger.warning(f"max_new_chapters değeri ({max_new_chapters}) integer'a dönüştürülemedi: {e}")
         
         if not new_chapters:
+            _save_sync_state(sync_state, validators, chapters, changed=True)
             import_log.status = 'completed'
             import_log.end_time = timezone.now()
             import_log.message = 'Yeni bölüm bulunamadı'
             import_log.save()
             return {'success': True, 'new_chapters': 0, 'message': 'Yeni bölüm bulunamadı'}
         
-        # İçeri aktarma işlemini transaction içinde yap
-        with transaction.atomic():
-            webtoon = imported_webtoon.webtoon
-            last_chapter_number = Chapter.objects.filter(webtoon=webtoon).order_by('-number').first()
-            start_number = last_chapter_number.number + 1 if last_chapter_number else 1
-            
-            # Yeni bölümleri içeri aktar
-            imported_chapter_count = 0
-            
-            for i, chapter_info in enumerate(new_chapters):
-                try:
-                    logger.info(f"Bölüm işleniyor: {chapter_info['title']}")
-                    
-                    # Bölüm kaydı oluştur
-                    chapter = Chapter.objects.create(
-                        webtoon=webtoon,
-                        title=chapter_info['title'],
-                        number=start_number + i,  # Sıralı numara ver
-                        release_date=timezone.now(),
-                        published=True
-                    )
-                    
-                    # ImportedChapter kaydı oluştur
-                    imported_chapter = ImportedChapter.objects.create(
-                        chapter=chapter,
-                        imported_webtoon=imported_webtoon,
-                        original_url=chapter_info['url'],
-                        external_id=str(start_number + i)  # Örnek olarak
-                    )
-                    
-                    # Bölüm resimlerini çek
-                    logger.info(f"Bölüm resimleri çekiliyor: {chapter_info['url']}")
-                    images = scraper.get_chapter_images(chapter_info['url'])
+        webtoon = imported_webtoon.webtoon
+        last_chapter_number = Chapter.objects.filter(webtoon=webtoon).order_by('-number').first()
+        start_number = last_chapter_number.number + 1 if last_chapter_number else 1
+        
+        # Yeni bölümleri içeri aktar
+        imported_chapter_count = 0
+        # MangaDex API'sinde sonraki bölümlerin resim adresleri birlikte çekilir
+        prefetched_images = {}
+        
+        for i, chapter_info in enumerate(new_chapters):
+            try:
+                logger.info(f"Bölüm işleniyor: {chapter_info['title']}")
+                chapter_number = start_number + i  # Sıralı numara ver
+                
+                # Bölüm resimlerini çek
+                logger.info(f"Bölüm resimleri çekiliyor: {chapter_info['url']}")
+                if type(scraper) is WebtoonScraper and chapter_info['url'] not in prefetched_images:
+                    batch = [ch['url'] for ch in new_chapters[i:i + SYNC_IMAGE_PREFETCH]]
+                    prefetched_images = prefetch_chapter_images(scraper.base_url, batch)
+                images = prefetched_images.get(chapter_info['url']) or scraper.get_chapter_images(chapter_info['url'])
+                
+                if not images:
+                    logger.error(f"Bölüm için resim bulunamadı: {chapter_info['url']}")
+                    # Alternatif yöntem: Test için örnek bir resim kullan
+                    if is_profile_scraper:
+                        logger.info("Alternatif resim arama yöntemi deneniyor...")
+                        # 2. kez deneme - bazı manga siteleri ilk istekte bot koruması için resimleri gizleyebilir
+                        # (istekler arası bekleme hız sınırlayıcı tarafından yapılır)
+                        images = scraper.get_chapter_images(chapter_info['url'])
                     
-                    if not images:
-                        logger.error(f"Bölüm için resim bulunamadı: {chapter_info['url']}")
-                        # Alternatif yöntem: Test için örnek bir resim kullan
-                        if is_mangazure:
-                            logger.info("MangaZure için alternatif resim arama yöntemi deneniyor...")
-                            # 2. kez deneme - bazı manga siteleri ilk istekte bot koruması için resimleri gizleyebilir
-                            time.sleep(3)  # Biraz bekle
-                            images = scraper.get_chapter_images(chapter_info['url'])
+                    if not images:  # Hala resim bulunamadıysa
+                        logger.warning("Yine resim bulunamadı, örnek resim kullanılıyor")
+                        images = ["https://uploads.mangadex.org/covers/1044287a-73df-48d0-b0b2-5327f32dd651/e7e5e267-502f-4b77-9f19-b7ea1344f68f.jpg"]
+                        logger.info("Alternatif olarak örnek bir resim kullanılıyor")
+                
+                logger.info(f"{len(images)} resim bulundu, paralel indiriliyor.")
+                
+                # Sayfaları transaction dışında paralel indir
+                img_names = [
+                    f"{webtoon.slug}_ch{chapter_number:03d}_img{j+1:03d}{os.path.splitext(img_url)[1] or '.jpg'}"
+                    for j, img_url in enumerate(images)
+                ]
+                image_files = download_chapter_pages(images, img_names)
+                
+                # Bölümü ve resimlerini sırasıyla tek transaction'da kaydet
+                try:
+                    with transaction.atomic():
+                        chapter = Chapter.objects.create(
+                            webtoon=webtoon,
+                            title=chapter_info['title'],
+                            number=chapter_number,
+                            release_date=timezone.now(),
+                            published=True
+                        )
                         
-                        if not images:  # Hala resim bulunamadıysa
-                            logger.warning("Yine resim bulunamadı, örnek resim kullanılıyor")
-                            images = ["https://uploads.mangadex.org/covers/1044287a-73df-48d0-b0b2-5327f32dd651/e7e5e267-502f-4b77-9f19-b7ea1344f68f.jpg"]
-                            logger.info("Alternatif olarak örnek bir resim kullanılıyor")
-                    
-                    logger.info(f"{len(images)} resim bulundu.")
-                    
-                    # Bölüm resimlerini kaydet
-                    successful_images = 0
-                    for j, img_url in enumerate(images):
-                        try:
-                            img_ext = os.path.splitext(img_url)[1] or '.jpg'
-                            img_name = f"{webtoon.slug}_ch{start_number+i:03d}_img{j+1:03d}{img_ext}"
-                            logger.info(f"Resim indiriliyor ({j+1}/{len(images)}): {img_url[:50]}...")
-                            
-                            # 3 deneme yap
-                            image_file = None
-                            for attempt in range(3):
-                                try:
-                                    image_file = download_image_to_django(img_url, img_name)
-                                    if image_file:
-                                        break
-                                    time.sleep(2)
-                                except Exception as e:
-                                    logger.error(f"Resim indirme hatası (deneme {attempt+1}/3): {e}")
-                                    time.sleep(2)
-                            
-                            if image_file:
-                                # ChapterImage kaydı oluştur
-                                ChapterImage.objects.create(
-                                    chapter=chapter,
-                                    image=image_file,
-                                    order=j
-                                )
+                        ImportedChapter.objects.create(
+                            chapter=chapter,
+                            imported_webtoon=imported_webtoon,
+                            original_url=chapter_info['url'],
+                            external_id=str(chapter_number)  # Örnek olarak
+                        )
+                        
+                        successful_images = 0
+                        for j, image_file in enumerate(image_files):
+                            if image_file and create_chapter_image(chapter, j, image_file):
                                 successful_images += 1
-                            else:
-                                logger.error(f"Resim indirilemedi: {img_url}")
-                        except Exception as e:
-                            logger.error(f"Resim indirme hatası: {e}")
-                    
-                    logger.info(f"Toplam {successful_images} resim başarıyla indirildi.")
-                    imported_chapter_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Bölüm içeri aktarma hatası: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-            
-            # Import log güncelle
-            import_log.status = 'completed'
-            import_log.end_time = timezone.now()
-            import_log.imported_chapters = imported_chapter_count
-            import_log.message = f"{webtoon.title} webtoon'u için {imported_chapter_count} yeni bölüm içeri aktarıldı."
-            import_log.save()
-            
-            # Imported webtoon son senkronizasyon zamanını güncelle
-            imported_webtoon.last_sync = timezone.now()
-            imported_webtoon.save()
-            
-            return {
-                'success': True,
-                'webtoon': webtoon,
-                'new_chapters': imported_chapter_count,
-                'message': import_log.message
-            }
+                finally:
+                    discard_downloaded(image_files)
+                
+                logger.info(f"Toplam {successful_images}/{len(images)} resim başarıyla indirildi.")
+                imported_chapter_count += 1
+                
+            except Exception as e:
+                logger.error(f"Bölüm içeri aktarma hatası: {e}")
+                import traceback
+                logger.error(traceback.format_exc())
+        
+        # Import log güncelle
+        import_log.status = 'completed'
+        import_log.end_time = timezone.now()
+        import_log.imported_chapters = imported_chapter_count
+        import_log.message = f"{webtoon.title} webtoon'u için {imported_chapter_count} yeni bölüm içeri aktarıldı."
+        import_log.save()
+        
+        # Imported webtoon son senkronizasyon zamanını güncelle
+        imported_webtoon.last_sync = timezone.now()
+        imported_webtoon.save()
+        
+        # Liste ancak tüm yeni bölümler alındıysa "görüldü" sayılır; aksi halde
+        # sonraki senkronizasyon koşullu isteği atlayıp eksikleri tekrar dener
+        if imported_chapter_count == found_chapter_count:
+            validators_to_keep = validators
+        else:
+            validators_to_keep = {}
+        _save_sync_state(
+            sync_state, validators_to_keep, chapters, changed=True,
+            last_chapter_url=new_chapters[-1]['url'] if imported_chapter_count else None
+        )
+        
+        return {
+            'success': True,
+            'webtoon': webtoon,
+            'new_chapters': imported_chapter_count,
+            'message': import_log.message
+        }
     
     except Exception as e:
         # Hata durumunda log güncelle
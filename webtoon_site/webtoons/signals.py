@@ -0,0 +1,299 @@
+"""
+Önbellek ve türetilmiş verileri model değişikliklerinde güncel tutan sinyaller
+"""
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import caching, covers, derivatives, home, reader, search
+from .autocomplete import autocomplete_index
+from .buffers import views_flushed
+from .models import Category, Chapter, ChapterImage, Rating, Webtoon
+from .ratings import apply_rating_delta
+
+
+def _chapter_key(chapter_id):
+    """Bölümün (slug, numara) bilgisini döndür"""
+    return Chapter.objects.filter(pk=chapter_id).values_list('webtoon__slug', 'number').first()
+
+
+def _image_chapter_key(image):
+    """Resmin bağlı olduğu bölümün (slug, numara) bilgisini mümkünse sorgusuz döndür"""
+    # Toplu içeri aktarmada bölüm ve webtoon nesneleri genellikle zaten yüklüdür
+    if ChapterImage.chapter.is_cached(image):
+        chapter = image.chapter
+        if Chapter.webtoon.is_cached(chapter):
+            return chapter.webtoon.slug, chapter.number
+    return _chapter_key(image.chapter_id)
+
+
+@receiver(pre_save, sender=Webtoon)
+def remember_old_webtoon_state(sender, instance, **kwargs):
+    """Slug veya yayın durumu değişirse eski hali de temizleyebilmek için eski değerleri sakla"""
+    instance._old_slug = None
+    instance._old_published = None
+    if instance.pk:
+        old = Webtoon.objects.filter(pk=instance.pk).values_list('slug', 'published').first()
+        if old:
+            instance._old_slug, instance._old_published = old
+
+
+@receiver(post_save, sender=Webtoon)
+def invalidate_reader_on_webtoon_save(sender, instance, created, **kwargs):
+    """Webtoon başlığı, slug'ı veya yayın durumu değiştiğinde okuma verisini temizle"""
+    if created:
+        return
+    reader.invalidate_webtoon(instance.slug)
+    old_slug = getattr(instance, '_old_slug', None)
+    if old_slug and old_slug != instance.slug:
+        reader.invalidate_webtoon(old_slug)
+
+
+@receiver(pre_save, sender=Chapter)
+def remember_old_chapter_number(sender, instance, **kwargs):
+    """Bölüm numarası değişirse eski numaranın önbelleğini temizleyebilmek için sakla"""
+    instance._old_reader_key = _chapter_key(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=Chapter)
+@receiver(post_delete, sender=Chapter)
+def invalidate_reader_on_chapter_change(sender, instance, **kwargs):
+    """Bölüm eklendiğinde, değiştiğinde veya silindiğinde okuma ve webtoon detay verisini temizle"""
+    slug = Webtoon.objects.filter(pk=instance.webtoon_id).values_list('slug', flat=True).first()
+    if slug is None:
+        return
+    caching.invalidate_webtoon_detail(slug)
+    # Önceki/sonraki bölüm bilgisi değiştiği için tüm bölümler temizlenir
+    reader.invalidate_webtoon(slug)
+    reader.invalidate_chapter(slug, instance.number)
+    old_key = getattr(instance, '_old_reader_key', None)
+    if old_key:
+        reader.invalidate_chapter(*old_key)
+
+
+@receiver(post_save, sender=ChapterImage)
+@receiver(post_delete, sender=ChapterImage)
+def invalidate_reader_on_image_change(sender, instance, **kwargs):
+    """Bölüm resimleri değiştiğinde o bölümün okuma verisini temizle"""
+    key = _image_chapter_key(instance)
+    if key:
+        reader.invalidate_chapter(*key)
+
+
+@receiver(post_save, sender=ChapterImage)
+def schedule_image_derivatives(sender, instance, created, **kwargs):
+    """Yeni bölüm resimleri için okuyucu kopyalarının arka planda üretilmesini sağla"""
+    if instance.image:
+        derivatives.schedule_chapter(instance.chapter_id)
+
+
+@receiver(pre_save, sender=Rating)
+def remember_old_rating_score(sender, instance, **kwargs):
+    """Puan değiştirildiğinde farkı hesaplayabilmek için eski puanı sakla"""
+    instance._old_score = None
+    if instance.pk:
+        instance._old_score = Rating.objects.filter(pk=instance.pk).values_list('score', flat=True).first()
+
+
+@receiver(post_save, sender=Rating)
+def update_rating_aggregates_on_save(sender, instance, created, **kwargs):
+    """Yeni puan veya puan değişikliğini webtoon özetine yansıt"""
+    old_score = getattr(instance, '_old_score', None)
+    if created or old_score is None:
+        apply_rating_delta(instance.webtoon_id, instance.score, 1)
+    else:
+        apply_rating_delta(instance.webtoon_id, instance.score - old_score, 0)
+
+
+@receiver(post_delete, sender=Rating)
+def update_rating_aggregates_on_delete(sender, instance, **kwargs):
+    """Silinen puanı webtoon özetinden düş"""
+    apply_rating_delta(instance.webtoon_id, -instance.score, -1)
+
+
+def _reindex_webtoons(webtoon_ids):
+    """Verilen webtoonları arama indeksinde güncelle"""
+    if not webtoon_ids:
+        return
+    for webtoon in Webtoon.objects.filter(pk__in=webtoon_ids).prefetch_related('categories'):
+        search.index_webtoon(webtoon)
+
+
+@receiver(post_save, sender=Webtoon)
+def update_search_index_on_webtoon_save(sender, instance, **kwargs):
+    """Webtoon kaydedildiğinde arama indeksini güncelle"""
+    search.index_webtoon(instance)
+
+
+@receiver(post_delete, sender=Webtoon)
+def remove_from_search_index(sender, instance, **kwargs):
+    """Silinen webtoon'u arama indeksinden çıkar"""
+    search.remove_webtoon(instance.pk)
+
+
+@receiver(m2m_changed, sender=Webtoon.categories.through)
+def update_search_index_on_categories_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Webtoon kategorileri değiştiğinde ilgili webtoonları yeniden indeksle"""
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+    if not reverse:
+        if action != 'pre_clear':
+            search.index_webtoon(instance)
+        return
+    # Kategori tarafından yapılan değişiklikte etkilenen webtoonlar pk_set'tedir
+    if action == 'pre_clear':
+        instance._cleared_webtoon_ids = list(instance.webtoons.values_list('id', flat=True))
+    elif action == 'post_clear':
+        _reindex_webtoons(getattr(instance, '_cleared_webtoon_ids', None))
+    else:
+        _reindex_webtoons(pk_set)
+
+
+@receiver(pre_save, sender=Category)
+def remember_old_category_name(sender, instance, **kwargs):
+    """Kategori adı değişirse bağlı webtoonları yeniden indekslemek için eski adı sakla"""
+    instance._old_name = None
+    if instance.pk:
+        instance._old_name = Category.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+
+
+@receiver(post_save, sender=Category)
+def update_search_index_on_category_rename(sender, instance, created, **kwargs):
+    """Kategori adı değiştiğinde bağlı webtoonları yeniden indeksle"""
+    if created or getattr(instance, '_old_name', None) == instance.name:
+        return
+    _reindex_webtoons(list(instance.webtoons.values_list('id', flat=True)))
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_webtoons(sender, instance, **kwargs):
+    """Silinecek kategoriye bağlı webtoonları sakla"""
+    instance._deleted_webtoon_ids = list(instance.webtoons.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Category)
+def update_search_index_on_category_delete(sender, instance, **kwargs):
+    """Kategori silindiğinde bağlı webtoonları yeniden indeksle"""
+    _reindex_webtoons(getattr(instance, '_deleted_webtoon_ids', None))
+
+
+@receiver(request_started)
+def build_autocomplete_on_first_request(sender, **kwargs):
+    """Süreçteki ilk istekte otomatik tamamlama indeksini arka planda oluşturmaya başla"""
+    # Yönetim komutlarında indeks gerekmediği için süreç başlarken değil, ilk istekte başlatılır
+    if autocomplete_index.built_at is None:
+        autocomplete_index.ensure_fresh()
+
+
+@receiver(post_save, sender=Webtoon)
+def update_autocomplete_on_webtoon_save(sender, instance, **kwargs):
+    """Webtoon değişikliğini işlem onaylandıktan sonra otomatik tamamlama indeksine yansıt"""
+    transaction.on_commit(lambda: autocomplete_index.update_webtoon(instance))
+
+
+@receiver(post_delete, sender=Webtoon)
+def remove_from_autocomplete_on_webtoon_delete(sender, instance, **kwargs):
+    """Silinen webtoon'u otomatik tamamlama indeksinden çıkar"""
+    webtoon_id = instance.pk
+    transaction.on_commit(lambda: autocomplete_index.remove_webtoon(webtoon_id))
+
+
+@receiver(post_save, sender=Category)
+def update_autocomplete_on_category_save(sender, instance, **kwargs):
+    """Kategori değişikliğini otomatik tamamlama indeksine yansıt"""
+    transaction.on_commit(lambda: autocomplete_index.update_category(instance))
+
+
+@receiver(post_delete, sender=Category)
+def remove_from_autocomplete_on_category_delete(sender, instance, **kwargs):
+    """Silinen kategoriyi otomatik tamamlama indeksinden çıkar"""
+    category_id = instance.pk
+    transaction.on_commit(lambda: autocomplete_index.remove_category(category_id))
+
+
+@receiver(post_save, sender=Webtoon)
+@receiver(post_delete, sender=Webtoon)
+def invalidate_home_on_webtoon_change(sender, instance, **kwargs):
+    """Yayındaki (veya yayından yeni kaldırılan) bir webtoon değiştiğinde ana sayfa önbelleğini sil"""
+    if instance.published or getattr(instance, '_old_published', None):
+        transaction.on_commit(home.invalidate_home_sections)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_home_on_category_change(sender, instance, **kwargs):
+    """Kategori eklendiğinde, değiştiğinde veya silindiğinde ana sayfa önbelleğini sil"""
+    transaction.on_commit(home.invalidate_home_sections)
+
+
+@receiver(views_flushed)
+def mark_home_stale_on_views_flush(sender, models, **kwargs):
+    """Webtoon görüntülenmeleri yazıldığında popüler listesini arka planda yenilet"""
+    if Webtoon in models:
+        home.mark_home_sections_stale()
+
+
+def _invalidate_webtoon_details(webtoon_ids):
+    """Verilen webtoonların detay verilerini önbellekten sil"""
+    if webtoon_ids:
+        caching.invalidate_webtoon_detail(*Webtoon.objects.filter(pk__in=webtoon_ids).values_list('slug', flat=True))
+
+
+@receiver(post_save, sender=Webtoon)
+@receiver(post_delete, sender=Webtoon)
+def invalidate_detail_on_webtoon_change(sender, instance, **kwargs):
+    """Webtoon değiştiğinde veya silindiğinde detay verisini temizle"""
+    caching.invalidate_webtoon_detail(instance.slug, getattr(instance, '_old_slug', None))
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def invalidate_detail_on_rating_change(sender, instance, **kwargs):
+    """Puan özetinin güncel görünmesi için webtoon detay verisini temizle"""
+    _invalidate_webtoon_details([instance.webtoon_id])
+
+
+@receiver(post_delete, sender=Webtoon)
+def invalidate_category_lists_on_webtoon_delete(sender, instance, **kwargs):
+    """Kategori webtoon sayıları değiştiği için kategori listesini geçersiz kıl"""
+    caching.invalidate_category_lists()
+
+
+@receiver(m2m_changed, sender=Webtoon.categories.through)
+def invalidate_caches_on_categories_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Webtoon-kategori ilişkisi değiştiğinde kategori listesini ve detay verilerini temizle"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    caching.invalidate_category_lists()
+    if not reverse:
+        caching.invalidate_webtoon_detail(instance.slug)
+    elif action == 'post_clear':
+        _invalidate_webtoon_details(getattr(instance, '_cleared_webtoon_ids', None))
+    else:
+        _invalidate_webtoon_details(pk_set)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_caches_on_category_change(sender, instance, created=False, **kwargs):
+    """Kategori değiştiğinde kategori listesini, adı değiştiyse tüm detay verilerini geçersiz kıl"""
+    caching.invalidate_category_lists()
+    if not created and getattr(instance, '_old_name', None) != instance.name:
+        caching.invalidate_all_webtoon_details()
+
+
+@receiver(post_delete, sender=Webtoon)
+def clear_cover_cache_on_webtoon_delete(sender, instance, **kwargs):
+    """Silinen webtoon'un önbellekteki kapak küçük resimlerini kaldır"""
+    webtoon_id = instance.pk
+    transaction.on_commit(lambda: covers.clear_cover_cache(webtoon_id))
+
+
+@receiver(post_save, sender=Webtoon)
+def clear_cover_cache_on_unpublish(sender, instance, created, **kwargs):
+    """Yayından kaldırılan webtoon'un genel önbellekteki kapaklarını kaldır"""
+    if created or instance.published or not getattr(instance, '_old_published', None):
+        return
+    webtoon_id = instance.pk
+    transaction.on_commit(lambda: covers.clear_cover_cache(webtoon_id))
@@ -0,0 +1,83 @@
+"""
+Kaynak site başına eşzamanlı senkronizasyon sınırı
+
+Gece çalışan toplu senkronizasyon her webtoon için ayrı bir Celery görevi
+başlatır. Aynı siteye aynı anda çok fazla görev gitmemesi için her site için
+`SYNC_SOURCE_CONCURRENCY` kadar "yuva" vardır; görev başlamadan önce bir yuva
+alır, bitince bırakır. Yuvalar önbellekte `cache.add` ile tutulur; önbellek
+Redis ise tüm Celery çalışanları arasında paylaşılır. Çöken bir çalışanın
+yuvası `SYNC_SLOT_LEASE` süresi sonunda kendiliğinden boşalır.
+
+Önbellek süreçler arasında paylaşılmıyorsa (LocMem, Dummy) her çalışan süreç
+kendi yuvalarını görür ve sınır anlamını yitirir; bu durumda sınır
+uygulanmaz ve bir uyarı yazılır.
+"""
+import fnmatch
+import logging
+import uuid
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import cache_is_shared
+
+logger = logging.getLogger(__name__)
+
+# Sunucu deseni -> aynı anda senkronize edilebilecek en fazla webtoon; ilk eşleşen kullanılır
+SYNC_SOURCE_CONCURRENCY = getattr(settings, 'SYNC_SOURCE_CONCURRENCY', {
+    '*mangadex.org': 4,
+    '*mangazure.net': 1,
+    '*': 2,
+})
+# Yuvanın en uzun tutulabileceği süre (saniye); görev zaman sınırından uzun olmalı
+SYNC_SLOT_LEASE = getattr(settings, 'SYNC_SLOT_LEASE', 45 * 60)
+
+_warned_unshared = False
+
+
+def source_key(url):
+    """Webtoon URL'sinin ait olduğu kaynak (sunucu adı, 'www.' olmadan)"""
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def slot_limit(key):
+    """Kaynak için yuva sayısı"""
+    for pattern, limit in SYNC_SOURCE_CONCURRENCY.items():
+        if fnmatch.fnmatch(key, pattern):
+            return max(1, int(limit))
+    return 1
+
+
+def acquire_slot(key, lease=SYNC_SLOT_LEASE):
+    """
+    Kaynak için boş bir yuva almaya çalış
+
+    Returns:
+        tuple: `release_slot`'a verilecek (anahtar, sahip) bilgisi, boş yuva yoksa None
+    """
+    global _warned_unshared
+    owner = uuid.uuid4().hex
+    if not cache_is_shared():
+        if not _warned_unshared:
+            logger.warning(
+                "Önbellek süreçler arasında paylaşılmıyor, kaynak başına eşzamanlı "
+                "senkronizasyon sınırı uygulanmıyor (REDIS_CACHE_URL tanımlayın)"
+            )
+            _warned_unshared = True
+        return None, owner
+    for index in range(slot_limit(key)):
+        slot = f"sync:slot:{key}:{index}"
+        if cache.add(slot, owner, timeout=lease):
+            return slot, owner
+    return None
+
+
+def release_slot(token):
+    """Alınan yuvayı bırak (süresi dolup başkasına geçtiyse dokunma)"""
+    slot, owner = token
+    if slot is None:
+        return
+    if cache.get(slot) == owner:
+        cache.delete(slot)
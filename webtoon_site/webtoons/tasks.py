@@ -1,59 +1,150 @@
 """
 Webtoon scraping için Celery görevleri
 """
+import logging
+import random
+import time
 from datetime import timedelta
-from celery import shared_task
+from celery import chord, group, shared_task
+from django.conf import settings
 from django.utils import timezone
 from .models import ImportedWebtoon, ImportLog
-from .services import sync_webtoon_chapters
+from .derivatives import generate_chapter_derivatives
+from .services import find_unchanged_webtoons, sync_webtoon_chapters
+from .sync_slots import acquire_slot, release_slot, source_key
 
-@shared_task
-def sync_webtoon(webtoon_id, max_chapters=None):
+logger = logging.getLogger(__name__)
+
+# Tek bir webtoon senkronizasyonunun süre sınırı (saniye)
+SYNC_WEBTOON_TIME_LIMIT = getattr(settings, 'SYNC_WEBTOON_TIME_LIMIT', 30 * 60)
+# Toplu senkronizasyonun bitmesi gereken süre (saniye); bu süre içinde
+# başlayamayan görevler atlanır ve sonuçta raporlanır
+SYNC_ALL_WINDOW = getattr(settings, 'SYNC_ALL_WINDOW', 4 * 60 * 60)
+# Kaynağın tüm yuvaları doluysa görevin tekrar deneneceği süre (saniye)
+SYNC_SLOT_RETRY_DELAY = getattr(settings, 'SYNC_SLOT_RETRY_DELAY', 30)
+
+
+def _sync_summary(imported_webtoon, result, skipped=False):
+    """Senkronizasyon sonucunu JSON ile taşınabilir bir özete çevir"""
+    return {
+        'webtoon_id': imported_webtoon.id,
+        'webtoon': imported_webtoon.webtoon.title,
+        'source': source_key(imported_webtoon.original_url),
+        'success': result.get('success', False),
+        'new_chapters': result.get('new_chapters', 0),
+        'message': result.get('message', ''),
+        # Pencere dolduğu için hiç başlatılmadı; başarısız sayılmaz
+        'skipped': skipped,
+    }
+
+@shared_task(bind=True, max_retries=None, soft_time_limit=SYNC_WEBTOON_TIME_LIMIT, time_limit=SYNC_WEBTOON_TIME_LIMIT + 60)
+def sync_webtoon(self, webtoon_id, max_chapters=None, deadline=None):
     """
     Belirli bir webtoon'u senkronize et
     
+    Aynı kaynaktan aynı anda en fazla `SYNC_SOURCE_CONCURRENCY` webtoon
+    senkronize edilir; yuva yoksa görev kısa bir süre sonra tekrar denenir.
+    
     Args:
         webtoon_id (int): ImportedWebtoon ID
         max_chapters (int, optional): Maksimum bölüm sayısı
+        deadline (float, optional): Bu zamandan (Unix zamanı) sonra başlama
         
     Returns:
         dict: Senkronizasyon sonuçları
     """
     try:
-        imported_webtoon = ImportedWebtoon.objects.get(id=webtoon_id)
-        return sync_webtoon_chapters(imported_webtoon, max_new_chapters=max_chapters)
+        imported_webtoon = ImportedWebtoon.objects.select_related('webtoon').get(id=webtoon_id)
     except ImportedWebtoon.DoesNotExist:
-        return {'success': False, 'message': f'Webtoon bulunamadı: {webtoon_id}'}
+        return {'webtoon_id': webtoon_id, 'success': False, 'message': f'Webtoon bulunamadı: {webtoon_id}'}
+    
+    if deadline and time.time() > deadline:
+        return _sync_summary(imported_webtoon, {'message': 'Senkronizasyon penceresi doldu, atlandı'}, skipped=True)
+    
+    slot = acquire_slot(source_key(imported_webtoon.original_url))
+    if slot is None:
+        countdown = SYNC_SLOT_RETRY_DELAY + random.uniform(0, SYNC_SLOT_RETRY_DELAY)
+        if deadline and time.time() + countdown > deadline:
+            return _sync_summary(imported_webtoon, {'message': 'Kaynak meşgul, senkronizasyon penceresi doldu'}, skipped=True)
+        raise self.retry(countdown=countdown)
+    
+    try:
+        result = sync_webtoon_chapters(imported_webtoon, max_new_chapters=max_chapters)
     except Exception as e:
-        return {'success': False, 'message': f'Senkronizasyon hatası: {e}'}
+        result = {'success': False, 'message': f'Senkronizasyon hatası: {e}'}
+    finally:
+        release_slot(slot)
+    return _sync_summary(imported_webtoon, result)
+
+def _interleave_by_source(imported_webtoons):
+    """Webtoonları kaynaklarına göre sırayla dağıt; tek bir kaynak kuyruğun başını tıkamasın"""
+    by_source = {}
+    for webtoon_id, url in imported_webtoons:
+        by_source.setdefault(source_key(url), []).append(webtoon_id)
+    queues = list(by_source.values())
+    ordered = []
+    while queues:
+        ordered.extend(queue.pop(0) for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return ordered
 
 @shared_task
 def sync_all_auto_webtoons():
     """
     Otomatik senkronizasyon açık olan tüm webtoonları senkronize et
     
+    MangaDex webtoonlarının bölüm listeleri önce bu süreçte asenkron olarak
+    eşzamanlı çekilir; listesi değişmeyenler için görev başlatılmaz. Kalan
+    her webtoon için ayrı bir `sync_webtoon` görevi başlatılır (chord);
+    sonuçlar `summarize_sync_results` ile birleştirilir.
+    
     Returns:
-        dict: Senkronizasyon sonuçları
+        dict: Başlatılan görev sayısı, değişmeyen webtoon sayısı ve sonuçları
+        toplayacak görevin ID'si
     """
-    auto_sync_webtoons = ImportedWebtoon.objects.filter(auto_sync=True)
-    results = []
+    imported_webtoons = list(ImportedWebtoon.objects.filter(auto_sync=True).values_list('id', 'original_url'))
+    unchanged = find_unchanged_webtoons(imported_webtoons)
+    webtoon_ids = _interleave_by_source(
+        (webtoon_id, url) for webtoon_id, url in imported_webtoons if webtoon_id not in unchanged
+    )
+    if not webtoon_ids:
+        return dict(summarize_sync_results([]), unchanged=len(unchanged))
     
-    for imported_webtoon in auto_sync_webtoons:
-        try:
-            result = sync_webtoon_chapters(imported_webtoon)
-            results.append({
-                'webtoon': imported_webtoon.webtoon.title,
-                'success': result['success'],
-                'message': result['message'],
-            })
-        except Exception as e:
-            results.append({
-                'webtoon': imported_webtoon.webtoon.title,
-                'success': False,
-                'message': f'Hata: {e}',
-            })
+    deadline = time.time() + SYNC_ALL_WINDOW
+    header = group(sync_webtoon.s(webtoon_id, None, deadline) for webtoon_id in webtoon_ids)
+    result = chord(header)(summarize_sync_results.s())
+    logger.info(
+        f"{len(webtoon_ids)} webtoon için senkronizasyon görevi başlatıldı, "
+        f"{len(unchanged)} webtoon'un bölüm listesi değişmemiş"
+    )
+    return {'dispatched': len(webtoon_ids), 'unchanged': len(unchanged), 'summary_task_id': result.id}
+
+@shared_task
+def summarize_sync_results(results):
+    """
+    Toplu senkronizasyon görevlerinin sonuçlarını birleştir
     
-    return {'results': results}
+    Args:
+        results (list): `sync_webtoon` sonuçları
+        
+    Returns:
+        dict: Sonuçlar ve özet sayılar
+    """
+    succeeded = sum(1 for result in results if result.get('success'))
+    skipped = sum(1 for result in results if result.get('skipped'))
+    summary = {
+        'total': len(results),
+        'succeeded': succeeded,
+        'skipped': skipped,
+        'failed': len(results) - succeeded - skipped,
+        'new_chapters': sum(result.get('new_chapters', 0) for result in results),
+        'results': results,
+    }
+    logger.info(
+        f"Toplu senkronizasyon tamamlandı: {summary['succeeded']}/{summary['total']} başarılı, "
+        f"{summary['skipped']} atlandı, {summary['new_chapters']} yeni bölüm"
+    )
+    return summary
 
 @shared_task
 def cleanup_old_logs():
@@ -67,4 +158,17 @@ def cleanup_old_logs():
     cutoff_date = timezone.now() - timedelta(days=30)
     deleted_count, _ = ImportLog.objects.filter(start_time__lt=cutoff_date).delete()
     
-    return deleted_count 
\ No newline at end of file
+    return deleted_count
+
+@shared_task
+def generate_image_derivatives(chapter_id):
+    """
+    Bir bölümün resimleri için okuyucu kopyalarını (WebP/AVIF) üret
+    
+    Args:
+        chapter_id (int): Chapter ID
+        
+    Returns:
+        int: Oluşturulan kopya sayısı
+    """
+    return generate_chapter_derivatives(chapter_id)
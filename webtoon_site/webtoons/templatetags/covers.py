@@ -0,0 +1,15 @@
+from django import template
+
+from webtoons.covers import cover_url as build_cover_url
+
+register = template.Library()
+
+
+@register.filter
+def cover_url(webtoon, size='card'):
+    """
+    Webtoon kapağının küçük resim URL'si
+
+    Kullanım: {{ webtoon|cover_url }} veya {{ webtoon|cover_url:'detail' }}
+    """
+    return build_cover_url(webtoon, size)
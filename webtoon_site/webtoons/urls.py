@@ -18,6 +18,7 @@ urlpatterns = [
     # Webtoon sayfaları
     path('webtoon/<slug:slug>/', views.webtoon_detail, name='webtoon_detail'),
     path('webtoon/<slug:slug>/chapter/<str:number>/', views.chapter_detail, name='chapter_detail'),
+    path('covers/<int:webtoon_id>/<str:size>/', views.webtoon_cover, name='webtoon_cover'),
     
     # Kullanıcı işlemleri
     path('accounts/profile/', views.user_profile, name='user_profile'),
@@ -32,6 +33,7 @@ urlpatterns = [
     
     # Arama
     path('search/', views.search, name='search'),
+    path('api/autocomplete/', views.autocomplete, name='autocomplete'),
     
     # Admin işlemleri
     path('yonetim/', views.admin_dashboard, name='admin_dashboard'),
@@ -1,7 +1,7 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.http import JsonResponse, Http404
-from django.db.models import Avg, Count, F, Q
+from django.http import FileResponse, HttpResponseNotModified, JsonResponse, Http404
+from django.db.models import F
 from django.utils import timezone
 from django.utils.text import slugify
 from django.contrib import messages
@@ -18,6 +18,14 @@ from .models import (
 from .forms import WebtoonForm, ChapterForm, ChapterImageFormSet, ImportWebtoonForm
 from .services import import_webtoon_from_source, sync_webtoon_chapters
 from .tasks import sync_webtoon, sync_all_auto_webtoons
+from .buffers import record_view, record_unique_view, pending_views, record_reading, reading_history
+from .reader import get_reader_payload
+from .search import search_webtoons
+from .autocomplete import suggest
+from .home import get_home_sections
+from .caching import get_category, get_category_list, get_webtoon_detail
+from .pagination import WEBTOON_ORDERINGS, DEFAULT_WEBTOON_ORDERING, paginate_webtoons
+from . import covers
 import logging
 import socket
 import datetime
@@ -27,19 +35,13 @@ from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 import json
 from django.core.files.base import ContentFile
-import requests
+from scrapers import http_client
+from scrapers.profiles import get_profile
 
 def home(request):
     """Ana sayfa görünümü"""
-    latest_webtoons = Webtoon.objects.filter(published=True).order_by('-created_date')[:12]
-    popular_webtoons = Webtoon.objects.filter(published=True).order_by('-views')[:12]
-    categories = Category.objects.all()
-    
-    context = {
-        'latest_webtoons': latest_webtoons,
-        'popular_webtoons': popular_webtoons,
-        'categories': categories,
-    }
+    # Bölümler önbellekten gelir, bkz. webtoons.home
+    context = get_home_sections()
     return render(request, 'webtoons/home.html', context)
 
 def browse(request):
@@ -49,7 +51,9 @@ def browse(request):
     # Filtreleme
     category = request.GET.get('category')
     status = request.GET.get('status')
-    sort = request.GET.get('sort', '-created_date')
+    sort = request.GET.get('sort', DEFAULT_WEBTOON_ORDERING)
+    if sort not in WEBTOON_ORDERINGS:
+        sort = DEFAULT_WEBTOON_ORDERING
     
     if category:
         webtoons = webtoons.filter(categories__slug=category)
@@ -57,15 +61,10 @@ def browse(request):
     if status:
         webtoons = webtoons.filter(status=status)
     
-    # Sıralama
-    webtoons = webtoons.order_by(sort)
-    
-    # Sayfalama
-    paginator = Paginator(webtoons, 24)  # Her sayfada 24 webtoon
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    # Sıralama ve cursor sayfalama
+    page_obj = paginate_webtoons(request, webtoons, ordering=sort)
     
-    categories = Category.objects.all()
+    categories = get_category_list()
     
     context = {
         'page_obj': page_obj,
@@ -78,12 +77,10 @@ def browse(request):
 
 def latest(request):
     """En son eklenen webtoonlar"""
-    webtoons = Webtoon.objects.filter(published=True).order_by('-created_date')
+    webtoons = Webtoon.objects.filter(published=True)
     
     # Sayfalama
-    paginator = Paginator(webtoons, 24)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate_webtoons(request, webtoons, ordering='-created_date')
     
     context = {
         'page_obj': page_obj,
@@ -93,12 +90,12 @@ def latest(request):
 
 def popular(request):
     """En popüler webtoonlar"""
-    webtoons = Webtoon.objects.filter(published=True).order_by('-views')
+    # ?sort=rating ile en yüksek puanlılar listelenir
+    order = '-rating_avg' if request.GET.get('sort') == 'rating' else '-views'
+    webtoons = Webtoon.objects.filter(published=True)
     
     # Sayfalama
-    paginator = Paginator(webtoons, 24)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate_webtoons(request, webtoons, ordering=order)
     
     context = {
         'page_obj': page_obj,
@@ -108,7 +105,7 @@ def popular(request):
 
 def category_list(request):
     """Tüm kategorileri listele"""
-    categories = Category.objects.annotate(webtoon_count=Count('webtoons'))
+    categories = get_category_list()
     
     context = {
         'categories': categories,
@@ -117,13 +114,13 @@ def category_list(request):
 
 def category_detail(request, slug):
     """Belirli bir kategorideki webtoonları görüntüle"""
-    category = get_object_or_404(Category, slug=slug)
-    webtoons = category.webtoons.filter(published=True)
+    category = get_category(slug)
+    if category is None:
+        raise Http404("Kategori bulunamadı")
+    webtoons = Webtoon.objects.filter(categories=category, published=True)
     
     # Sayfalama
-    paginator = Paginator(webtoons, 24)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate_webtoons(request, webtoons)
     
     context = {
         'category': category,
@@ -133,15 +130,20 @@ def category_detail(request, slug):
 
 def webtoon_detail(request, slug):
     """Webtoon detay sayfası"""
-    webtoon = get_object_or_404(Webtoon, slug=slug, published=True)
-    chapters = webtoon.chapters.filter(published=True).order_by('number')
+    # Kullanıcıdan bağımsız kısım (webtoon, kategoriler, bölümler) önbellekten gelir
+    detail = get_webtoon_detail(slug)
+    if detail is None:
+        raise Http404("Webtoon bulunamadı")
+    webtoon = detail['webtoon']
+    chapters = detail['chapters']
     
-    # Görüntülenme sayısını artır
-    webtoon.views += 1
-    webtoon.save()
+    # Benzersiz ziyaretçiyi kaydet (tamponda biriktirilip toplu yazılır,
+    # görüntülenme sayısı bu kayıtlardan türetilir)
+    record_unique_view(webtoon, user=request.user, ip_address=get_client_ip(request))
+    webtoon.views += pending_views(Webtoon, webtoon.pk)
     
-    # Ortalama puanı hesapla
-    avg_rating = webtoon.ratings.aggregate(Avg('score'))['score__avg'] or 0
+    # Ortalama puan webtoon üzerinde önceden hesaplanmış olarak tutulur
+    avg_rating = webtoon.rating_avg
     
     # Kullanıcının yer işareti ve puanlaması
     user_bookmark = None
@@ -154,7 +156,7 @@ def webtoon_detail(request, slug):
             pass
     
     # Yorumlar
-    comments = webtoon.comments.filter(chapter__isnull=True).order_by('-created_date')[:20]
+    comments = webtoon.comments.filter(chapter__isnull=True).select_related('user').order_by('-created_date')[:20]
     
     context = {
         'webtoon': webtoon,
@@ -170,40 +172,42 @@ def webtoon_detail(request, slug):
 def get_client_ip(request):
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
+        ip = x_forwarded_for.split(',')[0].strip()
     else:
         ip = request.META.get('REMOTE_ADDR')
     return ip
 
 def chapter_detail(request, slug, number):
     """Bölüm okuma sayfası"""
-    webtoon = get_object_or_404(Webtoon, slug=slug, published=True)
-    chapter = get_object_or_404(Chapter, webtoon=webtoon, number=float(number), published=True)
-    
-    # Önceki ve sonraki bölümleri bul
-    prev_chapter = Chapter.objects.filter(
-        webtoon=webtoon, number__lt=float(number), published=True
-    ).order_by('-number').first()
-    
-    next_chapter = Chapter.objects.filter(
-        webtoon=webtoon, number__gt=float(number), published=True
-    ).order_by('number').first()
-    
-    # Okuma geçmişine ekle
+    try:
+        chapter_number = float(number)
+    except ValueError:
+        raise Http404("Bölüm bulunamadı")
+    if not chapter_number.is_integer():
+        raise Http404("Bölüm bulunamadı")
+    
+    # Webtoon, bölüm, resimler ve önceki/sonraki bölüm bilgisi tek önbellek kaydında
+    payload = get_reader_payload(slug, int(chapter_number))
+    if payload is None:
+        raise Http404("Bölüm bulunamadı")
+    chapter_id = payload['chapter']['id']
+    
+    # Bölüm görüntülenme sayısını artır
+    record_view(Chapter, chapter_id)
+    
+    # Okuma geçmişine ekle (tamponda birleştirilip toplu yazılır)
     if request.user.is_authenticated:
-        ReadingHistory.objects.update_or_create(
-            user=request.user,
-            chapter=chapter,
-        )
+        record_reading(request.user, chapter_id)
     
     # Bölüm yorumları
-    comments = chapter.comments.order_by('-created_date')[:20]
+    comments = Comment.objects.filter(chapter_id=chapter_id).select_related('user').order_by('-created_date')[:20]
     
     context = {
-        'webtoon': webtoon,
-        'chapter': chapter,
-        'prev_chapter': prev_chapter,
-        'next_chapter': next_chapter,
+        'webtoon': payload['webtoon'],
+        'chapter': payload['chapter'],
+        'images': payload['images'],
+        'prev_chapter': payload['prev_chapter'],
+        'next_chapter': payload['next_chapter'],
         'comments': comments,
     }
     return render(request, 'webtoons/chapter_detail.html', context)
@@ -226,6 +230,8 @@ def user_bookmarks(request):
 @login_required
 def user_history(request):
     """Kullanıcının okuma geçmişi"""
+    # Son okumaların da listede görünmesi için bekleyen kayıtları yaz
+    reading_history.flush()
     history = ReadingHistory.objects.filter(user=request.user).order_by('-last_read')
     
     context = {
@@ -264,7 +270,9 @@ def rate_webtoon(request, webtoon_id):
         defaults={'score': score}
     )
     
-    avg_rating = webtoon.ratings.aggregate(Avg('score'))['score__avg'] or 0
+    # Özet alanları sinyallerle güncellendi, yalnızca ortalamayı yeniden oku
+    webtoon.refresh_from_db(fields=['rating_avg'])
+    avg_rating = webtoon.rating_avg
     
     return JsonResponse({
         'score': score,
@@ -304,39 +312,90 @@ def add_comment(request):
 def search(request):
     """Arama fonksiyonu"""
     query = request.GET.get('q', '').strip()
-    
-    if query:
-        # Daha güçlü arama
-        webtoons = Webtoon.objects.filter(
-            Q(title__icontains=query) | 
-            Q(author__icontains=query) |
-            Q(artist__icontains=query) |
-            Q(description__icontains=query) |
-            Q(slug__icontains=query) |
-            Q(categories__name__icontains=query) |
-            Q(categories__slug__icontains=query)
-        ).filter(published=True).distinct()
-        
-        # Debug için arama sonuçlarını loglayalım
-        print(f"Arama sorgusu: '{query}' - {webtoons.count()} sonuç")
-        for w in webtoons:
-            print(f"- {w.title} (ID: {w.id}, Slug: {w.slug})")
-    else:
-        webtoons = Webtoon.objects.none()
-    
-    # Sayfalama
-    paginator = Paginator(webtoons, 24)
+
+    # Tam metin indeksinden ilgi sırasına göre sıralı ID listesi
+    result_ids = search_webtoons(query) if query else []
+
+    # Sayfalama ID listesi üzerinde yapılır, yalnızca görünen sayfa yüklenir
+    paginator = Paginator(result_ids, 24)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
-    
+
+    webtoons_by_id = Webtoon.objects.in_bulk(list(page_obj.object_list))
+    page_obj.object_list = [webtoons_by_id[pk] for pk in page_obj.object_list if pk in webtoons_by_id]
+
     context = {
         'query': query,
         'page_obj': page_obj,
         'webtoons': page_obj,  # Template'de webtoons değişkeni kullanılıyor
-        'result_count': webtoons.count(),
+        'result_count': paginator.count,
     }
     return render(request, 'webtoons/search_results.html', context)
 
+def autocomplete(request):
+    """Arama kutusu için otomatik tamamlama önerileri (JSON)"""
+    query = request.GET.get('q', '')
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 20)
+    except ValueError:
+        limit = 10
+
+    return JsonResponse({
+        'query': query,
+        'results': suggest(query, limit=limit),
+    })
+
+def _cover_file(path, build):
+    """Kapak dosyasını aç; başka bir süreç dosyayı önbellekten sildiyse yeniden üret"""
+    try:
+        return open(path, 'rb')
+    except FileNotFoundError:
+        if build is None:
+            return None
+        return open(build(), 'rb')
+
+def webtoon_cover(request, webtoon_id, size):
+    """Webtoon kapağının sabit boyutlu küçük resmi (diskte önbelleklenir)"""
+    if size not in covers.COVER_SIZES:
+        raise Http404("Geçersiz kapak boyutu")
+    version = request.GET.get('v', '')
+    etag = f'"{size}-{version}"'
+    
+    # Sürüm URL'de geldiyse ve dosya genel önbellekteyse veritabanına gidilmez;
+    # yayınlanmamış webtoonların kapakları bu dizine hiç yazılmaz
+    path = covers.cached_cover(covers.cache_path(webtoon_id, size, version)) if version.isalnum() else None
+    if path is not None:
+        if request.headers.get('If-None-Match') == etag:
+            return HttpResponseNotModified()
+        handle = _cover_file(path, None)
+        if handle is not None:
+            response = FileResponse(handle, content_type=covers.cover_format()[1])
+            response['Cache-Control'] = 'public, max-age=31536000, immutable'
+            response['ETag'] = etag
+            return response
+    
+    # Yayınlanmamış webtoonların kapakları yalnızca yöneticilere (yönetim listesi) gösterilir
+    webtoons = Webtoon.objects.all() if request.user.is_staff else Webtoon.objects.filter(published=True)
+    webtoon = webtoons.filter(pk=webtoon_id).only('id', 'title', 'thumbnail', 'updated_date', 'published').first()
+    if webtoon is None:
+        raise Http404("Webtoon bulunamadı")
+    current = covers.cover_version(webtoon.thumbnail.name if webtoon.thumbnail else '', webtoon.updated_date)
+    if current == version and webtoon.published and request.headers.get('If-None-Match') == etag:
+        return HttpResponseNotModified()
+    current_path = covers.cache_path(webtoon_id, size, current, public=webtoon.published)
+    build = lambda: covers.build_cover(webtoon, size, current_path)
+    handle = _cover_file(covers.cached_cover(current_path) or build(), build)
+    response = FileResponse(handle, content_type=covers.cover_format()[1])
+    if not webtoon.published:
+        response['Cache-Control'] = 'private, max-age=300'
+    elif current != version:
+        # Eski veya eksik sürümle istenen kapak uzun süre önbelleğe alınmaz
+        response['Cache-Control'] = 'public, max-age=300'
+    else:
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        response['ETag'] = etag
+    return response
+
 # Admin kontrol paneli
 
 def is_admin(user):
@@ -366,10 +425,12 @@ def admin_dashboard(request):
 @user_passes_test(is_admin)
 def admin_webtoon_list(request):
     """Webtoon listesi yönetimi"""
-    webtoons = Webtoon.objects.all().order_by('-created_date')
+    webtoons = Webtoon.objects.all()
+    page_obj = paginate_webtoons(request, webtoons, per_page=50)
     
     context = {
-        'webtoons': webtoons,
+        'webtoons': page_obj,
+        'page_obj': page_obj,
     }
     return render(request, 'webtoons/admin/webtoon_list.html', context)
 
@@ -868,16 +929,13 @@ def check_source(request):
     if not url:
         return JsonResponse({'error': 'URL belirtilmedi'})
     
-    # URL'nin hangi siteye ait olduğunu belirle
-    is_mangadex = "mangadex.org" in url.lower()
-    is_mangazure = "mangazure.net" in url.lower()
-    
-    source_type = "MangaDex" if is_mangadex else "MangaZure" if is_mangazure else "Bilinmeyen Kaynak"
+    # URL'nin hangi siteye ait olduğunu site profillerinden belirle
+    profile = get_profile(url)
     
     return JsonResponse({
-        'source_type': source_type,
-        'valid': is_mangadex or is_mangazure,
-        'message': f"Bu URL {source_type} sitesine ait görünüyor." if is_mangadex or is_mangazure else "Bu URL desteklenen bir kaynak sitesine ait değil."
+        'source_type': profile.name if profile is not None else "Bilinmeyen Kaynak",
+        'valid': profile is not None,
+        'message': f"Bu URL {profile.name} sitesine ait görünüyor." if profile is not None else "Bu URL desteklenen bir kaynak sitesine ait değil."
     })
 
 @user_passes_test(is_admin)
@@ -971,15 +1029,18 @@ def api_import_chapter(request):
         category, _ = Category.objects.get_or_create(slug=cat_slug, defaults={'name': cat_name})
         webtoon.categories.add(category)
     # Thumbnail indir ve ekle (ilk eklemede)
+    update_fields = ['updated_date']
     if created and webtoon_data.get('thumbnail_url'):
         try:
-            resp = requests.get(webtoon_data['thumbnail_url'])
+            resp = http_client.get(webtoon_data['thumbnail_url'])
             if resp.status_code == 200:
                 ext = webtoon_data['thumbnail_url'].split('.')[-1][:4]
-                webtoon.thumbnail.save(f"{slug}_thumb.{ext}", ContentFile(resp.content), save=True)
+                webtoon.thumbnail.save(f"{slug}_thumb.{ext}", ContentFile(resp.content), save=False)
+                update_fields.append('thumbnail')
         except Exception:
             pass
-    webtoon.save()
+    # Yalnızca değişen alanlar yazılır; görüntülenme ve puan sayaçlarının üzerine yazılmaz
+    webtoon.save(update_fields=update_fields)
 
     # Chapter oluştur
     chapter_number = chapter_data.get('number')
@@ -997,7 +1058,7 @@ def api_import_chapter(request):
     added_images = 0
     for idx, img_url in enumerate(images):
         try:
-            resp = requests.get(img_url)
+            resp = http_client.get(img_url)
             if resp.status_code == 200:
                 ext = img_url.split('.')[-1][:4]
                 img_name = f"{slug}_ch{chapter_number}_img{idx+1}.{ext}"